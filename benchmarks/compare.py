@@ -0,0 +1,74 @@
+"""Compare two pytest-benchmark JSON files and flag regressions.
+
+Usage:
+    python benchmarks/compare.py BASELINE.json CURRENT.json [--threshold 10] [--stat median]
+
+Exits with status 1 when any benchmark present in both files got slower by
+more than ``threshold`` percent.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+STATS = ("min", "max", "mean", "median")
+
+
+def load_stats(path: str, stat: str) -> Dict[str, float]:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    results: Dict[str, float] = {}
+    for bench in data.get("benchmarks", []):
+        name = bench.get("fullname") or bench.get("name")
+        value = bench.get("stats", {}).get(stat)
+        if name and isinstance(value, (int, float)):
+            results[name] = float(value)
+    return results
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float],
+            threshold: float) -> Tuple[List[tuple], List[str], List[str]]:
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        old, new = baseline[name], current[name]
+        change = (new - old) / old * 100 if old else 0.0
+        rows.append((name, old, new, change, change > threshold))
+    missing = sorted(set(baseline) - set(current))
+    added = sorted(set(current) - set(baseline))
+    return rows, missing, added
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Allowed slowdown in percent (default: 10).")
+    parser.add_argument("--stat", choices=STATS, default="median")
+    args = parser.parse_args(argv)
+
+    rows, missing, added = compare(load_stats(args.baseline, args.stat),
+                                   load_stats(args.current, args.stat),
+                                   args.threshold)
+
+    width = max([len(row[0]) for row in rows] + [9])
+    print(f"{'benchmark'.ljust(width)}  {'baseline':>12}  {'current':>12}  {'change':>8}")
+    for name, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name.ljust(width)}  {old:12.6f}  {new:12.6f}  {change:+7.1f}%{flag}")
+    for name in missing:
+        print(f"missing from current: {name}")
+    for name in added:
+        print(f"new benchmark: {name}")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
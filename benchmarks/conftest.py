@@ -0,0 +1,65 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (SRC_DIR, BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from graphs import FAMILIES, build_graph, make_spec
+
+ALL_SIZES = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+# Sizes above this are skipped unless explicitly requested; 10**6 nodes takes
+# minutes to generate in pure Python.
+MAX_NODES = int(os.getenv("DIJKSTRA_BENCH_MAX_NODES", "10000"))
+SIZES = [size for size in ALL_SIZES if size <= MAX_NODES] or ALL_SIZES[:1]
+
+_SPEC_CACHE = {}
+_GRAPH_CACHE = {}
+
+
+def graph_spec(family, size):
+    key = (family, size)
+    if key not in _SPEC_CACHE:
+        _SPEC_CACHE[key] = make_spec(family, size)
+    return _SPEC_CACHE[key]
+
+
+def cached_graph(family, size):
+    # Benchmarks must treat these graphs as read-only.
+    key = (family, size)
+    if key not in _GRAPH_CACHE:
+        _GRAPH_CACHE[key] = build_graph(graph_spec(family, size))
+    return _GRAPH_CACHE[key]
+
+
+def pytest_generate_tests(metafunc):
+    if "family" in metafunc.fixturenames:
+        metafunc.parametrize("family", list(FAMILIES))
+    if "size" in metafunc.fixturenames:
+        cap = None
+        marker = metafunc.definition.get_closest_marker("max_nodes")
+        if marker is not None:
+            cap = marker.args[0]
+        sizes = [size for size in SIZES if cap is None or size <= cap] or SIZES[:1]
+        metafunc.parametrize("size", sizes, ids=[f"n{size}" for size in sizes])
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "max_nodes(n): skip sizes above n for algorithms that are superlinear"
+    )
+
+
+@pytest.fixture
+def spec(family, size):
+    return graph_spec(family, size)
+
+
+@pytest.fixture
+def graph(family, size):
+    return cached_graph(family, size)
@@ -0,0 +1,67 @@
+"""Synthetic graph families used by the benchmark suite.
+
+Graphs come from ``dijkstra_dashboard.core.generators``. ``GraphSpec`` keeps
+plain node/edge lists so that ``Graph`` construction itself can be timed
+separately from generation.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from dijkstra_dashboard.core import generators
+
+
+@dataclass(frozen=True)
+class GraphSpec:
+    family: str
+    directed: bool
+    nodes: List[Tuple[str, float, float]]
+    edges: List[Tuple[str, str, float]]
+
+
+def _side(size: int) -> int:
+    return max(2, math.isqrt(size - 1) + 1)
+
+
+FAMILIES: Dict[str, Callable[[int, int], object]] = {
+    "grid": lambda size, seed: generators.grid_graph(
+        _side(size), _side(size), weight_range=(1, 10), seed=seed, frozen=True),
+    "random_geometric": lambda size, seed: generators.random_geometric_graph(
+        size, seed=seed, frozen=True),
+    "scale_free": lambda size, seed: generators.barabasi_albert_graph(
+        size, 2, seed=seed, frozen=True),
+    "road_like": lambda size, seed: generators.road_network(
+        _side(size), _side(size), seed=seed, frozen=True),
+}
+
+
+def make_spec(family: str, size: int, seed: int = 0) -> GraphSpec:
+    snapshot = FAMILIES[family](size, seed)
+    return GraphSpec(
+        family=family,
+        directed=snapshot.directed,
+        nodes=[(node.id, node.x, node.y) for node in snapshot.nodes()],
+        edges=snapshot.get_edges(),
+    )
+
+
+def build_graph(spec: GraphSpec):
+    from dijkstra_dashboard.core.graph import Graph
+
+    graph = Graph(directed=spec.directed, metadata={"family": spec.family})
+    for node_id, x, y in spec.nodes:
+        graph.add_node(node_id=node_id, x=x, y=y)
+    for start, end, weight in spec.edges:
+        graph.add_edge(start, end, weight)
+    return graph
+
+
+def build_graph_bulk(spec: GraphSpec):
+    from dijkstra_dashboard.core.graph import Graph
+
+    graph = Graph(directed=spec.directed, metadata={"family": spec.family})
+    graph.add_nodes_from((node_id, None, x, y) for node_id, x, y in spec.nodes)
+    graph.add_edges_from(spec.edges)
+    return graph
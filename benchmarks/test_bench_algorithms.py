@@ -0,0 +1,37 @@
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.algorithms.runner import apply_steps
+
+
+def _endpoints(graph):
+    nodes = graph.get_nodes()
+    return nodes[0], nodes[-1]
+
+
+def test_dijkstra_solve(benchmark, graph):
+    start, target = _endpoints(graph)
+    result = benchmark(DijkstraAlgorithm().solve, graph, {"start": start, "target": target})
+    assert result.distance is not None
+
+
+def test_dijkstra_solve_all_targets(benchmark, graph):
+    start, _ = _endpoints(graph)
+    result = benchmark(DijkstraAlgorithm().solve, graph, {"start": start})
+    assert result.distances[start] == 0.0
+
+
+def test_dijkstra_iter_steps(benchmark, graph):
+    start, target = _endpoints(graph)
+    algorithm = DijkstraAlgorithm()
+
+    def run():
+        return sum(1 for _ in algorithm.iter_steps(graph, {"start": start, "target": target}))
+
+    assert benchmark(run) > 0
+
+
+def test_apply_steps(benchmark, graph):
+    start, target = _endpoints(graph)
+    steps = list(DijkstraAlgorithm().iter_steps(graph, {"start": start, "target": target}))
+    nodes = graph.get_nodes()
+    state = benchmark(apply_steps, steps, nodes)
+    assert state.visited[0] == start
@@ -0,0 +1,37 @@
+
+from graphs import build_graph, build_graph_bulk
+
+from dijkstra_dashboard.core.serialization import dict_to_graph, graph_to_dict
+from dijkstra_dashboard.core.validation import validate_graph_data
+
+
+def test_graph_construction(benchmark, spec):
+    graph = benchmark(build_graph, spec)
+    assert graph.get_stats().node_count == len(spec.nodes)
+
+
+def test_graph_bulk_construction(benchmark, spec):
+    graph = benchmark(build_graph_bulk, spec)
+    assert graph.get_stats().node_count == len(spec.nodes)
+
+
+def test_to_adjacency_dict(benchmark, graph):
+    adjacency = benchmark(graph.to_adjacency_dict)
+    assert len(adjacency) == graph.get_stats().node_count
+
+
+def test_graph_to_dict(benchmark, graph):
+    data = benchmark(graph_to_dict, graph)
+    assert len(data["edges"]) == graph.get_stats().edge_count
+
+
+def test_dict_to_graph(benchmark, graph):
+    data = graph_to_dict(graph)
+    restored = benchmark(dict_to_graph, data)
+    assert restored.get_stats() == graph.get_stats()
+
+
+def test_validate_graph_data(benchmark, graph):
+    data = graph_to_dict(graph)
+    issues = benchmark(validate_graph_data, data)
+    assert not [issue for issue in issues if issue.severity == "error"]
@@ -0,0 +1,72 @@
+import pytest
+
+from dijkstra_dashboard.core.layouts import (barnes_hut_layout, circle_layout, grid_layout,
+                                             multilevel_layout, spring_layout)
+
+
+def test_circle_layout(benchmark, graph):
+    positions = benchmark(circle_layout, graph.get_nodes())
+    assert len(positions) == graph.get_stats().node_count
+
+
+def test_grid_layout(benchmark, graph):
+    positions = benchmark(grid_layout, graph.get_nodes())
+    assert len(positions) == graph.get_stats().node_count
+
+
+@pytest.mark.max_nodes(10 ** 3)
+def test_spring_layout(benchmark, graph):
+    # Exact Fruchterman-Reingold is O(n^2) per iteration; by default larger
+    # graphs go to the NumPy and Barnes-Hut engines, benchmarked below.
+    nodes = graph.get_nodes()
+    edges = [(start, end) for start, end, _ in graph.get_edges()]
+    positions = benchmark.pedantic(spring_layout, args=(nodes, edges),
+                                   kwargs={"iterations": 10, "seed": 0, "method": "exact"},
+                                   rounds=3, iterations=1)
+    assert len(positions) == len(nodes)
+
+
+@pytest.mark.max_nodes(10 ** 4)
+def test_barnes_hut_layout(benchmark, graph):
+    nodes = graph.get_nodes()
+    edges = [(start, end) for start, end, _ in graph.get_edges()]
+    positions = benchmark.pedantic(barnes_hut_layout, args=(nodes, edges),
+                                   kwargs={"iterations": 10, "seed": 0},
+                                   rounds=3, iterations=1)
+    assert len(positions) == len(nodes)
+
+
+@pytest.mark.max_nodes(10 ** 5)
+def test_multilevel_layout(benchmark, graph):
+    nodes = graph.get_nodes()
+    edges = [(start, end) for start, end, _ in graph.get_edges()]
+    positions = benchmark.pedantic(multilevel_layout, args=(nodes, edges),
+                                   kwargs={"iterations": 10, "seed": 0},
+                                   rounds=3, iterations=1)
+    assert len(positions) == len(nodes)
+
+
+@pytest.mark.max_nodes(10 ** 4)
+def test_vectorized_spring_layout(benchmark, graph):
+    pytest.importorskip("numpy")
+    from dijkstra_dashboard.core.layouts import vectorized_spring_layout
+
+    nodes = graph.get_nodes()
+    edges = [(start, end) for start, end, _ in graph.get_edges()]
+    positions = benchmark.pedantic(vectorized_spring_layout, args=(nodes, edges),
+                                   kwargs={"iterations": 10, "seed": 0},
+                                   rounds=3, iterations=1)
+    assert len(positions) == len(nodes)
+
+
+@pytest.mark.max_nodes(10 ** 5)
+def test_pivot_mds_layout(benchmark, graph):
+    pytest.importorskip("numpy")
+    from dijkstra_dashboard.core.layouts import pivot_mds_layout
+
+    nodes = graph.get_nodes()
+    edges = [(start, end) for start, end, _ in graph.get_edges()]
+    positions = benchmark.pedantic(pivot_mds_layout, args=(nodes, edges),
+                                   kwargs={"stress_iterations": 10, "seed": 0},
+                                   rounds=3, iterations=1)
+    assert len(positions) == len(nodes)
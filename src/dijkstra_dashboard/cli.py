@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Tuple
+
+from dijkstra_dashboard.config import resolve_config
+from dijkstra_dashboard.core.algorithms.registry import get_algorithm, select_algorithm
+from dijkstra_dashboard.core.errors import GraphError
+from dijkstra_dashboard.core.query import run_query
+from dijkstra_dashboard.core.serialization import load_snapshot_file
+
+OUTPUT_FORMATS = ("table", "csv", "ndjson")
+STEP_MODES = ("delta", "snapshot")
+COLUMNS = ("query", "start", "target", "distance", "path", "error")
+TABLE_WIDTHS = (8, 12, 12, 12, 40, 0)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, float) and value == float("inf"):
+        return None
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def parse_query_line(line: str) -> Dict[str, Any] | None:
+    """Parse one query: a JSON object, or ``start target`` separated by whitespace/comma."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        query = json.loads(line)
+        query.setdefault("kind", "route")
+        return query
+    parts = line.replace(",", " ").split()
+    if len(parts) != 2:
+        raise ValueError(f"Expected 'start target', got: {line!r}")
+    return {"kind": "route", "start": parts[0], "target": parts[1]}
+
+
+def iter_queries(handle: IO[str]) -> Iterator[Tuple[int, Dict[str, Any] | Exception]]:
+    index = 0
+    for line in handle:
+        try:
+            query = parse_query_line(line)
+        except ValueError as exc:
+            yield index, exc
+            index += 1
+            continue
+        if query is None:
+            continue
+        yield index, query
+        index += 1
+
+
+def _rows(index: int, query: Dict[str, Any] | None,
+          result: Dict[str, Any] | None, error: str | None) -> Iterable[Tuple]:
+    if error is not None:
+        query = query or {}
+        yield (index, query.get("start", ""), query.get("target", ""), "", "", error)
+        return
+
+    kind = query["kind"]
+    if kind == "route":
+        yield (index, result["start"], result["target"], result["distance"],
+               " -> ".join(result["path"]), "")
+    elif kind == "isochrone":
+        for node, distance in result["nodes"].items():
+            yield (index, result["start"], node, distance, "", "")
+    elif kind == "matrix":
+        for source, row in zip(result["sources"], result["distances"]):
+            for target, distance in zip(result["targets"], row):
+                yield (index, source, target, distance, "", "")
+
+
+class ResultWriter:
+    """Writes query results incrementally in table, CSV or NDJSON form."""
+
+    def __init__(self, handle: IO[str], output_format: str):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self._handle = handle
+        self._format = output_format
+        self._csv = csv.writer(handle) if output_format == "csv" else None
+        self._started = False
+
+    def _header(self) -> None:
+        self._started = True
+        if self._csv is not None:
+            self._csv.writerow(COLUMNS)
+        elif self._format == "table":
+            self._write_table_row(COLUMNS)
+            self._handle.write("-" * (sum(TABLE_WIDTHS) + len(TABLE_WIDTHS) * 2) + "\n")
+
+    def _write_table_row(self, row: Tuple) -> None:
+        cells = []
+        for value, width in zip(row, TABLE_WIDTHS):
+            text = "" if value is None else str(value)
+            cells.append(text.ljust(width) if width else text)
+        self._handle.write("  ".join(cells).rstrip() + "\n")
+
+    def write(self, index: int, query: Dict[str, Any] | None,
+              result: Dict[str, Any] | None, error: str | None = None) -> None:
+        if not self._started:
+            self._header()
+
+        if self._format == "ndjson":
+            record: Dict[str, Any] = {"query": index}
+            if query is not None:
+                record["kind"] = query.get("kind")
+            if error is not None:
+                record["error"] = error
+            else:
+                record.update(result)
+            self._handle.write(json.dumps(_jsonable(record), separators=(",", ":")) + "\n")
+            return
+
+        for row in _rows(index, query, result, error):
+            row = tuple("" if value is None else value for value in row)
+            if self._csv is not None:
+                self._csv.writerow(row)
+            else:
+                self._write_table_row(row)
+
+
+def write_steps(handle: IO[str], index: int, graph, query: Dict[str, Any],
+                mode: str) -> None:
+    if query.get("kind") != "route":
+        return
+    params = {"start": query.get("start"), "target": query.get("target")}
+    algorithm = get_algorithm(select_algorithm(graph))()
+    for step in algorithm.iter_steps(graph, params, mode=mode):
+        record = {"query": index}
+        record.update(step)
+        handle.write(json.dumps(_jsonable(record), separators=(",", ":")) + "\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dijkstra-cli",
+        description="Run batches of shortest-path queries against a graph file.",
+    )
+    parser.add_argument("graph", help="Path to a graph JSON file.")
+    parser.add_argument("-q", "--queries", default="-",
+                        help="Query file, one query per line ('-' for stdin).")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default=None,
+                        help="Output format (default: config output_format).")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Output file ('-' for stdout).")
+    parser.add_argument("--steps", metavar="FILE", default=None,
+                        help="Also write NDJSON step traces for route queries to FILE.")
+    parser.add_argument("--steps-mode", choices=STEP_MODES, default=None,
+                        help="Step trace mode (default: config steps_mode).")
+    parser.add_argument("--config", default=None, help="Config file path.")
+    return parser
+
+
+def _open(path: str, mode: str, default: IO[str]) -> IO[str]:
+    if path == "-":
+        return default
+    return open(path, mode, encoding="utf-8", newline="" if "w" in mode else None)
+
+
+def run(args: argparse.Namespace, stdin: IO[str], stdout: IO[str]) -> int:
+    overrides: Dict[str, Any] = {}
+    if args.format:
+        overrides["output_format"] = args.format
+    if args.steps_mode:
+        overrides["steps_mode"] = args.steps_mode
+    config = resolve_config(overrides, path=Path(args.config) if args.config else None)
+    if config["output_format"] not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {config['output_format']}")
+    if config["steps_mode"] not in STEP_MODES:
+        raise ValueError(f"Unsupported steps mode: {config['steps_mode']}")
+
+    graph = load_snapshot_file(args.graph)
+
+    handles: List[IO[str]] = []
+    queries = _open(args.queries, "r", stdin)
+    output = _open(args.output, "w", stdout)
+    steps = _open(args.steps, "w", stdout) if args.steps else None
+    handles.extend(h for h in (queries, output, steps) if h not in (None, stdin, stdout))
+
+    failures = 0
+    try:
+        writer = ResultWriter(output, config["output_format"])
+        for index, query in iter_queries(queries):
+            if isinstance(query, Exception):
+                writer.write(index, None, None, str(query))
+                failures += 1
+                continue
+            try:
+                result = run_query(graph, query["kind"], query)
+                if steps is not None:
+                    write_steps(steps, index, graph, query, config["steps_mode"])
+            except (GraphError, ValueError, TypeError) as exc:
+                writer.write(index, query, None, str(exc))
+                failures += 1
+                continue
+            writer.write(index, query, result)
+    finally:
+        for handle in handles:
+            handle.close()
+
+    return 1 if failures else 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return run(args, sys.stdin, sys.stdout)
+    except (GraphError, OSError, ValueError) as exc:
+        print(f"dijkstra-cli: {exc}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
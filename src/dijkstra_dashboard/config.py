@@ -13,6 +13,7 @@ _DEFAULT_CONFIG: Dict[str, Any] = {
     "steps_mode": "delta",
     "animation_speed": 1.0,
     "directed_default": False,
+    "trace": "",
 }
 
 
@@ -74,6 +75,10 @@ def env_config() -> Dict[str, Any]:
     if directed_default:
         data["directed_default"] = _parse_bool(directed_default)
 
+    trace = os.getenv(f"{ENV_PREFIX}TRACE")
+    if trace:
+        data["trace"] = trace
+
     return data
 
 
@@ -100,6 +105,9 @@ def validate_config(config: Dict[str, Any]) -> None:
     if not isinstance(directed_default, bool):
         raise ValueError("Config directed_default must be a bool.")
 
+    if not isinstance(config.get("trace", ""), str):
+        raise ValueError("Config trace must be a string.")
+
 
 def load_config(path: Path | None = None) -> Dict[str, Any]:
     config_path = path or get_config_path()
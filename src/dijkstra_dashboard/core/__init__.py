@@ -1,22 +1,46 @@
-from .errors import AlgorithmError, GraphError, ValidationError
-from .graph import Graph
-from .schema import GRAPH_SCHEMA_VERSION, edge_id, new_graph_dict
-from .types import Edge, GraphIssue, GraphStats, Node
-from .validation import assert_valid, validate_graph, validate_graph_data
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "AlgorithmError",
-    "GraphError",
-    "ValidationError",
-    "Graph",
-    "GRAPH_SCHEMA_VERSION",
-    "edge_id",
-    "new_graph_dict",
-    "Edge",
-    "GraphIssue",
-    "GraphStats",
-    "Node",
-    "validate_graph_data",
-    "validate_graph",
-    "assert_valid",
-]
+# Submodules are imported on first attribute access so that
+# ``import dijkstra_dashboard.core`` stays cheap for short-lived workers.
+_EXPORTS = {
+    "AlgorithmError": ".errors",
+    "GraphError": ".errors",
+    "ValidationError": ".errors",
+    "Graph": ".graph",
+    "GraphSnapshot": ".snapshot",
+    "GRAPH_SCHEMA_VERSION": ".schema",
+    "COLUMNAR_SCHEMA_VERSION": ".schema",
+    "edge_id": ".schema",
+    "new_graph_dict": ".schema",
+    "Edge": ".types",
+    "GraphIssue": ".types",
+    "GraphStats": ".types",
+    "Node": ".types",
+    "validate_graph_data": ".validation",
+    "validate_graph": ".validation",
+    "assert_valid": ".validation",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .errors import AlgorithmError, GraphError, ValidationError
+    from .graph import Graph
+    from .schema import COLUMNAR_SCHEMA_VERSION, GRAPH_SCHEMA_VERSION, edge_id, new_graph_dict
+    from .snapshot import GraphSnapshot
+    from .types import Edge, GraphIssue, GraphStats, Node
+    from .validation import assert_valid, validate_graph, validate_graph_data
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
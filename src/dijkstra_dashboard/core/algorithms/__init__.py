@@ -1,22 +1,48 @@
-from .base import AlgorithmParam, AlgorithmResult, AlgorithmSpec, AlgorithmStep, PathfindingAlgorithm
-from .dijkstra import DijkstraAlgorithm
-from .runner import AlgorithmState, apply_step, apply_steps, init_state
-from .registry import (clear_registry, get_algorithm_spec, list_algorithm_specs,
-                       register_algorithm)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "AlgorithmParam",
-    "AlgorithmResult",
-    "AlgorithmSpec",
-    "AlgorithmStep",
-    "PathfindingAlgorithm",
-    "DijkstraAlgorithm",
-    "AlgorithmState",
-    "init_state",
-    "apply_step",
-    "apply_steps",
-    "register_algorithm",
-    "get_algorithm_spec",
-    "list_algorithm_specs",
-    "clear_registry",
-]
+# Engines are not imported here; the registry loads them on demand.
+_EXPORTS = {
+    "AlgorithmParam": ".base",
+    "AlgorithmResult": ".base",
+    "AlgorithmSpec": ".base",
+    "AlgorithmStep": ".base",
+    "PathfindingAlgorithm": ".base",
+    "DijkstraAlgorithm": ".dijkstra",
+    "DagShortestPathAlgorithm": ".dag",
+    "AlgorithmState": ".runner",
+    "init_state": ".runner",
+    "apply_step": ".runner",
+    "apply_steps": ".runner",
+    "register_algorithm": ".registry",
+    "register_engine": ".registry",
+    "get_algorithm": ".registry",
+    "get_algorithm_spec": ".registry",
+    "select_algorithm": ".registry",
+    "list_algorithm_specs": ".registry",
+    "clear_registry": ".registry",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .base import AlgorithmParam, AlgorithmResult, AlgorithmSpec, AlgorithmStep, PathfindingAlgorithm
+    from .dag import DagShortestPathAlgorithm
+    from .dijkstra import DijkstraAlgorithm
+    from .runner import AlgorithmState, apply_step, apply_steps, init_state
+    from .registry import (clear_registry, get_algorithm, get_algorithm_spec,
+                           list_algorithm_specs, register_algorithm, register_engine,
+                           select_algorithm)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
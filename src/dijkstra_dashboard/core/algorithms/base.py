@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Iterable, Literal, TypedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Literal, TypedDict
+
+from ..tracing import traced
 
 AlgorithmOutput = Literal["single_path", "all_pairs", "multi_path"]
 StepMode = Literal["delta", "snapshot"]
@@ -35,20 +40,97 @@ class AlgorithmSpec:
     constraints: dict
 
 
+@dataclass(frozen=True)
+class PhaseTiming:
+    wall: float
+    cpu: float
+
+
+@dataclass
+class AlgorithmStats:
+    nodes_settled: int = 0
+    edges_scanned: int = 0
+    relaxations: int = 0
+    queue_pushes: int = 0
+    queue_pops: int = 0
+    peak_queue_size: int = 0
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+
+
+@contextmanager
+def timed_phase(stats: AlgorithmStats | None, name: str) -> Iterator[None]:
+    if stats is None:
+        yield
+        return
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield
+    finally:
+        stats.phases[name] = PhaseTiming(wall=time.perf_counter() - wall,
+                                         cpu=time.process_time() - cpu)
+
+
 @dataclass
 class AlgorithmResult:
     kind: AlgorithmOutput
     path: list[str]
     distance: float | None
     distances: dict
-    paths: dict
+    # A dict for Dijkstra; the DAG engine returns a lazy PathMap instead.
+    paths: Mapping[str, list[str]]
     visited_order: list[str]
     steps: list[AlgorithmStep] | None
+    stats: AlgorithmStats | None = None
+
+
+class PathMap(Mapping):
+    """Read-only ``{node: path}`` view that follows ``prev`` links on access.
+
+    Materialising every path up front costs O(V * path length), which
+    dominates a linear-time search on long graphs.
+    """
+
+    def __init__(self, prev: dict[str, str], start: str, distances: dict[str, float]):
+        self._prev = prev
+        self._start = start
+        self._distances = distances
+
+    def __getitem__(self, node: str) -> list[str]:
+        if self._distances[node] == float("inf"):
+            return []
+        path = [node]
+        while path[-1] != self._start:
+            parent = self._prev.get(path[-1])
+            if parent is None:
+                return []
+            path.append(parent)
+        path.reverse()
+        return path
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._distances)
+
+    def __len__(self) -> int:
+        return len(self._distances)
+
+
+def build_paths(prev: dict[str, str], start: str,
+                distances: dict[str, float]) -> dict[str, list[str]]:
+    paths = PathMap(prev, start, distances)
+    return {node: paths[node] for node in distances}
 
 
 class PathfindingAlgorithm(ABC):
     spec: AlgorithmSpec
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every engine's entry points show up as trace spans.
+        for method in ("solve", "iter_steps"):
+            if method in cls.__dict__:
+                setattr(cls, method, traced(f"{cls.__name__}.{method}")(cls.__dict__[method]))
+
     @abstractmethod
     def solve(self, graph, params: dict) -> AlgorithmResult:
         raise NotImplementedError
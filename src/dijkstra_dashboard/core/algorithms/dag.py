@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from .base import (AlgorithmParam, AlgorithmResult, AlgorithmSpec, AlgorithmStats, AlgorithmStep,
+                   PathMap, PathfindingAlgorithm, timed_phase)
+from ..errors import AlgorithmError
+
+INF = float("inf")
+
+
+class DagShortestPathAlgorithm(PathfindingAlgorithm):
+    """Relaxes arcs once each in topological order: O(V + E), any weights.
+
+    ``mode="longest"`` returns the longest (critical) path instead.
+    ``max_distance`` stops expanding nodes farther than that in shortest
+    mode; with negative weights a farther node can still lead back within
+    the bound, so every node is expanded and only the visit is skipped.
+    """
+
+    spec = AlgorithmSpec(
+        name="dag",
+        description="Shortest or longest path in a directed acyclic graph",
+        inputs=[
+            AlgorithmParam(name="start", type="node_id", required=True),
+            AlgorithmParam(name="target", type="node_id", required=False),
+            AlgorithmParam(name="mode", type="str", required=False, default="shortest",
+                           choices=["shortest", "longest"]),
+            AlgorithmParam(name="max_distance", type="number", required=False),
+            AlgorithmParam(name="collect_stats", type="bool", required=False, default=False),
+        ],
+        output_kind="single_path",
+        constraints={"directed": True, "acyclic": True},
+    )
+
+    @staticmethod
+    def _topological_order(graph) -> list[str]:
+        if not graph.directed:
+            raise AlgorithmError("DAG shortest paths need a directed graph.")
+        index = graph.component_index()
+        if not index.is_acyclic():
+            raise AlgorithmError("Graph has a cycle; DAG shortest paths need an acyclic graph.")
+        # Cached by the component index for this version of the graph.
+        return index.topological_order()
+
+    @staticmethod
+    def _params(params: dict) -> tuple[str, str | None, bool, float | None]:
+        start = params.get("start")
+        if start is None:
+            raise AlgorithmError("Missing required parameter: start")
+        mode = params.get("mode") or "shortest"
+        if mode not in ("shortest", "longest"):
+            raise AlgorithmError(f"Unknown mode: {mode}")
+        max_distance = params.get("max_distance")
+        if max_distance is not None and mode == "longest":
+            raise AlgorithmError("max_distance is not supported for longest paths.")
+        return start, params.get("target"), mode == "longest", max_distance
+
+    def solve(self, graph, params: dict) -> AlgorithmResult:
+        start, target, longest, max_distance = self._params(params)
+        stats = AlgorithmStats() if params.get("collect_stats") else None
+
+        with timed_phase(stats, "validate"):
+            order = self._topological_order(graph)
+        with timed_phase(stats, "adjacency"):
+            adjacency = graph.to_adjacency_dict()
+        if start not in adjacency:
+            raise AlgorithmError(f"Start node '{start}' not found.")
+
+        with timed_phase(stats, "search"):
+            prune = max_distance is not None and not graph.has_negative_weights()
+            best: dict[str, float] = {start: 0.0}
+            prev: dict[str, str] = {}
+            visited_order: list[str] = []
+            scanned = 0
+            relaxations = 0
+            for current in order[order.index(start):]:
+                current_dist = best.get(current)
+                if current_dist is None:
+                    continue
+                if max_distance is not None and current_dist > max_distance:
+                    if prune:
+                        continue
+                else:
+                    visited_order.append(current)
+                # Every predecessor comes earlier in the order, so the
+                # target's distance is final once it is reached.
+                if current == target:
+                    break
+                neighbors = adjacency[current]
+                scanned += len(neighbors)
+                for neighbor, weight in neighbors:
+                    new_dist = current_dist + weight
+                    old_dist = best.get(neighbor)
+                    if old_dist is None or (new_dist > old_dist if longest else new_dist < old_dist):
+                        best[neighbor] = new_dist
+                        prev[neighbor] = current
+                        relaxations += 1
+            distances = {node: best.get(node, INF) for node in adjacency}
+        with timed_phase(stats, "paths"):
+            paths = PathMap(prev, start, distances)
+
+        if stats is not None:
+            stats.nodes_settled = len(visited_order)
+            stats.edges_scanned = scanned
+            stats.relaxations = relaxations
+
+        if target is None:
+            path = []
+            distance = None
+        else:
+            path = paths.get(target, [])
+            distance = distances.get(target, INF)
+
+        return AlgorithmResult(
+            kind="single_path",
+            path=path,
+            distance=distance,
+            distances=distances,
+            paths=paths,
+            visited_order=visited_order,
+            steps=None,
+            stats=stats,
+        )
+
+    def iter_steps(self, graph, params: dict,
+                   mode: str = "delta") -> Iterable[AlgorithmStep]:
+        start, target, longest, max_distance = self._params(params)
+        prune = max_distance is not None and not graph.has_negative_weights()
+        order = self._topological_order(graph)
+        adjacency = graph.to_adjacency_dict()
+        if start not in adjacency:
+            raise AlgorithmError(f"Start node '{start}' not found.")
+
+        distances = {node: INF for node in adjacency}
+        distances[start] = 0.0
+        reached = {start}
+        for current in order[order.index(start):]:
+            if current not in reached:
+                continue
+            if max_distance is not None and distances[current] > max_distance:
+                if prune:
+                    continue
+            else:
+                yield {
+                    "kind": "visit",
+                    "node": current,
+                    "edge": None,
+                    "old_distance": None,
+                    "new_distance": distances[current],
+                    "payload": {"distances": dict(distances)} if mode == "snapshot" else None,
+                }
+            if current == target:
+                break
+            for neighbor, weight in adjacency[current]:
+                new_dist = distances[current] + weight
+                old_dist = distances[neighbor]
+                if neighbor in reached and not (new_dist > old_dist if longest
+                                                else new_dist < old_dist):
+                    continue
+                reached.add(neighbor)
+                distances[neighbor] = new_dist
+                yield {
+                    "kind": "relax",
+                    "node": neighbor,
+                    "edge": (current, neighbor),
+                    "old_distance": old_dist,
+                    "new_distance": new_dist,
+                    "payload": {"distances": dict(distances)} if mode == "snapshot" else None,
+                }
+
+        if target is not None:
+            yield {
+                "kind": "final",
+                "node": target,
+                "edge": None,
+                "old_distance": None,
+                "new_distance": distances.get(target, INF),
+                "payload": None,
+            }
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import heapq
 from typing import Iterable
 
-from .base import AlgorithmParam, AlgorithmResult, AlgorithmSpec, AlgorithmStep, PathfindingAlgorithm
-from .registry import register_algorithm
+from .base import (AlgorithmParam, AlgorithmResult, AlgorithmSpec, AlgorithmStats, AlgorithmStep,
+                   PathfindingAlgorithm, build_paths, timed_phase)
 from ..errors import AlgorithmError
 from ..graph import Graph
 
@@ -15,26 +16,44 @@ class DijkstraAlgorithm(PathfindingAlgorithm):
         inputs=[
             AlgorithmParam(name="start", type="node_id", required=True),
             AlgorithmParam(name="target", type="node_id", required=False),
+            AlgorithmParam(name="max_distance", type="number", required=False),
+            AlgorithmParam(name="collect_stats", type="bool", required=False, default=False),
         ],
         output_kind="single_path",
         constraints={"non_negative": True},
     )
 
     def _validate_graph(self, graph: Graph) -> None:
-        for edge in graph.edges():
-            if edge.weight < 0:
-                raise AlgorithmError("Dijkstra does not support negative weights.")
+        if graph.has_negative_weights():
+            raise AlgorithmError("Dijkstra does not support negative weights.")
+
+    @staticmethod
+    def _may_reach(graph: Graph, start: str, target: str | None) -> bool:
+        if target is None:
+            return True
+        index = graph.component_index()
+        if start not in index or target not in index:
+            return True
+        return index.may_reach(start, target)
 
     def solve(self, graph: Graph, params: dict) -> AlgorithmResult:
         start = params.get("start")
         if start is None:
             raise AlgorithmError("Missing required parameter: start")
         target = params.get("target")
-
-        self._validate_graph(graph)
-
-        distances, prev, visited_order = self._run(graph, start, target)
-        paths = self._build_paths(prev, start, distances)
+        max_distance = params.get("max_distance")
+        stats = AlgorithmStats() if params.get("collect_stats") else None
+
+        with timed_phase(stats, "validate"):
+            self._validate_graph(graph)
+        with timed_phase(stats, "adjacency"):
+            adjacency = graph.to_adjacency_dict()
+        with timed_phase(stats, "search"):
+            distances, prev, visited_order = self._run(
+                adjacency, start, target, max_distance, stats,
+                search=self._may_reach(graph, start, target))
+        with timed_phase(stats, "paths"):
+            paths = build_paths(prev, start, distances)
 
         if target is None:
             path = []
@@ -51,6 +70,7 @@ class DijkstraAlgorithm(PathfindingAlgorithm):
             paths=paths,
             visited_order=visited_order,
             steps=None,
+            stats=stats,
         )
 
     def iter_steps(self, graph: Graph, params: dict,
@@ -59,6 +79,7 @@ class DijkstraAlgorithm(PathfindingAlgorithm):
         if start is None:
             raise AlgorithmError("Missing required parameter: start")
         target = params.get("target")
+        max_distance = params.get("max_distance")
 
         self._validate_graph(graph)
 
@@ -69,10 +90,14 @@ class DijkstraAlgorithm(PathfindingAlgorithm):
         distances = {node: float("inf") for node in adjacency}
         prev: dict[str, str] = {}
         distances[start] = 0.0
+        # A target in another component gets only the final step.
+        heap = [self._entry(0.0, start, target)] if self._may_reach(graph, start, target) else []
 
-        while unvisited:
-            current, current_dist = self._select_current(unvisited, distances, target)
-            if current is None or current_dist == float("inf"):
+        while heap:
+            current_dist, _, current = heapq.heappop(heap)
+            if current not in unvisited or current_dist != distances[current]:
+                continue
+            if max_distance is not None and current_dist > max_distance:
                 break
             unvisited.remove(current)
 
@@ -95,11 +120,12 @@ class DijkstraAlgorithm(PathfindingAlgorithm):
             for neighbor, weight in adjacency[current]:
                 if neighbor not in unvisited:
                     continue
-                new_dist = distances[current] + weight
+                new_dist = current_dist + weight
                 if new_dist < distances[neighbor]:
                     old_dist = distances[neighbor]
                     distances[neighbor] = new_dist
                     prev[neighbor] = current
+                    heapq.heappush(heap, self._entry(new_dist, neighbor, target))
                     payload = None
                     if mode == "snapshot":
                         payload = {"distances": dict(distances)}
@@ -122,78 +148,64 @@ class DijkstraAlgorithm(PathfindingAlgorithm):
                 "payload": None,
             }
 
-    def _run(self, graph: Graph, start: str, target: str | None):
-        adjacency = graph.to_adjacency_dict()
-        unvisited = set(adjacency.keys())
+    def _run(self, adjacency: dict, start: str, target: str | None,
+             max_distance: float | None = None, stats: AlgorithmStats | None = None,
+             search: bool = True):
         distances = {node: float("inf") for node in adjacency}
         prev: dict[str, str] = {}
+        visited: set[str] = set()
         visited_order: list[str] = []
 
         if start not in adjacency:
             raise AlgorithmError(f"Start node '{start}' not found.")
 
         distances[start] = 0.0
-
-        while unvisited:
-            current, current_dist = self._select_current(unvisited, distances, target)
-            if current is None or current_dist == float("inf"):
+        # ``search`` is False when the component index already rules the target out.
+        heap = [self._entry(0.0, start, target)] if search else []
+        # Plain local counters keep the cost negligible when stats are not requested.
+        pops = 0
+        scanned = 0
+        relaxations = 0
+        peak = 1
+
+        while heap:
+            current_dist, _, current = heapq.heappop(heap)
+            pops += 1
+            if current in visited or current_dist != distances[current]:
+                continue
+            if max_distance is not None and current_dist > max_distance:
                 break
-            unvisited.remove(current)
+            visited.add(current)
             visited_order.append(current)
 
             if target is not None and current == target:
                 break
 
-            for neighbor, weight in adjacency[current]:
-                if neighbor not in unvisited:
+            neighbors = adjacency[current]
+            scanned += len(neighbors)
+            for neighbor, weight in neighbors:
+                if neighbor in visited:
                     continue
-                new_dist = distances[current] + weight
+                new_dist = current_dist + weight
                 if new_dist < distances[neighbor]:
                     distances[neighbor] = new_dist
                     prev[neighbor] = current
+                    heapq.heappush(heap, self._entry(new_dist, neighbor, target))
+                    relaxations += 1
+            if len(heap) > peak:
+                peak = len(heap)
+
+        if stats is not None:
+            stats.nodes_settled = len(visited_order)
+            stats.edges_scanned = scanned
+            stats.relaxations = relaxations
+            stats.queue_pushes = relaxations + (1 if search else 0)
+            stats.queue_pops = pops
+            stats.peak_queue_size = peak
 
         return distances, prev, visited_order
 
-    def _select_current(self, unvisited: set[str],
-                        distances: dict[str, float],
-                        target: str | None) -> tuple[str | None, float]:
-        min_node = None
-        min_dist = float("inf")
-        for node in unvisited:
-            dist = distances[node]
-            if dist < min_dist:
-                min_node = node
-                min_dist = dist
-            elif dist == min_dist and min_node is not None and node < min_node:
-                min_node = node
-
-        if min_node is None:
-            return None, float("inf")
-
-        if target is not None and target in unvisited and distances[target] == min_dist:
-            return target, min_dist
-
-        return min_node, min_dist
-
-    def _build_paths(self, prev: dict[str, str], start: str,
-                     distances: dict[str, float]) -> dict[str, list[str]]:
-        paths: dict[str, list[str]] = {}
-        for node, dist in distances.items():
-            if dist == float("inf"):
-                paths[node] = []
-                continue
-            path = [node]
-            while path[-1] != start:
-                parent = prev.get(path[-1])
-                if parent is None:
-                    path = []
-                    break
-                path.append(parent)
-            paths[node] = list(reversed(path))
-        return paths
-
-
-try:
-    register_algorithm(DijkstraAlgorithm.spec)
-except ValueError:
-    pass
+    @staticmethod
+    def _entry(distance: float, node: str, target: str | None) -> tuple[float, int, str]:
+        # Ties settle the target first, then the lowest node id.
+        return (distance, 0 if node == target else 1, node)
@@ -1,29 +1,121 @@
 from __future__ import annotations
 
+from importlib import import_module
 from typing import Dict, Iterable
 
 from .base import AlgorithmSpec
 
+ENTRY_POINT_GROUP = "dijkstra_dashboard.engines"
+
+# Engines shipped with the package, referenced as "module:attribute" so that
+# nothing is imported until an engine is actually asked for.
+_BUILTIN_ENGINES: Dict[str, str] = {
+    "dijkstra": "dijkstra_dashboard.core.algorithms.dijkstra:DijkstraAlgorithm",
+    "dag": "dijkstra_dashboard.core.algorithms.dag:DagShortestPathAlgorithm",
+}
+
 _REGISTRY: Dict[str, AlgorithmSpec] = {}
+_ENGINES: Dict[str, object] = {}
+_discovered = False
+
+
+def _load_reference(reference: str) -> type:
+    module_name, _, attr = reference.partition(":")
+    value = import_module(module_name)
+    for part in attr.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def _seed_builtins() -> None:
+    for name, reference in _BUILTIN_ENGINES.items():
+        _ENGINES.setdefault(name, reference)
 
 
-def register_algorithm(spec: AlgorithmSpec) -> None:
+def _discover() -> None:
+    """Pick up third-party engines advertised through package entry points."""
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+    _seed_builtins()
+
+    # Scanning installed distributions is comparatively slow, so it only
+    # happens when a name is not a built-in engine or the full list is needed.
+    from importlib.metadata import entry_points
+
+    for entry in entry_points(group=ENTRY_POINT_GROUP):
+        _ENGINES.setdefault(entry.name.lower(), entry.value)
+
+
+def register_engine(name: str, engine: str | type) -> None:
+    """Register an engine class, or a lazy ``"module:Class"`` reference to one."""
+    key = name.lower()
+    if key in _ENGINES or key in _REGISTRY:
+        raise ValueError(f"Algorithm already registered: {name}")
+    _ENGINES[key] = engine
+
+
+def register_algorithm(spec: AlgorithmSpec, engine: type | None = None) -> None:
     key = spec.name.lower()
     if key in _REGISTRY:
         raise ValueError(f"Algorithm already registered: {spec.name}")
     _REGISTRY[key] = spec
+    if engine is not None:
+        _ENGINES[key] = engine
+
+
+def get_algorithm(name: str) -> type:
+    key = name.lower()
+    if key not in _ENGINES and key in _BUILTIN_ENGINES:
+        _seed_builtins()
+    if key not in _ENGINES:
+        _discover()
+    if key not in _ENGINES:
+        raise KeyError(f"Unknown algorithm: {name}")
+    engine = _ENGINES[key]
+    if isinstance(engine, str):
+        engine = _load_reference(engine)
+        _ENGINES[key] = engine
+    spec = getattr(engine, "spec", None)
+    if spec is not None:
+        _REGISTRY.setdefault(key, spec)
+    return engine
+
+
+def select_algorithm(graph) -> str:
+    """Name of the built-in engine suited to ``graph``.
+
+    Directed acyclic graphs use the linear-time ``"dag"`` engine, which also
+    accepts negative weights; everything else uses ``"dijkstra"``.
+    """
+    if graph.directed and graph.component_index().is_acyclic():
+        return "dag"
+    return "dijkstra"
 
 
 def get_algorithm_spec(name: str) -> AlgorithmSpec:
     key = name.lower()
+    if key not in _REGISTRY:
+        try:
+            get_algorithm(key)
+        except KeyError:
+            pass
     if key not in _REGISTRY:
         raise KeyError(f"Unknown algorithm: {name}")
     return _REGISTRY[key]
 
 
 def list_algorithm_specs() -> Iterable[AlgorithmSpec]:
+    _discover()
+    for key in list(_ENGINES):
+        if key not in _REGISTRY:
+            get_algorithm(key)
     return list(_REGISTRY.values())
 
 
 def clear_registry() -> None:
+    global _discovered
     _REGISTRY.clear()
+    _ENGINES.clear()
+    _discovered = False
@@ -0,0 +1,228 @@
+"""Memory-mappable binary graph format.
+
+A file is a fixed little-endian header followed by 8-byte aligned sections::
+
+    string offsets  uint64[string_count + 1]   into the UTF-8 string data
+    string data     bytes                      interned ids and labels
+    node ids        uint64[node_count]         string table indices
+    labels          uint64[node_count]         string table indices
+    x, y            float64[node_count]
+    CSR offsets     uint64[node_count + 1]
+    CSR targets     uint64[slot_count]         node indices
+    CSR weights     float64[slot_count]
+    weak labels     uint64[node_count]         weak component of each node
+    strong labels   uint64[node_count]         SCC of each node (= weak if undirected)
+    metadata        UTF-8 JSON
+
+Undirected edges are stored in both rows, exactly as ``GraphSnapshot`` keeps
+them. ``open_binary_graph`` maps the file and hands ``memoryview`` casts of
+the sections to ``GraphSnapshot``, so nothing is parsed up front; strings are
+decoded on first access. The component labels and the negative-weight flag
+are computed when writing, so the first query does not have to rebuild them.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import List
+
+from .components import ComponentLabels
+from .errors import GraphError
+from .fileio import atomic_write
+from .schema import BINARY_FORMAT_VERSION, BINARY_MAGIC
+from .snapshot import GraphSnapshot
+from .tracing import traced
+
+FLAG_DIRECTED = 0x1
+FLAG_NEGATIVE_WEIGHTS = 0x2
+
+_SECTIONS = ("string_offsets", "string_data", "ids", "labels", "xs", "ys",
+             "offsets", "targets", "weights", "weak", "strong", "metadata")
+# magic, version, flags, node_count, slot_count, string_count, weak and
+# strong component counts, the byte offset of each section, then the
+# metadata length.
+_HEADER = struct.Struct("<8sIIQQQQQ" + "Q" * (len(_SECTIONS) + 1))
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class BinaryFormatError(GraphError):
+    """Raised when a file is not a readable binary graph."""
+
+
+class _StringTable:
+    __slots__ = ("_offsets", "_data", "_cache")
+
+    def __init__(self, offsets: Sequence[int], data: memoryview):
+        self._offsets = offsets
+        self._data = data
+        self._cache: List[str | None] | None = None
+
+    def get(self, ref: int) -> str:
+        cache = self._cache
+        if cache is None:
+            # Allocated on first use so that opening a file stays O(1).
+            cache = self._cache = [None] * (len(self._offsets) - 1)
+        value = cache[ref]
+        if value is None:
+            value = str(self._data[self._offsets[ref]:self._offsets[ref + 1]], "utf-8")
+            cache[ref] = value
+        return value
+
+
+class _StringColumn(Sequence):
+    """Read-only sequence of strings resolved lazily through a string table."""
+
+    __slots__ = ("_table", "_refs")
+
+    def __init__(self, table: _StringTable, refs: Sequence[int]):
+        self._table = table
+        self._refs = refs
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._table.get(ref) for ref in self._refs[index]]
+        return self._table.get(self._refs[index])
+
+    def __iter__(self):
+        get = self._table.get
+        for ref in self._refs:
+            yield get(ref)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _pack(typecode: str, values) -> bytes:
+    packed = array(typecode, values)
+    if not _LITTLE_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+@traced("write_binary_graph")
+def write_binary_graph(graph, path: str | os.PathLike) -> None:
+    """Write a ``Graph`` or ``GraphSnapshot`` to ``path`` (replaced atomically)."""
+    snapshot = graph.freeze()
+    columns = snapshot.columns()
+    components = snapshot.component_index().labels()
+    interned: dict[str, int] = {}
+    strings: List[bytes] = []
+
+    def _intern(value: str) -> int:
+        ref = interned.get(value)
+        if ref is None:
+            ref = interned[value] = len(strings)
+            strings.append(value.encode("utf-8"))
+        return ref
+
+    id_refs = [_intern(node_id) for node_id in columns.node_ids]
+    label_refs = [_intern(label) for label in columns.labels]
+    string_offsets = [0]
+    for encoded in strings:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+
+    blobs = [
+        _pack("Q", string_offsets),
+        b"".join(strings),
+        _pack("Q", id_refs),
+        _pack("Q", label_refs),
+        _pack("d", columns.xs),
+        _pack("d", columns.ys),
+        _pack("Q", columns.offsets),
+        _pack("Q", columns.targets),
+        _pack("d", columns.weights),
+        _pack("Q", components.weak),
+        _pack("Q", components.strong),
+        json.dumps(snapshot.metadata).encode("utf-8"),
+    ]
+    positions = []
+    cursor = _HEADER.size
+    for blob in blobs:
+        cursor = _align(cursor)
+        positions.append(cursor)
+        cursor += len(blob)
+
+    header = _HEADER.pack(
+        BINARY_MAGIC, BINARY_FORMAT_VERSION,
+        (FLAG_DIRECTED if snapshot.directed else 0)
+        | (FLAG_NEGATIVE_WEIGHTS if snapshot.has_negative_weights() else 0),
+        len(columns.node_ids), len(columns.targets), len(strings),
+        components.weak_count, components.strong_count,
+        *positions, len(blobs[-1]),
+    )
+    with atomic_write(path) as handle:
+        handle.write(header)
+        for position, blob in zip(positions, blobs):
+            handle.write(b"\0" * (position - handle.tell()))
+            handle.write(blob)
+
+
+def is_binary_graph(path: str | os.PathLike) -> bool:
+    with open(path, "rb") as handle:
+        return handle.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def _column(view: memoryview, start: int, count: int, typecode: str) -> Sequence:
+    section = view[start:start + count * 8]
+    if len(section) != count * 8:
+        raise BinaryFormatError("Binary graph file is truncated.")
+    if _LITTLE_ENDIAN:
+        return section.cast(typecode)
+    # Big-endian hosts cannot use the mapped bytes directly.
+    values = array(typecode)
+    values.frombytes(section)
+    values.byteswap()
+    return values
+
+
+@traced("open_binary_graph")
+def open_binary_graph(path: str | os.PathLike) -> GraphSnapshot:
+    """Map ``path`` read-only and return a ``GraphSnapshot`` backed by it."""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size < _HEADER.size:
+            raise BinaryFormatError("Binary graph file is truncated.")
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    (magic, version, flags, node_count, slot_count, string_count,
+     weak_count, strong_count, *rest) = _HEADER.unpack_from(view)
+    if magic != BINARY_MAGIC:
+        raise BinaryFormatError("Not a binary graph file.")
+    if version != BINARY_FORMAT_VERSION:
+        raise BinaryFormatError(f"Unsupported binary graph version: {version}")
+    sections = dict(zip(_SECTIONS, rest))
+    metadata_length = rest[-1]
+
+    string_offsets = _column(view, sections["string_offsets"], string_count + 1, "Q")
+    data_start = sections["string_data"]
+    table = _StringTable(string_offsets,
+                         view[data_start:data_start + string_offsets[-1]])
+    offsets = _column(view, sections["offsets"], node_count + 1, "Q")
+    if offsets[-1] != slot_count:
+        raise BinaryFormatError("Binary graph CSR offsets are inconsistent.")
+    metadata_start = sections["metadata"]
+    metadata = json.loads(str(view[metadata_start:metadata_start + metadata_length], "utf-8"))
+
+    return GraphSnapshot(
+        directed=bool(flags & FLAG_DIRECTED),
+        metadata=metadata,
+        node_ids=_StringColumn(table, _column(view, sections["ids"], node_count, "Q")),
+        labels=_StringColumn(table, _column(view, sections["labels"], node_count, "Q")),
+        xs=_column(view, sections["xs"], node_count, "d"),
+        ys=_column(view, sections["ys"], node_count, "d"),
+        offsets=offsets,
+        targets=_column(view, sections["targets"], slot_count, "Q"),
+        weights=_column(view, sections["weights"], slot_count, "d"),
+        has_negative=bool(flags & FLAG_NEGATIVE_WEIGHTS),
+        component_labels=ComponentLabels(
+            _column(view, sections["weak"], node_count, "Q"), weak_count,
+            _column(view, sections["strong"], node_count, "Q"), strong_count),
+    )
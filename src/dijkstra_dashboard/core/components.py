@@ -0,0 +1,246 @@
+"""Connected-component index used to rule out unreachable targets.
+
+For an undirected graph the index holds the connected components. For a
+directed graph it holds the weakly connected components, the strongly
+connected components (iterative Tarjan) and the condensation DAG. Tarjan
+numbers the SCCs in reverse topological order, so an arc between two
+different components always goes from the higher id to the lower one.
+``may_reach`` answers "no" in O(1) when the start and target lie in
+different weak components, or when the start's SCC comes after the
+target's in topological order.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+
+def _find(parent: List[int], node: int) -> int:
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+
+def _weak_components(count: int, arcs: Sequence[Tuple[int, int]]) -> Tuple[List[int], int]:
+    parent = list(range(count))
+    size = [1] * count
+    for u, v in arcs:
+        u = _find(parent, u)
+        v = _find(parent, v)
+        if u == v:
+            continue
+        if size[u] < size[v]:
+            u, v = v, u
+        parent[v] = u
+        size[u] += size[v]
+    labels: List[int] = [0] * count
+    ids: Dict[int, int] = {}
+    for node in range(count):
+        labels[node] = ids.setdefault(_find(parent, node), len(ids))
+    return labels, len(ids)
+
+
+def _strong_components(successors: List[List[int]]) -> Tuple[List[int], int]:
+    count = len(successors)
+    order = [-1] * count
+    low = [0] * count
+    on_stack = bytearray(count)
+    stack: List[int] = []
+    labels = [-1] * count
+    counter = 0
+    found = 0
+    for root in range(count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # Explicit (node, next successor position) frames instead of recursion.
+        work = [(root, 0)]
+        while work:
+            node, position = work[-1]
+            neighbors = successors[node]
+            if position < len(neighbors):
+                work[-1] = (node, position + 1)
+                neighbor = neighbors[position]
+                if order[neighbor] == -1:
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, 0))
+                elif on_stack[neighbor] and order[neighbor] < low[node]:
+                    low[node] = order[neighbor]
+                continue
+            work.pop()
+            if work:
+                caller = work[-1][0]
+                if low[node] < low[caller]:
+                    low[caller] = low[node]
+            if low[node] == order[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    labels[member] = found
+                    if member == node:
+                        break
+                found += 1
+    return labels, found
+
+
+def _condense(strong: Sequence[int], strong_count: int,
+              arcs: Iterable[Tuple[int, int]]) -> List[set[int]]:
+    condensation: List[set[int]] = [set() for _ in range(strong_count)]
+    for u, v in arcs:
+        if strong[u] != strong[v]:
+            condensation[strong[u]].add(strong[v])
+    return condensation
+
+
+class ComponentLabels(NamedTuple):
+    """Per-node component labels in node order, as stored in binary graph files."""
+
+    weak: Sequence[int]
+    weak_count: int
+    strong: Sequence[int]
+    strong_count: int
+
+
+class ComponentIndex:
+    """Immutable component labels for one version of a graph."""
+
+    __slots__ = ("_directed", "_ids", "_index", "_weak", "_weak_count",
+                 "_strong", "_strong_count", "_condensation", "_arcs", "_order")
+
+    def __init__(self, directed: bool, node_ids: Sequence[str],
+                 arcs: Iterable[Tuple[int, int]]):
+        arcs = list(arcs)
+        self._directed = bool(directed)
+        self._ids = list(node_ids)
+        self._index = {node_id: idx for idx, node_id in enumerate(self._ids)}
+        self._weak, self._weak_count = _weak_components(len(self._ids), arcs)
+        if self._directed:
+            successors: List[List[int]] = [[] for _ in self._ids]
+            for u, v in arcs:
+                successors[u].append(v)
+            self._strong, self._strong_count = _strong_components(successors)
+            self._condensation = _condense(self._strong, self._strong_count, arcs)
+        else:
+            self._strong, self._strong_count = self._weak, self._weak_count
+            self._condensation = [set() for _ in range(self._weak_count)]
+        self._arcs = None
+        self._order: List[str] | None = None
+
+    @classmethod
+    def from_labels(cls, directed: bool, node_ids: Sequence[str], labels: ComponentLabels,
+                    arcs: Callable[[], Iterable[Tuple[int, int]]],
+                    index: Dict[str, int] | None = None) -> "ComponentIndex":
+        """Rebuild an index from stored labels without rerunning union-find or Tarjan.
+
+        ``arcs`` is only called if the condensation is asked for.
+        """
+        self = cls.__new__(cls)
+        self._directed = bool(directed)
+        self._ids = node_ids
+        self._index = index if index is not None else {
+            node_id: idx for idx, node_id in enumerate(node_ids)}
+        self._weak, self._weak_count = labels.weak, labels.weak_count
+        self._strong, self._strong_count = labels.strong, labels.strong_count
+        self._condensation = None
+        self._arcs = arcs
+        self._order = None
+        return self
+
+    @classmethod
+    def from_edges(cls, directed: bool, node_ids: Sequence[str],
+                   edges: Iterable[Tuple[str, str]]) -> "ComponentIndex":
+        index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+        return cls(directed, node_ids, ((index[start], index[end]) for start, end in edges))
+
+    @property
+    def directed(self) -> bool:
+        return self._directed
+
+    @property
+    def component_count(self) -> int:
+        """Strongly connected components (connected components if undirected)."""
+        return self._strong_count
+
+    @property
+    def weak_component_count(self) -> int:
+        return self._weak_count
+
+    def is_connected(self) -> bool:
+        """True when the graph is connected, ignoring edge direction."""
+        return self._weak_count <= 1
+
+    def _lookup(self, node_id: str) -> int:
+        idx = self._index.get(node_id)
+        if idx is None:
+            raise ValueError(f"Node '{node_id}' not found.")
+        return idx
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._index
+
+    def component(self, node_id: str) -> int:
+        return self._strong[self._lookup(node_id)]
+
+    def weak_component(self, node_id: str) -> int:
+        return self._weak[self._lookup(node_id)]
+
+    def components(self) -> List[List[str]]:
+        """Node ids grouped by component; for directed graphs in reverse topological order."""
+        groups: List[List[str]] = [[] for _ in range(self._strong_count)]
+        for node_id, label in zip(self._ids, self._strong):
+            groups[label].append(node_id)
+        return groups
+
+    def labels(self) -> ComponentLabels:
+        return ComponentLabels(self._weak, self._weak_count, self._strong, self._strong_count)
+
+    def condensation(self) -> List[set[int]]:
+        """Successor components of each component; empty for undirected graphs."""
+        if self._condensation is None:
+            if self._directed:
+                self._condensation = _condense(self._strong, self._strong_count, self._arcs())
+            else:
+                self._condensation = [set() for _ in range(self._strong_count)]
+        return [set(successors) for successors in self._condensation]
+
+    def topological_rank(self, node_id: str) -> int:
+        """Position of the node's component in a topological order of the condensation."""
+        return self._strong_count - 1 - self.component(node_id)
+
+    def is_acyclic(self) -> bool:
+        """True for a directed graph in which every node is its own SCC."""
+        return self._directed and self._strong_count == len(self._ids)
+
+    def topological_order(self) -> List[str]:
+        """Node ids ordered so that every arc between components points forward.
+
+        For an acyclic graph this is a topological order of the graph itself.
+        """
+        if self._order is None:
+            order: List[str | None] = [None] * len(self._ids)
+            if self.is_acyclic():
+                last = self._strong_count - 1
+                for node_id, label in zip(self._ids, self._strong):
+                    order[last - label] = node_id
+            else:
+                order = [node_id for group in reversed(self.components()) for node_id in group]
+            self._order = order
+        return list(self._order)
+
+    def may_reach(self, start: str, target: str) -> bool:
+        """False only if no path from ``start`` to ``target`` can exist.
+
+        Exact for undirected graphs and within a strongly connected component;
+        otherwise True means a search is still needed.
+        """
+        u = self._lookup(start)
+        v = self._lookup(target)
+        if self._weak[u] != self._weak[v]:
+            return False
+        return self._strong[u] >= self._strong[v]
@@ -0,0 +1,56 @@
+"""Atomic replacement of output files.
+
+``atomic_write`` hands out a uniquely named temporary file (created with
+``O_EXCL``) in the destination's directory, so concurrent writers never share
+a temporary name and the final ``os.replace`` stays on one file system.
+Readers see either the old file or the complete new one, never a partial
+write.
+"""
+from __future__ import annotations
+
+import os
+import stat
+from contextlib import contextmanager
+from typing import IO, Any, Iterator
+
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp(directory: str, name: str) -> tuple[int, str]:
+    # Unlike mkstemp (owner-only), mode 0o666 lets the umask decide, exactly
+    # as it would for a file created with open().
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(temp_path, _TEMP_FLAGS, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+@contextmanager
+def atomic_write(path: str | os.PathLike, mode: str = "wb", **open_kwargs: Any) -> Iterator[IO]:
+    """Write through a temporary file that replaces ``path`` when the block succeeds.
+
+    The file is flushed and fsynced before the rename and keeps the mode of
+    the file it replaces. If the block raises, the temporary file is
+    removed and ``path`` is left untouched.
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    fd, temp_path = _create_temp(directory or ".", name)
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,271 @@
+"""Deterministic synthetic graph generators.
+
+Every builder takes a ``seed`` and returns the same graph for the same
+arguments. Node ids are ``n0 .. n{N-1}`` and positions are always filled in.
+Pass ``frozen=True`` to get a ``GraphSnapshot`` built straight from the edge
+arrays, which skips per-edge checks and is the fastest path for large inputs.
+"""
+from __future__ import annotations
+
+import math
+import random
+from typing import Dict, List, Tuple
+
+from .graph import Graph
+from .snapshot import GraphSnapshot
+
+WeightRange = Tuple[float, float]
+
+
+class _EdgeArrays:
+    __slots__ = ("sources", "targets", "weights")
+
+    def __init__(self):
+        self.sources: List[int] = []
+        self.targets: List[int] = []
+        self.weights: List[float] = []
+
+    def add(self, u: int, v: int, weight: float) -> None:
+        self.sources.append(u)
+        self.targets.append(v)
+        self.weights.append(weight)
+
+
+def _build(family: str, directed: bool, xs: List[float], ys: List[float],
+           edges: _EdgeArrays, frozen: bool, keep: List[int] | None = None):
+    if keep is not None:
+        # Compact node indices after dropping nodes (e.g. grid obstacles).
+        remap = {old: new for new, old in enumerate(keep)}
+        xs = [xs[idx] for idx in keep]
+        ys = [ys[idx] for idx in keep]
+        edges.sources = [remap[u] for u in edges.sources]
+        edges.targets = [remap[v] for v in edges.targets]
+
+    node_ids = [f"n{idx}" for idx in range(len(xs))]
+    metadata = {"generator": family}
+    if frozen:
+        return GraphSnapshot.from_edge_arrays(directed, node_ids, xs, ys, edges.sources,
+                                              edges.targets, edges.weights, metadata=metadata)
+
+    return Graph.from_arrays(node_ids, edges.sources, edges.targets, edges.weights,
+                             xs=xs, ys=ys, directed=directed, metadata=metadata)
+
+
+def _weight(rng: random.Random, weight_range: WeightRange | None, default: float) -> float:
+    if weight_range is None:
+        return default
+    low, high = weight_range
+    if isinstance(low, int) and isinstance(high, int):
+        return float(rng.randint(low, high))
+    return rng.uniform(low, high)
+
+
+def grid_graph(rows: int, cols: int, obstacle_ratio: float = 0.0,
+               diagonal: bool = False, spacing: float = 100.0,
+               weight_range: WeightRange | None = None, seed: int = 0,
+               frozen: bool = False):
+    """4- (or 8-) connected grid; a fraction of cells can be removed as obstacles."""
+    if rows < 1 or cols < 1:
+        raise ValueError("Grid needs at least one row and one column.")
+    if not 0.0 <= obstacle_ratio < 1.0:
+        raise ValueError("obstacle_ratio must be in [0, 1).")
+    rng = random.Random(seed)
+    total = rows * cols
+    blocked = bytearray(total)
+    if obstacle_ratio:
+        for idx in rng.sample(range(total), int(total * obstacle_ratio)):
+            blocked[idx] = 1
+
+    xs = [(idx % cols) * spacing for idx in range(total)]
+    ys = [(idx // cols) * spacing for idx in range(total)]
+    edges = _EdgeArrays()
+    steps = [(0, 1, 1.0), (1, 0, 1.0)]
+    if diagonal:
+        steps += [(1, 1, math.sqrt(2)), (1, -1, math.sqrt(2))]
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            if blocked[u]:
+                continue
+            for dr, dc, length in steps:
+                nr, nc = r + dr, c + dc
+                if nr >= rows or nc < 0 or nc >= cols:
+                    continue
+                v = nr * cols + nc
+                if not blocked[v]:
+                    edges.add(u, v, _weight(rng, weight_range, length))
+
+    keep = [idx for idx in range(total) if not blocked[idx]] if obstacle_ratio else None
+    return _build("grid", False, xs, ys, edges, frozen, keep)
+
+
+def random_geometric_graph(n: int, radius: float | None = None, width: float = 1000.0,
+                           height: float = 1000.0, seed: int = 0, frozen: bool = False):
+    """Points uniform in a box, joined when closer than ``radius`` (unit-square units)."""
+    if n < 1:
+        raise ValueError("Graph needs at least one node.")
+    rng = random.Random(seed)
+    if radius is None:
+        # Expected degree ~ 1.5 ln n keeps the graph connected with high probability.
+        radius = math.sqrt(1.5 * math.log(max(n, 2)) / (math.pi * n))
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for idx, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(idx)
+
+    edges = _EdgeArrays()
+    r2 = radius * radius
+    scale = math.hypot(width, height) / math.sqrt(2)
+    # Each unordered cell pair is visited once: self plus four forward neighbours.
+    forward = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+    for (cx, cy), members in cells.items():
+        for dx, dy in forward:
+            others = cells.get((cx + dx, cy + dy))
+            if not others:
+                continue
+            same = dx == 0 and dy == 0
+            for i, u in enumerate(members):
+                ux, uy = points[u]
+                for v in (members[i + 1:] if same else others):
+                    vx, vy = points[v]
+                    d2 = (ux - vx) ** 2 + (uy - vy) ** 2
+                    if d2 <= r2:
+                        edges.add(u, v, round(math.sqrt(d2) * scale, 6))
+
+    xs = [x * width for x, _ in points]
+    ys = [y * height for _, y in points]
+    return _build("random_geometric", False, xs, ys, edges, frozen)
+
+
+def barabasi_albert_graph(n: int, m: int = 2, weight_range: WeightRange | None = (1, 10),
+                          width: float = 1000.0, height: float = 1000.0, seed: int = 0,
+                          frozen: bool = False):
+    """Scale-free graph by preferential attachment of ``m`` edges per new node."""
+    if m < 1 or n <= m:
+        raise ValueError("Barabasi-Albert needs n > m >= 1.")
+    rng = random.Random(seed)
+    edges = _EdgeArrays()
+    repeated: List[int] = []
+    for u in range(m + 1):
+        for v in range(u + 1, m + 1):
+            edges.add(u, v, _weight(rng, weight_range, 1.0))
+            repeated.extend((u, v))
+    for u in range(m + 1, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(repeated[rng.randrange(len(repeated))])
+        for v in sorted(chosen):
+            edges.add(v, u, _weight(rng, weight_range, 1.0))
+            repeated.extend((u, v))
+
+    xs = [rng.uniform(0, width) for _ in range(n)]
+    ys = [rng.uniform(0, height) for _ in range(n)]
+    return _build("barabasi_albert", False, xs, ys, edges, frozen)
+
+
+def erdos_renyi_graph(n: int, p: float, directed: bool = False,
+                      weight_range: WeightRange | None = (1, 10),
+                      width: float = 1000.0, height: float = 1000.0, seed: int = 0,
+                      frozen: bool = False):
+    """G(n, p) using geometric skipping, so the cost is O(n + m) rather than O(n^2)."""
+    if n < 1:
+        raise ValueError("Graph needs at least one node.")
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("p must be in [0, 1].")
+    rng = random.Random(seed)
+    edges = _EdgeArrays()
+
+    if p > 0:
+        # Batagelj & Brandes: walk the candidate pairs, jumping over non-edges.
+        log_q = math.log(1.0 - p) if p < 1 else None
+        per_row = n if directed else None
+        v, w = (0, -1) if directed else (1, -1)
+        while v < n:
+            if log_q is None:
+                w += 1
+            else:
+                w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            if directed:
+                while w >= per_row and v < n:
+                    w -= per_row
+                    v += 1
+                if v < n and w == v:
+                    continue
+            else:
+                while w >= v and v < n:
+                    w -= v
+                    v += 1
+            if v < n:
+                edges.add(v, w, _weight(rng, weight_range, 1.0))
+
+    xs = [rng.uniform(0, width) for _ in range(n)]
+    ys = [rng.uniform(0, height) for _ in range(n)]
+    return _build("erdos_renyi", directed, xs, ys, edges, frozen)
+
+
+def _find(parent: List[int], node: int) -> int:
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+
+def road_network(rows: int, cols: int, spacing: float = 100.0, jitter: float = 0.25,
+                 removal: float = 0.15, shortcut: float = 0.05, seed: int = 0,
+                 frozen: bool = False):
+    """Planar road-like network: a jittered grid with missing blocks and some diagonals.
+
+    Weights are Euclidean segment lengths. Each grid street is dropped with
+    probability ``removal``, then dropped streets that would join two
+    separate pieces are put back, so the network is always connected. At
+    most one diagonal per block is added and jitter stays below half the
+    spacing, so edges never cross.
+    """
+    if rows < 2 or cols < 2:
+        raise ValueError("Road network needs at least a 2x2 grid.")
+    if not 0.0 <= jitter < 0.5:
+        raise ValueError("jitter must be in [0, 0.5).")
+    rng = random.Random(seed)
+    offset = jitter * spacing
+    xs = []
+    ys = []
+    for r in range(rows):
+        for c in range(cols):
+            xs.append(c * spacing + rng.uniform(-offset, offset))
+            ys.append(r * spacing + rng.uniform(-offset, offset))
+
+    edges = _EdgeArrays()
+
+    parent = list(range(rows * cols))
+    removed: List[Tuple[int, int]] = []
+
+    def _link(u: int, v: int) -> None:
+        edges.add(u, v, round(math.hypot(xs[u] - xs[v], ys[u] - ys[v]), 6))
+        parent[_find(parent, u)] = _find(parent, v)
+
+    def _street(u: int, v: int) -> None:
+        if rng.random() >= removal:
+            _link(u, v)
+        else:
+            removed.append((u, v))
+
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            if c + 1 < cols:
+                _street(u, u + 1)
+            if r + 1 < rows:
+                _street(u, u + cols)
+            if c + 1 < cols and r + 1 < rows and rng.random() < shortcut:
+                if rng.random() < 0.5:
+                    _link(u, u + cols + 1)
+                else:
+                    _link(u + 1, u + cols)
+    # The full grid is connected, so restoring the dropped streets that
+    # bridge two pieces (Kruskal-style, in random order) reconnects it.
+    rng.shuffle(removed)
+    for u, v in removed:
+        if _find(parent, u) != _find(parent, v):
+            _link(u, v)
+    return _build("road_network", False, xs, ys, edges, frozen)
@@ -1,11 +1,45 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Tuple
-
+import gc
+import numbers
+import threading
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .components import ComponentIndex
 from .schema import edge_id
+from .tracing import traced
 from .types import Edge, GraphStats, Node
 
 
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused():
+    # Bulk inserts allocate millions of objects that all survive; letting the
+    # cyclic collector rescan them on every generation threshold dominates
+    # the load time for large graphs. The collector switch is process-wide,
+    # so overlapping pauses (nested, or on other threads) share one: the
+    # first disables it and the last restores the state the first found.
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+
 class Graph:
     def __init__(self, directed: bool = False, metadata: dict | None = None):
         self._directed = bool(directed)
@@ -13,6 +47,15 @@ class Graph:
         self._edges: Dict[str, Edge] = {}
         self._metadata = dict(metadata or {})
         self._next_id = 1
+        # Validation state kept up to date by every mutation (see validate_graph).
+        self._version = 0
+        self._negative_edges: set[str] = set()
+        # Union-find over undirected connectivity; built on first use and
+        # dropped on deletions, which union-find cannot undo.
+        self._uf_parent: Dict[str, str] | None = None
+        self._uf_size: Dict[str, int] | None = None
+        self._component_count = 0
+        self._component_index: tuple[int, ComponentIndex] | None = None
 
     @property
     def directed(self) -> bool:
@@ -22,6 +65,15 @@ class Graph:
     def metadata(self) -> dict:
         return dict(self._metadata)
 
+    @property
+    def version(self) -> int:
+        """Counter bumped by every change to nodes, edges, weights or direction.
+
+        Node positions and metadata do not count, so anything derived from
+        the structure alone can be cached against this value.
+        """
+        return self._version
+
     def set_metadata(self, metadata: dict) -> None:
         self._metadata = dict(metadata)
 
@@ -47,6 +99,11 @@ class Graph:
         self._nodes[node_id] = Node(id=node_id, label=label, x=float(x), y=float(y))
         if node_id.startswith("n") and node_id[1:].isdigit():
             self._next_id = max(self._next_id, int(node_id[1:]) + 1)
+        self._version += 1
+        if self._uf_parent is not None:
+            self._uf_parent[node_id] = node_id
+            self._uf_size[node_id] = 1
+            self._component_count += 1
         return node_id
 
     def remove_node(self, node_id: str) -> None:
@@ -57,6 +114,9 @@ class Graph:
                      if edge.start == node_id or edge.end == node_id]
         for edge_id_key in to_remove:
             del self._edges[edge_id_key]
+            self._negative_edges.discard(edge_id_key)
+        self._version += 1
+        self._uf_parent = None
 
     def rename_node(self, node_id: str, label: str) -> None:
         if node_id not in self._nodes:
@@ -65,6 +125,7 @@ class Graph:
             raise ValueError("Node label must be a string.")
         node = self._nodes[node_id]
         self._nodes[node_id] = Node(id=node.id, label=label, x=node.x, y=node.y)
+        self._version += 1
 
     def _normalize_edge(self, start: str, end: str) -> tuple[str, str]:
         if self._directed:
@@ -88,6 +149,130 @@ class Graph:
 
         self._edges[edge_key] = Edge(id=edge_key, start=norm_start,
                                      end=norm_end, weight=float(weight))
+        if weight < 0:
+            self._negative_edges.add(edge_key)
+        self._version += 1
+        self._union(norm_start, norm_end)
+
+    def add_nodes_from(self, nodes: Iterable[Tuple[str, str | None, float, float]],
+                       validate: bool = True) -> int:
+        """Insert ``(node_id, label, x, y)`` tuples in one pass.
+
+        The whole batch is checked before anything is inserted, so a bad
+        item leaves the graph unchanged. Pass ``validate=False`` only for
+        data that has already been validated (e.g. by ``validate_graph_data``).
+        """
+        stored = self._nodes
+        batch: List[Node] = []
+        seen = set()
+        with _gc_paused():
+            for node_id, label, x, y in nodes:
+                if label is None:
+                    label = node_id
+                if validate:
+                    if not isinstance(node_id, str) or not node_id:
+                        raise ValueError("Node id must be a non-empty string.")
+                    if node_id in stored or node_id in seen:
+                        raise ValueError(f"Node '{node_id}' already exists.")
+                    if not isinstance(label, str):
+                        raise ValueError("Node label must be a string.")
+                    seen.add(node_id)
+                batch.append(Node(id=node_id, label=label, x=float(x), y=float(y)))
+
+            next_id = self._next_id
+            for node in batch:
+                node_id = node.id
+                stored[node_id] = node
+                if node_id[:1] == "n" and node_id[1:].isdigit():
+                    next_id = max(next_id, int(node_id[1:]) + 1)
+            self._next_id = next_id
+        self._version += 1
+        # Cheaper to rebuild later than to add every node to the union-find.
+        self._uf_parent = None
+        return len(batch)
+
+    def add_edges_from(self, edges: Iterable[Tuple[str, str, float]],
+                       validate: bool = True) -> int:
+        """Insert ``(start, end, weight)`` tuples in one pass.
+
+        Same rules as ``add_edge``, checked with dict/set lookups for the
+        whole batch before any edge is stored.
+        """
+        nodes = self._nodes
+        stored = self._edges
+        directed = self._directed
+        batch: List[Edge] = []
+        seen = set()
+        with _gc_paused():
+            for start, end, weight in edges:
+                if validate:
+                    if start not in nodes or end not in nodes:
+                        raise ValueError("Both nodes must exist to add an edge.")
+                    if start == end:
+                        raise ValueError("Edge start and end cannot be the same.")
+                    if not isinstance(weight, (int, float)):
+                        raise ValueError("Edge weight must be numeric.")
+                if not directed and end < start:
+                    start, end = end, start
+                # Endpoints are already normalized, so skip edge_id's sort.
+                edge_key = f"{start}->{end}" if directed else f"{start}--{end}"
+                if validate:
+                    if edge_key in stored or edge_key in seen:
+                        raise ValueError("Edge already exists.")
+                    seen.add(edge_key)
+                batch.append(Edge(id=edge_key, start=start, end=end, weight=float(weight)))
+
+            negative = self._negative_edges
+            for edge in batch:
+                stored[edge.id] = edge
+                if edge.weight < 0:
+                    negative.add(edge.id)
+        self._version += 1
+        self._uf_parent = None
+        return len(batch)
+
+    @classmethod
+    def from_arrays(cls, node_ids: Sequence[str], sources: Sequence[str | int],
+                    targets: Sequence[str | int], weights: Sequence[float],
+                    xs: Sequence[float] | None = None, ys: Sequence[float] | None = None,
+                    labels: Sequence[str | None] | None = None, directed: bool = False,
+                    metadata: dict | None = None, validate: bool = True) -> "Graph":
+        """Build a graph from parallel arrays.
+
+        Edge endpoints may be node ids or integer indices into ``node_ids``.
+        """
+        count = len(node_ids)
+        for name, column in (("xs", xs), ("ys", ys), ("labels", labels)):
+            if column is not None and len(column) != count:
+                raise ValueError(f"'{name}' must have one entry per node.")
+        if not (len(sources) == len(targets) == len(weights)):
+            raise ValueError("Edge arrays must have the same length.")
+
+        graph = cls(directed=directed, metadata=metadata)
+        zeros = repeat(0.0)
+        graph.add_nodes_from(zip(node_ids,
+                                 labels if labels is not None else repeat(None),
+                                 xs if xs is not None else zeros,
+                                 ys if ys is not None else zeros), validate=validate)
+
+        def _resolve(endpoints: Sequence[str | int]) -> Sequence[str]:
+            # numbers.Integral also covers NumPy integer scalars, but checking
+            # against the ABC is slow, so plain str and int are tested first.
+            if all(isinstance(value, str) for value in endpoints):
+                return endpoints
+            resolved = []
+            for value in endpoints:
+                if type(value) is int or (not isinstance(value, (str, bool))
+                                          and isinstance(value, numbers.Integral)):
+                    if not 0 <= value < count:
+                        raise ValueError(f"Node index {value} out of range.")
+                    value = node_ids[int(value)]
+                resolved.append(value)
+            return resolved
+
+        graph.add_edges_from(zip(_resolve(sources), _resolve(targets), weights),
+                             validate=validate)
+        return graph
 
     def remove_edge(self, start: str, end: str) -> None:
         norm_start, norm_end = self._normalize_edge(start, end)
@@ -95,6 +280,9 @@ class Graph:
         if edge_key not in self._edges:
             raise ValueError("Edge not found.")
         del self._edges[edge_key]
+        self._negative_edges.discard(edge_key)
+        self._version += 1
+        self._uf_parent = None
 
     def update_edge(self, start: str, end: str, weight: float) -> None:
         if not isinstance(weight, (int, float)):
@@ -106,6 +294,11 @@ class Graph:
         edge = self._edges[edge_key]
         self._edges[edge_key] = Edge(id=edge.id, start=edge.start, end=edge.end,
                                      weight=float(weight))
+        if weight < 0:
+            self._negative_edges.add(edge_key)
+        else:
+            self._negative_edges.discard(edge_key)
+        self._version += 1
 
     def get_neighbors(self, node_id: str) -> List[Tuple[str, float]]:
         if node_id not in self._nodes:
@@ -122,6 +315,16 @@ class Graph:
                     neighbors.append((edge.start, edge.weight))
         return neighbors
 
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self._nodes
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def has_edge(self, start: str, end: str) -> bool:
+        norm_start, norm_end = self._normalize_edge(start, end)
+        return edge_id(norm_start, norm_end, self._directed) in self._edges
+
     def get_nodes(self) -> List[str]:
         return list(self._nodes.keys())
 
@@ -156,6 +359,12 @@ class Graph:
 
         return dict_to_graph(data)
 
+    def freeze(self):
+        from .snapshot import GraphSnapshot
+
+        return GraphSnapshot.from_graph(self)
+
+    @traced("Graph.to_adjacency_dict")
     def to_adjacency_dict(self) -> dict:
         adjacency = {node_id: [] for node_id in self._nodes.keys()}
         for edge in self._edges.values():
@@ -192,6 +401,65 @@ class Graph:
             self._edges = new_edges
 
         self._directed = directed
+        self._negative_edges = {edge.id for edge in self._edges.values() if edge.weight < 0}
+        self._version += 1
+
+    def _find(self, node_id: str) -> str:
+        parent = self._uf_parent
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+        return node_id
+
+    def _union(self, a: str, b: str) -> None:
+        if self._uf_parent is None:
+            return
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a == root_b:
+            return
+        size = self._uf_size
+        if size[root_a] < size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._uf_parent[root_b] = root_a
+        size[root_a] += size[root_b]
+        self._component_count -= 1
+
+    def _build_components(self) -> None:
+        self._uf_parent = {node_id: node_id for node_id in self._nodes}
+        self._uf_size = dict.fromkeys(self._nodes, 1)
+        self._component_count = len(self._nodes)
+        for edge in self._edges.values():
+            self._union(edge.start, edge.end)
+
+    def component_count(self) -> int:
+        """Number of weakly connected components (edge direction ignored)."""
+        if self._uf_parent is None:
+            self._build_components()
+        return self._component_count
+
+    def same_component(self, a: str, b: str) -> bool:
+        if a not in self._nodes or b not in self._nodes:
+            raise ValueError("Both nodes must exist.")
+        if self._uf_parent is None:
+            self._build_components()
+        return self._find(a) == self._find(b)
+
+    def component_index(self) -> ComponentIndex:
+        """Component labels for reachability pruning, rebuilt when the version changes."""
+        cached = self._component_index
+        if cached is None or cached[0] != self._version:
+            index = ComponentIndex.from_edges(
+                self._directed, list(self._nodes),
+                ((edge.start, edge.end) for edge in self._edges.values()))
+            cached = self._component_index = (self._version, index)
+        return cached[1]
+
+    def negative_edges(self) -> List[Edge]:
+        return [self._edges[edge_key] for edge_key in self._negative_edges]
+
+    def has_negative_weights(self) -> bool:
+        return bool(self._negative_edges)
 
     def get_stats(self) -> GraphStats:
         return GraphStats(node_count=len(self._nodes), edge_count=len(self._edges),
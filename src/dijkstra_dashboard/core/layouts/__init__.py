@@ -1,5 +1,43 @@
-from .circle import circle_layout
-from .grid import grid_layout
-from .spring import spring_layout
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["circle_layout", "grid_layout", "spring_layout"]
+_EXPORTS = {
+    "barnes_hut_layout": ".barnes_hut",
+    "circle_layout": ".circle",
+    "compute_layout": ".jobs",
+    "grid_layout": ".grid",
+    "incremental_layout": ".incremental",
+    "LayoutCache": ".cache",
+    "LayoutJob": ".jobs",
+    "multilevel_layout": ".multilevel",
+    "pivot_mds_layout": ".pivot_mds",
+    "spring_layout": ".spring",
+    "vectorized_spring_layout": ".vectorized",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .barnes_hut import barnes_hut_layout
+    from .circle import circle_layout
+    from .grid import grid_layout
+    from .incremental import incremental_layout
+    from .cache import LayoutCache
+    from .jobs import LayoutJob, compute_layout
+    from .multilevel import multilevel_layout
+    from .pivot_mds import pivot_mds_layout
+    from .spring import spring_layout
+    from .vectorized import vectorized_spring_layout
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
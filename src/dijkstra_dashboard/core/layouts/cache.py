@@ -0,0 +1,155 @@
+"""Persistent cache of finished layouts.
+
+Each entry is one JSON file in a cache directory, named by ``layout_key``:
+a digest of the node set, the undirected edge set, the engine name and its
+parameters (``seed`` included). Layouts are deterministic for a given key,
+so a hit can replace a run that would otherwise take seconds to minutes.
+Reads refresh the file's modification time; writes evict the least
+recently used files once the directory grows past ``max_bytes``. The total
+size is kept in memory after the first write, so the directory is only
+listed again when that total crosses the limit. I/O errors are treated as misses, so a read-only or full disk only costs the
+speed-up.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+from ..fileio import atomic_write
+
+Positions = Dict[str, Tuple[float, float]]
+
+DEFAULT_MAX_BYTES = 256 << 20
+CACHE_DIR_ENV = "DIJKSTRA_DASHBOARD_CACHE"
+
+
+def default_cache_dir() -> Path:
+    """``$DIJKSTRA_DASHBOARD_CACHE``, else ``layouts`` under the user cache directory."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "dijkstra-dashboard" / "layouts"
+
+
+def structural_hash(node_ids: Iterable[str], edges: Iterable[Tuple[str, str]]) -> str:
+    """Digest of the node set and the undirected edge set (order and duplicates ignored)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for node_id in sorted(set(node_ids)):
+        digest.update(node_id.encode("utf-8"))
+        digest.update(b"\x1f")
+    digest.update(b"\x1e")
+    for start, end in sorted({(u, v) if u <= v else (v, u) for u, v in edges}):
+        digest.update(f"{start}\x1f{end}\x1e".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def layout_key(node_ids: Iterable[str], edges: Iterable[Tuple[str, str]], layout: str,
+               params: Mapping[str, Any] | None = None) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(structural_hash(node_ids, edges).encode("ascii"))
+    digest.update(f"\x1e{layout}".encode("utf-8"))
+    # repr() keeps unhashable values (e.g. incremental positions) usable.
+    for name, value in sorted((params or {}).items()):
+        digest.update(f"\x1e{name}={value!r}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """Finished layouts stored under ``directory``, at most ``max_bytes`` in total."""
+
+    def __init__(self, directory: str | os.PathLike | None = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("Cache size must be non-negative.")
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes on disk as of the last listing plus our writes since; None
+        # until the first put lists the directory.
+        self._total: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> Positions | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            os.utime(path)
+            return dict(zip(data["ids"], zip(data["x"], data["y"])))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, positions: Mapping[str, Tuple[float, float]]) -> None:
+        if self.max_bytes == 0:
+            return
+        path = self._path(key)
+        # ASCII-only (json's default), so the length is also the size in bytes.
+        text = json.dumps({
+            "ids": list(positions),
+            "x": [x for x, _ in positions.values()],
+            "y": [y for _, y in positions.values()],
+        }, separators=(",", ":"))
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            with atomic_write(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+        except OSError:
+            return
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += len(text) - replaced
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        # Called with the lock held. Other processes may share the directory,
+        # so the recorded total is replaced by a fresh listing here.
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._total = total
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._total = None
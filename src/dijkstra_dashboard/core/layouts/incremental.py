@@ -0,0 +1,182 @@
+"""Warm-start force layout for small edits.
+
+The current positions are the initial state. Only the changed nodes and
+their neighbours within ``hops`` take part in the Fruchterman–Reingold
+iterations; every other node stays pinned (or, with ``frozen_temperature``
+above zero, moves at that fraction of the active step limit). New nodes
+start at the centroid of their placed neighbours. Repulsion only considers
+the 3x3 block of grid cells of side ``2k`` around each moving node, and the
+grid of pinned nodes is built once, so an edit costs time proportional to
+the region around it rather than to the whole graph.
+"""
+import random
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
+
+from .spring import _inverse_distance_sum, spring_layout
+
+# Step limit, relative to k, at the first iteration; the drawing is already
+# close to settled, so it starts cooler than a layout from scratch.
+WARM_TEMPERATURE = 0.5
+
+
+def _natural_length(xs: List[float], ys: List[float], placed: List[bool],
+                    adjacency: List[List[int]], count: int, width: float, height: float) -> float:
+    # Keep the scale of the existing drawing: the spacing its bounding box
+    # gives each placed node (as spring_layout does for its canvas), else the
+    # mean length of its edges when the drawing is a line.
+    px = [x for x, p in zip(xs, placed) if p]
+    py = [y for y, p in zip(ys, placed) if p]
+    area = (max(px) - min(px)) * (max(py) - min(py))
+    if area > 0:
+        return (area / len(px)) ** 0.5
+    total = 0.0
+    lengths = 0
+    for u, neighbors in enumerate(adjacency):
+        if not placed[u]:
+            continue
+        for v in neighbors:
+            if v > u and placed[v]:
+                total += ((xs[u] - xs[v]) ** 2 + (ys[u] - ys[v]) ** 2) ** 0.5
+                lengths += 1
+    if total > 0:
+        return total / lengths
+    return (width * height / count) ** 0.5
+
+
+def incremental_layout(node_ids: Iterable[str],
+                       edges: Iterable[Tuple[str, str]],
+                       positions: Mapping[str, Tuple[float, float]],
+                       changed: Iterable[str] | None = None,
+                       iterations: int = 30,
+                       seed: int = 0,
+                       hops: int = 1,
+                       frozen_temperature: float = 0.0,
+                       width: float = 800.0,
+                       height: float = 600.0,
+                       progress: Callable[..., None] | None = None
+                       ) -> Dict[str, Tuple[float, float]]:
+    """Refine ``positions`` around ``changed`` nodes.
+
+    Nodes missing from ``positions`` are new and always count as changed;
+    ``changed`` defaults to just those. Pinned nodes keep their exact
+    coordinates. Without any existing positions this is ``spring_layout``.
+    """
+    ids = list(node_ids)
+    if not any(node_id in positions for node_id in ids):
+        return spring_layout(ids, edges, iterations=iterations, seed=seed,
+                             width=width, height=height, progress=progress)
+
+    count = len(ids)
+    index = {node_id: idx for idx, node_id in enumerate(ids)}
+    adjacency: List[List[int]] = [[] for _ in ids]
+    for u, v in edges:
+        a = index.get(u)
+        b = index.get(v)
+        if a is None or b is None or a == b:
+            continue
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+
+    xs = [0.0] * count
+    ys = [0.0] * count
+    placed = [False] * count
+    for idx, node_id in enumerate(ids):
+        position = positions.get(node_id)
+        if position is not None:
+            xs[idx] = float(position[0])
+            ys[idx] = float(position[1])
+            placed[idx] = True
+
+    seeds = {index[node_id] for node_id in (changed or ()) if node_id in index}
+    seeds.update(idx for idx in range(count) if not placed[idx])
+    if not seeds:
+        return {node_id: (xs[i], ys[i]) for i, node_id in enumerate(ids)}
+
+    rng = random.Random(seed)
+    k = _natural_length(xs, ys, placed, adjacency, count, width, height)
+
+    # New nodes grow inward from the placed part of the graph; each starts
+    # at the centroid of its placed neighbours.
+    unplaced = [idx for idx in range(count) if not placed[idx]]
+    queue = deque(idx for idx in unplaced if any(placed[j] for j in adjacency[idx]))
+    while queue:
+        v = queue.popleft()
+        if placed[v]:
+            continue
+        anchors = [j for j in adjacency[v] if placed[j]]
+        xs[v] = sum(xs[j] for j in anchors) / len(anchors) + rng.uniform(-k / 2, k / 2)
+        ys[v] = sum(ys[j] for j in anchors) / len(anchors) + rng.uniform(-k / 2, k / 2)
+        placed[v] = True
+        queue.extend(j for j in adjacency[v] if not placed[j])
+    px = [x for x, p in zip(xs, placed) if p]
+    py = [y for y, p in zip(ys, placed) if p]
+    left, right, top, bottom = min(px), max(px), min(py), max(py)
+    for idx in unplaced:
+        if not placed[idx]:
+            xs[idx] = rng.uniform(left, right)
+            ys[idx] = rng.uniform(top, bottom)
+
+    active = set(seeds)
+    frontier = list(seeds)
+    for _ in range(hops):
+        frontier = [j for i in frontier for j in adjacency[i] if j not in active]
+        active.update(frontier)
+    if frozen_temperature > 0:
+        movers = list(range(count))
+        scale = [1.0 if idx in active else frozen_temperature for idx in movers]
+    else:
+        movers = sorted(active)
+        scale = [1.0] * len(movers)
+    moving = set(movers)
+
+    k2 = k * k
+    cell = 2 * k
+    pinned_grid: Dict[Tuple[int, int], List[complex]] = {}
+    for idx in range(count):
+        if idx not in moving:
+            pinned_grid.setdefault((int(xs[idx] // cell), int(ys[idx] // cell)),
+                                   []).append(complex(xs[idx], ys[idx]))
+
+    for t in range(iterations):
+        grid: Dict[Tuple[int, int], List[complex]] = {}
+        for idx in movers:
+            grid.setdefault((int(xs[idx] // cell), int(ys[idx] // cell)),
+                            []).append(complex(xs[idx], ys[idx]))
+        disp_x = []
+        disp_y = []
+        for idx in movers:
+            w = complex(xs[idx], ys[idx])
+            gx = int(xs[idx] // cell)
+            gy = int(ys[idx] // cell)
+            total = 0j
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    key = (gx + ox, gy + oy)
+                    total += _inverse_distance_sum(w, pinned_grid.get(key, ()))
+                    total += _inverse_distance_sum(w, grid.get(key, ()))
+            dx_total = total.real * k2
+            dy_total = -total.imag * k2
+            for j in adjacency[idx]:
+                dx = xs[idx] - xs[j]
+                dy = ys[idx] - ys[j]
+                pull = (dx * dx + dy * dy) ** 0.5 / k
+                dx_total -= dx * pull
+                dy_total -= dy * pull
+            disp_x.append(dx_total)
+            disp_y.append(dy_total)
+
+        limit = WARM_TEMPERATURE * max(0.1, (iterations - t) / iterations) * k
+        for slot, idx in enumerate(movers):
+            dx = disp_x[slot]
+            dy = disp_y[slot]
+            dist = (dx * dx + dy * dy) ** 0.5 or 0.01
+            step = min(dist, limit * scale[slot]) / dist
+            xs[idx] += dx * step
+            ys[idx] += dy * step
+
+        if progress is not None:
+            progress(t + 1, iterations,
+                     lambda: {node_id: (xs[i], ys[i]) for i, node_id in enumerate(ids)})
+
+    return {node_id: (xs[i], ys[i]) for i, node_id in enumerate(ids)}
@@ -0,0 +1,176 @@
+"""Run layout engines off the UI thread and stream their frames.
+
+A ``LayoutJob`` calls one ``core.layouts`` engine on a daemon thread. Engines
+that take a ``progress`` hook report after every iteration; the job turns at
+most ``fps`` of those reports per second into position frames for
+``on_frame``, so a viewer can animate the layout without copying positions
+on every iteration. Cancelling raises inside the engine's next report and
+unwinds it. Finished layouts are kept in a small in-memory LRU and, when a
+``LayoutCache`` is given, on disk, both keyed by ``layout_key``.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Mapping, Tuple
+
+from ..cache import LRUCache
+from .cache import LayoutCache, Positions, layout_key
+
+RESULT_CACHE_SIZE = 16
+# Engines that take a ``progress`` hook, and the ones that only take node ids.
+PROGRESSIVE_LAYOUTS = frozenset({"spring", "barnes_hut", "vectorized_spring", "multilevel",
+                                 "incremental", "pivot_mds"})
+NODE_ONLY_LAYOUTS = frozenset({"circle", "grid"})
+
+_results = LRUCache(RESULT_CACHE_SIZE)
+_results_lock = threading.Lock()
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _engine(name: str) -> Callable[..., Positions]:
+    from .. import layouts
+
+    try:
+        return getattr(layouts, f"{name}_layout")
+    except AttributeError:
+        raise ValueError(f"Unknown layout: {name}") from None
+
+
+def clear_cache() -> None:
+    with _results_lock:
+        _results.clear()
+
+
+class LayoutJob:
+    """One layout run on a background thread.
+
+    ``on_frame(positions)``, ``on_done(positions)`` and ``on_error(exc)`` are
+    called on the worker thread; Qt callers forward them through signals.
+    A cancelled job stops at the engine's next iteration and reports
+    nothing more, apart from a frame that was already being delivered.
+    """
+
+    def __init__(self, layout: str, node_ids: Iterable[str],
+                 edges: Iterable[Tuple[str, str]] = (),
+                 params: Mapping[str, Any] | None = None,
+                 fps: float = 30.0,
+                 on_frame: Callable[[Positions], Any] | None = None,
+                 on_done: Callable[[Positions], Any] | None = None,
+                 on_error: Callable[[Exception], Any] | None = None,
+                 cache: LayoutCache | None = None):
+        if fps <= 0:
+            raise ValueError("Frame rate must be positive.")
+        self.layout = layout
+        self._engine = _engine(layout)
+        self._node_ids: List[str] = list(node_ids)
+        self._edges: List[Tuple[str, str]] = [(start, end) for start, end in edges]
+        self._params = dict(params or {})
+        self._interval = 1.0 / fps
+        self._on_frame = on_frame
+        self._on_done = on_done
+        self._on_error = on_error
+        self._cache = cache
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_frame = float("-inf")
+        self.result: Positions | None = None
+        self.error: Exception | None = None
+        self.frames = 0
+
+    @property
+    def key(self) -> str:
+        return layout_key(self._node_ids, self._edges, self.layout, self._params)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    def start(self) -> "LayoutJob":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name=f"layout-{self.layout}",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def run(self) -> None:
+        """Compute the layout on the calling thread (``start`` runs this on a worker)."""
+        try:
+            key = self.key
+            with _results_lock:
+                cached = _results.get(key)
+            if cached is None and self._cache is not None:
+                cached = self._cache.get(key)
+                if cached is not None and set(cached) != set(self._node_ids):
+                    cached = None
+                if cached is not None:
+                    with _results_lock:
+                        _results.put(key, dict(cached))
+            if cached is not None:
+                self._finish(dict(cached))
+                return
+            positions = self._compute()
+            with _results_lock:
+                _results.put(key, dict(positions))
+            if self._cache is not None:
+                self._cache.put(key, positions)
+            self._finish(positions)
+        except _Cancelled:
+            pass
+        except Exception as exc:
+            self.error = exc
+            if self._on_error is not None and not self.cancelled:
+                self._on_error(exc)
+        finally:
+            self._finished.set()
+
+    def _compute(self) -> Positions:
+        if self.layout in NODE_ONLY_LAYOUTS:
+            return self._engine(self._node_ids, **self._params)
+        if self.layout in PROGRESSIVE_LAYOUTS:
+            return self._engine(self._node_ids, self._edges, progress=self._progress,
+                                **self._params)
+        return self._engine(self._node_ids, self._edges, **self._params)
+
+    def _progress(self, done: int, total: int, frame: Callable[[], Positions]) -> None:
+        if self._cancel.is_set():
+            raise _Cancelled
+        if self._on_frame is None or done >= total:
+            return
+        now = time.monotonic()
+        if now - self._last_frame >= self._interval:
+            self._last_frame = now
+            self.frames += 1
+            self._on_frame(frame())
+
+    def _finish(self, positions: Positions) -> None:
+        if self.cancelled:
+            return
+        self.result = positions
+        if self._on_done is not None:
+            self._on_done(positions)
+
+
+def compute_layout(layout: str, node_ids: Iterable[str],
+                   edges: Iterable[Tuple[str, str]] = (),
+                   params: Mapping[str, Any] | None = None,
+                   cache: LayoutCache | None = None) -> Positions:
+    """Run ``layout`` on the calling thread, reusing cached results."""
+    job = LayoutJob(layout, node_ids, edges, params, cache=cache)
+    job.run()
+    if job.error is not None:
+        raise job.error
+    return job.result
@@ -0,0 +1,227 @@
+"""Multilevel force-directed layout for very large graphs.
+
+In the style of Walshaw's multilevel Fruchterman–Reingold:
+
+1. Coarsen: repeatedly contract a maximal matching (each node pairs with
+   its lightest unmatched neighbour, visited in seeded random order) until
+   at most ``COARSEST_SIZE`` nodes remain or a level stops shrinking.
+2. Lay out the coarsest graph from random positions.
+3. Prolong: every node starts at its coarse parent's position (plus a small
+   seeded jitter) and the level is refined at a lower temperature.
+
+Repulsion only considers nodes in the 3x3 block of grid cells of side
+``2k`` around each node, so one iteration is O(V + E) at every level as
+long as the layout spreads out (meshes, road networks, sparse planar-ish
+graphs). Expander-like graphs stay dense and cost more per iteration.
+"""
+import random
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .spring import _inverse_distance_sum
+
+COARSEST_SIZE = 64
+# Stop coarsening once a level keeps more than this share of its nodes
+# (stars and isolated nodes barely contract).
+MIN_REDUCTION = 0.8
+# Starting temperature, relative to k, when refining a prolonged level.
+REFINE_TEMPERATURE = 0.3
+
+
+class _Level:
+    __slots__ = ("mass", "sources", "targets", "weights", "parent")
+
+    def __init__(self, mass: List[float], sources: List[int], targets: List[int],
+                 weights: List[float]):
+        self.mass = mass
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+        self.parent: List[int] | None = None
+
+
+def _coarsen(level: _Level, rng: random.Random) -> _Level:
+    count = len(level.mass)
+    degree = [0] * (count + 1)
+    for u, v in zip(level.sources, level.targets):
+        degree[u + 1] += 1
+        degree[v + 1] += 1
+    for i in range(count):
+        degree[i + 1] += degree[i]
+    offsets = degree
+    neighbors = [0] * offsets[count]
+    cursor = offsets[:-1]
+    for u, v in zip(level.sources, level.targets):
+        neighbors[cursor[u]] = v
+        cursor[u] += 1
+        neighbors[cursor[v]] = u
+        cursor[v] += 1
+
+    mass = level.mass
+    parent = [-1] * count
+    order = list(range(count))
+    rng.shuffle(order)
+    coarse_mass: List[float] = []
+    for u in order:
+        if parent[u] != -1:
+            continue
+        match = -1
+        for i in range(offsets[u], offsets[u + 1]):
+            v = neighbors[i]
+            if parent[v] == -1 and v != u and (match == -1 or mass[v] < mass[match]):
+                match = v
+        parent[u] = len(coarse_mass)
+        if match == -1:
+            coarse_mass.append(mass[u])
+        else:
+            parent[match] = parent[u]
+            coarse_mass.append(mass[u] + mass[match])
+    level.parent = parent
+
+    merged: Dict[int, float] = {}
+    coarse_count = len(coarse_mass)
+    for u, v, weight in zip(level.sources, level.targets, level.weights):
+        a = parent[u]
+        b = parent[v]
+        if a == b:
+            continue
+        key = a * coarse_count + b if a < b else b * coarse_count + a
+        merged[key] = merged.get(key, 0.0) + weight
+    sources = [key // coarse_count for key in merged]
+    targets = [key % coarse_count for key in merged]
+    return _Level(coarse_mass, sources, targets, list(merged.values()))
+
+
+def _refine(xs: List[float], ys: List[float], level: _Level, k: float, iterations: int,
+            temperature: float, width: float, height: float,
+            on_iteration: Callable[[], None] | None = None) -> None:
+    count = len(xs)
+    mass = level.mass
+    k2 = k * k
+    cell = 2 * k
+    edges = list(zip(level.sources, level.targets, level.weights))
+    for t in range(iterations):
+        disp_x = [0.0] * count
+        disp_y = [0.0] * count
+        points = [complex(x, y) for x, y in zip(xs, ys)]
+
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for i in range(count):
+            grid.setdefault((int(xs[i] // cell), int(ys[i] // cell)), []).append(i)
+        for (gx, gy), members in grid.items():
+            near_z: List[complex] = []
+            near_m: List[float] = []
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    for j in grid.get((gx + ox, gy + oy), ()):
+                        near_z.append(points[j])
+                        near_m.append(mass[j])
+            for i in members:
+                total = _inverse_distance_sum(points[i], near_z, near_m)
+                disp_x[i] += total.real * k2
+                disp_y[i] -= total.imag * k2
+
+        for u, v, weight in edges:
+            dx = xs[u] - xs[v]
+            dy = ys[u] - ys[v]
+            scale = (dx * dx + dy * dy) ** 0.5 / k * weight
+            disp_x[u] -= dx * scale
+            disp_y[u] -= dy * scale
+            disp_x[v] += dx * scale
+            disp_y[v] += dy * scale
+
+        limit = temperature * max(0.1, (iterations - t) / iterations) * k
+        for i in range(count):
+            dx = disp_x[i]
+            dy = disp_y[i]
+            dist = (dx * dx + dy * dy) ** 0.5 or 0.01
+            step = min(dist, limit) / dist
+            xs[i] = min(width, max(0.0, xs[i] + dx * step))
+            ys[i] = min(height, max(0.0, ys[i] + dy * step))
+        if on_iteration is not None:
+            on_iteration()
+
+
+def multilevel_layout(node_ids: Iterable[str],
+                      edges: Iterable[Tuple[str, str]],
+                      iterations: int = 50,
+                      seed: int = 0,
+                      width: float = 800.0,
+                      height: float = 600.0,
+                      progress: Callable[..., None] | None = None) -> Dict[str, Tuple[float, float]]:
+    """Same inputs and output as ``spring_layout``.
+
+    ``iterations`` applies to the coarsest level; each finer level is
+    refined for a quarter of that (at least 3). Frames passed to
+    ``progress`` place every node at its current coarse representative.
+    """
+    ids = list(node_ids)
+    if not ids:
+        return {}
+
+    rng = random.Random(seed)
+    index = {node_id: idx for idx, node_id in enumerate(ids)}
+    seen = set()
+    sources: List[int] = []
+    targets: List[int] = []
+    for u, v in edges:
+        a = index.get(u)
+        b = index.get(v)
+        if a is None or b is None or a == b:
+            continue
+        key = (a, b) if a < b else (b, a)
+        if key not in seen:
+            seen.add(key)
+            sources.append(key[0])
+            targets.append(key[1])
+    del seen
+
+    levels = [_Level([1.0] * len(ids), sources, targets, [1.0] * len(sources))]
+    while len(levels[-1].mass) > COARSEST_SIZE:
+        coarse = _coarsen(levels[-1], rng)
+        if len(coarse.mass) > MIN_REDUCTION * len(levels[-1].mass):
+            levels[-1].parent = None
+            break
+        levels.append(coarse)
+
+    area = width * height
+    refine_iterations = max(3, iterations // 4)
+    total = iterations + refine_iterations * (len(levels) - 1)
+    done = 0
+
+    def frame(depth: int) -> Dict[str, Tuple[float, float]]:
+        owner = list(range(len(ids)))
+        for level in levels[:depth]:
+            parent = level.parent
+            owner = [parent[i] for i in owner]
+        return {node_id: (xs[owner[i]] - width / 2, ys[owner[i]] - height / 2)
+                for i, node_id in enumerate(ids)}
+
+    def reporter(depth: int) -> Callable[[], None] | None:
+        if progress is None:
+            return None
+
+        def report() -> None:
+            nonlocal done
+            done += 1
+            progress(done, total, lambda: frame(depth))
+        return report
+
+    coarsest = levels[-1]
+    xs = [rng.uniform(0, width) for _ in coarsest.mass]
+    ys = [rng.uniform(0, height) for _ in coarsest.mass]
+    _refine(xs, ys, coarsest, (area / len(xs)) ** 0.5, iterations, 1.0, width, height,
+            reporter(len(levels) - 1))
+
+    for depth in range(len(levels) - 2, -1, -1):
+        level = levels[depth]
+        k = (area / len(level.mass)) ** 0.5
+        jitter = k / 10
+        parent = level.parent
+        xs = [xs[p] + rng.uniform(-jitter, jitter) for p in parent]
+        ys = [ys[p] + rng.uniform(-jitter, jitter) for p in parent]
+        _refine(xs, ys, level, k, refine_iterations, REFINE_TEMPERATURE, width, height,
+                reporter(depth))
+
+    center_x = width / 2
+    center_y = height / 2
+    return {node_id: (xs[i] - center_x, ys[i] - center_y) for i, node_id in enumerate(ids)}
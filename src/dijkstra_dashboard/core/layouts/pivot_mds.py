@@ -0,0 +1,202 @@
+"""Pivot MDS (Brandes & Pich) with optional sparse stress refinement.
+
+``pivots`` nodes are chosen max-min (each one farthest in hops from those
+already chosen) and a BFS from each gives an ``n x k`` matrix of graph
+distances, O(k (V + E)) in total. Double-centering its squares and taking
+the two leading eigenvectors of the ``k x k`` matrix ``C^T C`` by power
+iteration gives the coordinates ``C v``.
+
+``stress_iterations`` then runs localized stress majorization against a
+sparse set of terms: every edge (target length 1) plus every pivot, each
+pivot weighted by the number of nodes closest to it so that it stands in
+for its region. Rows are processed in blocks of ``BLOCK_ELEMENTS`` pair
+terms, so memory stays bounded on large graphs.
+"""
+import random
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+BLOCK_ELEMENTS = 1 << 20
+POWER_ITERATIONS = 200
+POWER_TOLERANCE = 1e-10
+
+
+def _bfs(adjacency: List[List[int]], source: int) -> List[int]:
+    dist = [-1] * len(adjacency)
+    dist[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        reached = []
+        for u in frontier:
+            for v in adjacency[u]:
+                if dist[v] < 0:
+                    dist[v] = depth
+                    reached.append(v)
+        frontier = reached
+    return dist
+
+
+def _pivot_distances(adjacency: List[List[int]], pivots: int,
+                     rng: random.Random) -> Tuple[np.ndarray, List[int]]:
+    count = len(adjacency)
+    chosen: List[int] = []
+    columns: List[np.ndarray] = []
+    nearest = np.full(count, np.inf)
+    pivot = rng.randrange(count)
+    while len(chosen) < pivots:
+        row = np.array(_bfs(adjacency, pivot), dtype=np.float64)
+        # Other components count as one hop beyond this one's eccentricity,
+        # which also steers the next pivots into them.
+        row[row < 0] = row.max() + 1
+        chosen.append(pivot)
+        columns.append(row)
+        np.minimum(nearest, row, out=nearest)
+        pivot = int(np.argmax(nearest))
+        if nearest[pivot] == 0:
+            break
+    return np.column_stack(columns), chosen
+
+
+def _leading_vectors(matrix: np.ndarray, dims: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors: List[np.ndarray] = []
+    for _ in range(dims):
+        vector = rng.standard_normal(matrix.shape[0])
+        for _ in range(POWER_ITERATIONS):
+            for found in vectors:
+                vector -= (vector @ found) * found
+            nxt = matrix @ vector
+            norm = np.linalg.norm(nxt)
+            if norm == 0.0:
+                break
+            nxt /= norm
+            converged = abs(nxt @ vector) > 1 - POWER_TOLERANCE
+            vector = nxt
+            if converged:
+                break
+        norm = np.linalg.norm(vector)
+        vectors.append(vector / norm if norm else vector)
+    return np.column_stack(vectors)
+
+
+def _pivot_terms(pos: np.ndarray, dist: np.ndarray, pivots: List[int], weight: np.ndarray,
+                 start: int, stop: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float]:
+    # Weighted sums of x_p + d * (x_i - x_p) / |x_i - x_p| over the pivots,
+    # their total weight, and the stress-optimal scale terms for this block.
+    anchor = pos[pivots]
+    d = dist[start:stop]
+    dx = pos[start:stop, 0, None] - anchor[None, :, 0]
+    dy = pos[start:stop, 1, None] - anchor[None, :, 1]
+    length = np.sqrt(dx * dx + dy * dy)
+    w = np.where(d > 0, weight[None, :] / np.maximum(d, 1.0) ** 2, 0.0)
+    ratio = np.divide(d, length, out=np.zeros_like(length), where=length > 0)
+    num_x = (w * (anchor[None, :, 0] + dx * ratio)).sum(axis=1)
+    num_y = (w * (anchor[None, :, 1] + dy * ratio)).sum(axis=1)
+    return num_x, num_y, w.sum(axis=1), float((d * length).sum()), float((length * length).sum())
+
+
+def _stress_step(pos: np.ndarray, dist: np.ndarray, pivots: List[int], weight: np.ndarray,
+                 sources: np.ndarray, targets: np.ndarray, degree: np.ndarray) -> np.ndarray:
+    count = len(pos)
+    num = np.zeros_like(pos)
+    den = degree.astype(np.float64)
+    block = max(1, BLOCK_ELEMENTS // len(pivots))
+    for start in range(0, count, block):
+        stop = min(count, start + block)
+        num_x, num_y, total, _, _ = _pivot_terms(pos, dist, pivots, weight, start, stop)
+        num[start:stop, 0] += num_x
+        num[start:stop, 1] += num_y
+        den[start:stop] += total
+
+    if len(sources):
+        delta = pos[sources] - pos[targets]
+        length = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        unit = np.divide(delta, length[:, None], out=np.zeros_like(delta),
+                         where=length[:, None] > 0)
+        for axis in (0, 1):
+            num[:, axis] += np.bincount(sources, pos[targets, axis] + unit[:, axis], count)
+            num[:, axis] += np.bincount(targets, pos[sources, axis] - unit[:, axis], count)
+    # A node with no terms (a lone pivot) keeps its place.
+    return np.where(den[:, None] > 0, num / np.where(den > 0, den, 1.0)[:, None], pos)
+
+
+def _fit(ids: List[str], pos: np.ndarray, width: float,
+         height: float) -> Dict[str, Tuple[float, float]]:
+    low = pos.min(axis=0)
+    span = pos.max(axis=0) - low
+    scale = min(width / span[0] if span[0] else np.inf,
+                height / span[1] if span[1] else np.inf)
+    if not np.isfinite(scale):
+        scale = 1.0
+    centered = (pos - (low + span / 2)) * scale
+    return {node_id: (x, y) for node_id, (x, y) in zip(ids, centered.tolist())}
+
+
+def pivot_mds_layout(node_ids: Iterable[str],
+                     edges: Iterable[Tuple[str, str]],
+                     pivots: int = 50,
+                     seed: int = 0,
+                     width: float = 800.0,
+                     height: float = 600.0,
+                     stress_iterations: int = 0,
+                     progress: Callable[..., None] | None = None
+                     ) -> Dict[str, Tuple[float, float]]:
+    """Lay out by hop distances; the result fills ``width`` x ``height`` around the origin.
+
+    ``progress`` is called once per stress iteration.
+    """
+    ids = list(node_ids)
+    count = len(ids)
+    if count == 0:
+        return {}
+    if count == 1:
+        return {ids[0]: (0.0, 0.0)}
+
+    index = {node_id: idx for idx, node_id in enumerate(ids)}
+    adjacency: List[List[int]] = [[] for _ in ids]
+    pairs = set()
+    for u, v in edges:
+        a = index.get(u)
+        b = index.get(v)
+        if a is None or b is None or a == b:
+            continue
+        key = (a, b) if a < b else (b, a)
+        if key not in pairs:
+            pairs.add(key)
+            adjacency[a].append(b)
+            adjacency[b].append(a)
+
+    dist, chosen = _pivot_distances(adjacency, max(2, min(pivots, count)), random.Random(seed))
+    squared = dist * dist
+    centered = -0.5 * (squared - squared.mean(axis=0) - squared.mean(axis=1)[:, None]
+                       + squared.mean())
+    pos = centered @ _leading_vectors(centered.T @ centered, 2, seed)
+
+    if stress_iterations > 0:
+        edge_array = np.array(sorted(pairs), dtype=np.intp).reshape(-1, 2)
+        sources = edge_array[:, 0]
+        targets = edge_array[:, 1]
+        degree = np.bincount(edge_array.ravel(), minlength=count)
+        region = np.bincount(np.argmin(dist, axis=1), minlength=len(chosen)).astype(np.float64)
+
+        # Bring the MDS coordinates to hop units (the stress-optimal scale
+        # against the pivot distances) before majorizing.
+        block = max(1, BLOCK_ELEMENTS // len(chosen))
+        dot = norm = 0.0
+        for start in range(0, count, block):
+            *_, block_dot, block_norm = _pivot_terms(pos, dist, chosen, region, start,
+                                                     min(count, start + block))
+            dot += block_dot
+            norm += block_norm
+        if norm > 0:
+            pos *= dot / norm
+
+        for t in range(stress_iterations):
+            pos = _stress_step(pos, dist, chosen, region, sources, targets, degree)
+            if progress is not None:
+                progress(t + 1, stress_iterations, lambda: _fit(ids, pos, width, height))
+
+    return _fit(ids, pos, width, height)
@@ -1,16 +1,88 @@
 import random
-from typing import Dict, Iterable, Tuple
+from typing import Callable, Dict, Iterable, Tuple
+
+SPRING_METHODS = ("exact", "vectorized", "barnes_hut", "auto")
+DEFAULT_ITERATIONS = 50
+# method="auto" (the default) runs the exact O(n^2) loop in Python up to
+# EXACT_MAX_NODES. With NumPy installed it runs vectorized between
+# VECTORIZED_MIN_NODES (below which the import is not worth it) and
+# VECTORIZED_MAX_NODES. Anything larger uses the Barnes–Hut approximation.
+# All of them take the same inputs.
+EXACT_MAX_NODES = 1000
+VECTORIZED_MIN_NODES = 200
+VECTORIZED_MAX_NODES = 5000
+
+
+def _numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _inverse_distance_sum(w: complex, points: Iterable[complex],
+                          masses: Iterable[float] | None = None) -> complex:
+    """Sum ``m / (w - z)`` over ``points`` (``m`` = 1 without masses), skipping ``z == w``.
+
+    In complex form 1 / (w - z) == (dx - i*dy) / d^2, so one division gives
+    both components of the inverse-distance repulsion on ``w``: the x force
+    is ``k2 * total.real`` and the y force is ``-k2 * total.imag``.
+    """
+    total = 0j
+    if masses is None:
+        for z in points:
+            d = w - z
+            if d:
+                total += 1 / d
+    else:
+        for z, m in zip(points, masses):
+            d = w - z
+            if d:
+                total += m / d
+    return total
 
 
 def spring_layout(node_ids: Iterable[str],
                   edges: Iterable[Tuple[str, str]],
-                  iterations: int = 50,
+                  iterations: int | None = None,
                   seed: int = 0,
                   width: float = 800.0,
-                  height: float = 600.0) -> Dict[str, Tuple[float, float]]:
+                  height: float = 600.0,
+                  progress: Callable[..., None] | None = None,
+                  method: str = "auto") -> Dict[str, Tuple[float, float]]:
+    """Fruchterman–Reingold force-directed layout centred on the origin.
+
+    ``progress(done, total, frame)`` is called after every iteration, where
+    ``frame()`` returns the current positions (only valid during the call).
+    ``method`` picks the implementation: the pure-Python ``"exact"`` loop,
+    NumPy ``"vectorized"``, the ``"barnes_hut"`` approximation, or
+    ``"auto"`` (the default) to choose by graph size. ``iterations``
+    defaults to ``DEFAULT_ITERATIONS``, or Barnes–Hut's own default.
+    """
+    if method not in SPRING_METHODS:
+        raise ValueError(f"Unknown spring layout method: {method}")
     ids = list(node_ids)
     if not ids:
         return {}
+    count = len(ids)
+    if method == "auto":
+        if VECTORIZED_MIN_NODES <= count <= VECTORIZED_MAX_NODES and _numpy_available():
+            method = "vectorized"
+        elif count > EXACT_MAX_NODES:
+            method = "barnes_hut"
+    if method == "barnes_hut":
+        from .barnes_hut import barnes_hut_layout
+
+        return barnes_hut_layout(ids, edges, iterations=iterations, seed=seed,
+                                 width=width, height=height, progress=progress)
+    if iterations is None:
+        iterations = DEFAULT_ITERATIONS
+    if method == "vectorized":
+        from .vectorized import vectorized_spring_layout
+
+        return vectorized_spring_layout(ids, edges, iterations=iterations, seed=seed,
+                                        width=width, height=height, progress=progress)
 
     rng = random.Random(seed)
     positions = {
@@ -66,6 +138,10 @@ def spring_layout(node_ids: Iterable[str],
             y = min(height, max(0.0, y + (dy / dist) * min(dist, temp * k)))
             positions[node_id] = (x, y)
 
+        if progress is not None:
+            progress(t + 1, iterations, lambda: {
+                node_id: (x - width / 2, y - height / 2) for node_id, (x, y) in positions.items()})
+
     center_x = width / 2
     center_y = height / 2
     for node_id, (x, y) in positions.items():
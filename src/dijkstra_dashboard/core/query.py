@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Iterable
+
+from .algorithms.registry import get_algorithm, select_algorithm
+from .errors import AlgorithmError
+
+INF = float("inf")
+
+
+def _finite(value: float | None) -> float | None:
+    if value is None or value == INF:
+        return None
+    return value
+
+
+def _require(params: dict, name: str) -> Any:
+    value = params.get(name)
+    if value is None:
+        raise AlgorithmError(f"Missing required parameter: {name}")
+    return value
+
+
+def _engine(graph):
+    return get_algorithm(select_algorithm(graph))()
+
+
+def route(graph, start: str, target: str, stats: bool = False) -> Dict[str, Any]:
+    if not graph.has_node(target):
+        raise AlgorithmError(f"Target node '{target}' not found.")
+    result = _engine(graph).solve(graph, {"start": start, "target": target,
+                                          "collect_stats": stats})
+    response = {
+        "start": start,
+        "target": target,
+        "distance": _finite(result.distance),
+        "path": result.path,
+    }
+    if result.stats is not None:
+        response["stats"] = asdict(result.stats)
+    return response
+
+
+def matrix(graph, sources: Iterable[str],
+           targets: Iterable[str] | None = None) -> Dict[str, Any]:
+    sources = list(sources)
+    targets = list(sources if targets is None else targets)
+    algorithm = _engine(graph)
+    rows = []
+    for source in sources:
+        distances = algorithm.solve(graph, {"start": source}).distances
+        for target in targets:
+            if target not in distances:
+                raise AlgorithmError(f"Target node '{target}' not found.")
+        rows.append([_finite(distances[target]) for target in targets])
+    return {"sources": sources, "targets": targets, "distances": rows}
+
+
+def isochrone(graph, start: str, max_distance: float) -> Dict[str, Any]:
+    if not isinstance(max_distance, (int, float)) or max_distance < 0:
+        raise AlgorithmError("max_distance must be a non-negative number.")
+    result = _engine(graph).solve(graph, {"start": start,
+                                          "max_distance": max_distance})
+    nodes = {node: dist for node, dist in result.distances.items()
+             if dist <= max_distance}
+    return {"start": start, "max_distance": max_distance, "nodes": nodes}
+
+
+def _route(graph, params: dict) -> Dict[str, Any]:
+    return route(graph, _require(params, "start"), _require(params, "target"),
+                 stats=bool(params.get("stats")))
+
+
+def _matrix(graph, params: dict) -> Dict[str, Any]:
+    sources = _require(params, "sources")
+    targets = params.get("targets")
+    if not isinstance(sources, list) or (targets is not None and not isinstance(targets, list)):
+        raise AlgorithmError("Matrix 'sources' and 'targets' must be lists.")
+    return matrix(graph, sources, targets)
+
+
+def _isochrone(graph, params: dict) -> Dict[str, Any]:
+    return isochrone(graph, _require(params, "start"), _require(params, "max_distance"))
+
+
+QUERY_KINDS: Dict[str, Callable[[Any, dict], Dict[str, Any]]] = {
+    "route": _route,
+    "matrix": _matrix,
+    "isochrone": _isochrone,
+}
+
+
+def run_query(graph, kind: str, params: dict) -> Dict[str, Any]:
+    handler = QUERY_KINDS.get(kind)
+    if handler is None:
+        raise AlgorithmError(f"Unknown query kind: {kind}")
+    if not isinstance(params, dict):
+        raise AlgorithmError("Query parameters must be an object.")
+    return handler(graph, params)
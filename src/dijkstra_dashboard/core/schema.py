@@ -1,21 +1,37 @@
 from typing import Any, Dict
 
 GRAPH_SCHEMA_VERSION = 1
+# Version 2 stores nodes and edges as parallel arrays with integer endpoints.
+COLUMNAR_SCHEMA_VERSION = 2
+SUPPORTED_SCHEMA_VERSIONS = (GRAPH_SCHEMA_VERSION, COLUMNAR_SCHEMA_VERSION)
+NODE_COLUMNS = ("node_ids", "x", "y", "labels")
+EDGE_COLUMNS = ("edge_src", "edge_dst", "weights")
+
+# Binary CSR format (see core.binary); bump the version on any layout change.
+BINARY_MAGIC = b"DJKGRAPH"
+BINARY_FORMAT_VERSION = 1
 
 
 def edge_id(start: str, end: str, directed: bool) -> str:
     if directed:
         return f"{start}->{end}"
-    ordered = sorted([start, end])
-    return f"{ordered[0]}--{ordered[1]}"
+    if start > end:
+        start, end = end, start
+    return f"{start}--{end}"
 
 
 def new_graph_dict(directed: bool = False,
-                   metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    return {
-        "version": GRAPH_SCHEMA_VERSION,
+                   metadata: Dict[str, Any] | None = None,
+                   version: int = GRAPH_SCHEMA_VERSION) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "version": version,
         "directed": directed,
         "metadata": metadata or {},
-        "nodes": {},
-        "edges": [],
     }
+    if version == COLUMNAR_SCHEMA_VERSION:
+        for column in NODE_COLUMNS + EDGE_COLUMNS:
+            data[column] = []
+    else:
+        data["nodes"] = {}
+        data["edges"] = []
+    return data
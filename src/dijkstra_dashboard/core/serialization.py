@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import io
+import os
+from array import array
+from typing import IO, Any, Dict, Iterator, List, Sequence, Tuple
 
 from .errors import ValidationError
-from .schema import GRAPH_SCHEMA_VERSION, new_graph_dict
-from .validation import validate_graph_data
+from .schema import COLUMNAR_SCHEMA_VERSION, GRAPH_SCHEMA_VERSION, new_graph_dict
+from .validation import _issue, validate_graph_data
 from .graph import Graph
+from .streaming import ProgressCallback, open_input, read_graph_file
+from .tracing import traced
 
 
-def graph_to_dict(graph: Graph) -> Dict[str, Any]:
+def graph_to_dict(graph: Graph, version: int = GRAPH_SCHEMA_VERSION) -> Dict[str, Any]:
+    if version == COLUMNAR_SCHEMA_VERSION:
+        return _graph_to_columns(graph)
+    if version != GRAPH_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported graph version: {version}")
+
     data = new_graph_dict(directed=graph.directed, metadata=graph.metadata)
 
     nodes = {}
@@ -35,6 +45,24 @@ def graph_to_dict(graph: Graph) -> Dict[str, Any]:
     return data
 
 
+def _graph_to_columns(graph: Graph) -> Dict[str, Any]:
+    data = new_graph_dict(directed=graph.directed, metadata=graph.metadata,
+                          version=COLUMNAR_SCHEMA_VERSION)
+    nodes = list(graph.nodes())
+    index = {node.id: idx for idx, node in enumerate(nodes)}
+    data["node_ids"] = [node.id for node in nodes]
+    data["x"] = [node.x for node in nodes]
+    data["y"] = [node.y for node in nodes]
+    # Labels that repeat the node id are the common case; store them as null.
+    data["labels"] = [None if node.label == node.id else node.label for node in nodes]
+    edges = list(graph.edges())
+    data["edge_src"] = [index[edge.start] for edge in edges]
+    data["edge_dst"] = [index[edge.end] for edge in edges]
+    data["weights"] = [edge.weight for edge in edges]
+    return data
+
+
+@traced("dict_to_graph")
 def dict_to_graph(data: Dict[str, Any]) -> Graph:
     issues = validate_graph_data(data)
     errors = [issue for issue in issues if issue.severity == "error"]
@@ -43,23 +71,288 @@ def dict_to_graph(data: Dict[str, Any]) -> Graph:
 
     directed = bool(data.get("directed", False))
     metadata = data.get("metadata") or {}
+    if data.get("version") == COLUMNAR_SCHEMA_VERSION:
+        return Graph.from_arrays(data["node_ids"], data["edge_src"], data["edge_dst"],
+                                 data["weights"], xs=data["x"], ys=data["y"],
+                                 labels=data.get("labels"), directed=directed,
+                                 metadata=metadata, validate=False)
     graph = Graph(directed=directed, metadata=metadata)
 
-    nodes = data.get("nodes", {})
-    for node_id, node_data in nodes.items():
-        label = node_data.get("label") if isinstance(node_data, dict) else None
-        x_val = node_data.get("x", 0) if isinstance(node_data, dict) else 0
-        y_val = node_data.get("y", 0) if isinstance(node_data, dict) else 0
-        graph.add_node(node_id=node_id, label=label, x=x_val, y=y_val)
+    # validate_graph_data has already checked ids, types, endpoints and
+    # duplicates, so the bulk insert can skip its own per-item checks.
+    graph.add_nodes_from(((node_id, node_data.get("label"), node_data.get("x", 0),
+                           node_data.get("y", 0))
+                          for node_id, node_data in data.get("nodes", {}).items()),
+                         validate=False)
+    graph.add_edges_from(((edge_data["start"], edge_data["end"], edge_data["weight"])
+                          for edge_data in data.get("edges", [])),
+                         validate=False)
+
+    return graph
+
+
+def migrate_graph_data(data: Dict[str, Any], version: int) -> Dict[str, Any]:
+    """Convert a graph document between schema versions (validating it on the way)."""
+    return graph_to_dict(dict_to_graph(data), version=version)
+
+
+# Plain-text formats recognised by suffix (after any .gz/.xz) in load_graph_file.
+IMPORT_SUFFIXES = {
+    ".gr": "dimacs",
+    ".csv": "csv",
+    ".edges": "edgelist",
+    ".edgelist": "edgelist",
+    ".el": "edgelist",
+}
+_COMPRESSED_SUFFIXES = (".gz", ".xz", ".lzma")
+
+
+def _parse_error(path: str | os.PathLike, line: int, message: str) -> ValidationError:
+    name = os.path.basename(os.fspath(path))
+    return ValidationError([_issue("invalid_line", message, "error", path=f"{name}:{line}")])
 
-    edges = data.get("edges", [])
-    for edge_data in edges:
-        if not isinstance(edge_data, dict):
+
+def _text_lines(handle: IO[bytes]) -> Iterator[Tuple[int, str]]:
+    for number, line in enumerate(io.TextIOWrapper(handle, encoding="utf-8"), start=1):
+        yield number, line
+
+
+class _NodeIndex:
+    """Maps string node ids to dense indices in first-seen order."""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __call__(self, node_id: str) -> int:
+        idx = self._index.get(node_id)
+        if idx is None:
+            idx = self._index[node_id] = len(self.ids)
+            self.ids.append(node_id)
+        return idx
+
+
+def _graph_from_arcs(node_ids: Sequence[str], sources: Sequence[int], targets: Sequence[int],
+                     weights: Sequence[float], directed: bool | None, metadata: dict,
+                     xs: Sequence[float] | None = None,
+                     ys: Sequence[float] | None = None) -> Graph:
+    """Bulk-load arcs given as node indices.
+
+    Self-loops are dropped and parallel arcs keep the lightest weight. With
+    ``directed=None`` the graph is undirected only if every arc has a reverse
+    arc of the same weight, which is how road networks list two-way streets.
+    """
+    count = len(node_ids)
+    lightest: Dict[int, float] = {}
+    for u, v, weight in zip(sources, targets, weights):
+        if u == v:
             continue
-        start = edge_data.get("start")
-        end = edge_data.get("end")
-        weight = edge_data.get("weight")
-        if start in graph.get_nodes() and end in graph.get_nodes():
-            graph.add_edge(start, end, weight)
+        key = u * count + v
+        current = lightest.get(key)
+        if current is None or weight < current:
+            lightest[key] = weight
 
-    return graph
+    if directed is None:
+        directed = any(lightest.get((key % count) * count + key // count) != weight
+                       for key, weight in lightest.items())
+    if not directed:
+        pairs: Dict[int, float] = {}
+        for key, weight in lightest.items():
+            u, v = divmod(key, count)
+            if u > v:
+                key = v * count + u
+            current = pairs.get(key)
+            if current is None or weight < current:
+                pairs[key] = weight
+        lightest = pairs
+
+    edge_src = array("q")
+    edge_dst = array("q")
+    for key in lightest:
+        u, v = divmod(key, count)
+        edge_src.append(u)
+        edge_dst.append(v)
+    return Graph.from_arrays(node_ids, edge_src, edge_dst, list(lightest.values()),
+                             xs=xs, ys=ys, directed=directed, metadata=metadata,
+                             validate=False)
+
+
+@traced("load_dimacs")
+def load_dimacs(gr_path: str | os.PathLike, co_path: str | os.PathLike | None = None,
+                directed: bool | None = None) -> Graph:
+    """Import a DIMACS shortest-path ``.gr`` file, with coordinates from a ``.co`` file.
+
+    Node ids are the DIMACS numbers as strings ("1".."n").
+    """
+    node_count = 0
+    sources = array("q")
+    targets = array("q")
+    weights = array("d")
+    with open_input(gr_path) as handle:
+        for number, line in _text_lines(handle):
+            kind = line[:1]
+            if kind == "a":
+                parts = line.split()
+                try:
+                    u, v, weight = int(parts[1]) - 1, int(parts[2]) - 1, float(parts[3])
+                except (IndexError, ValueError):
+                    raise _parse_error(gr_path, number, "Expected 'a <from> <to> <weight>'.")
+                if u < 0 or v < 0 or (node_count and max(u, v) >= node_count):
+                    raise _parse_error(gr_path, number, "Arc references an unknown node.")
+                sources.append(u)
+                targets.append(v)
+                weights.append(weight)
+            elif kind == "p":
+                parts = line.split()
+                if len(parts) < 4 or parts[1] != "sp" or not parts[2].isdigit():
+                    raise _parse_error(gr_path, number, "Expected 'p sp <nodes> <arcs>'.")
+                node_count = int(parts[2])
+            elif kind not in ("c", "\n", "\r", ""):
+                raise _parse_error(gr_path, number, f"Unknown line type {kind!r}.")
+    if not node_count:
+        node_count = max(max(sources, default=-1), max(targets, default=-1)) + 1
+
+    xs = ys = None
+    if co_path is not None:
+        xs = [0.0] * node_count
+        ys = [0.0] * node_count
+        with open_input(co_path) as handle:
+            for number, line in _text_lines(handle):
+                if line[:1] != "v":
+                    continue
+                parts = line.split()
+                try:
+                    idx, x, y = int(parts[1]) - 1, float(parts[2]), float(parts[3])
+                except (IndexError, ValueError):
+                    raise _parse_error(co_path, number, "Expected 'v <node> <x> <y>'.")
+                if not 0 <= idx < node_count:
+                    raise _parse_error(co_path, number, "Coordinate for an unknown node.")
+                xs[idx] = x
+                ys[idx] = y
+
+    node_ids = [str(idx) for idx in range(1, node_count + 1)]
+    return _graph_from_arcs(node_ids, sources, targets, weights, directed,
+                            {"format": "dimacs"}, xs=xs, ys=ys)
+
+
+@traced("load_edge_list")
+def load_edge_list(path: str | os.PathLike, directed: bool | None = None,
+                   delimiter: str | None = None, comments: str = "#%") -> Graph:
+    """Import ``source target [weight]`` lines; a missing weight counts as 1."""
+    index = _NodeIndex()
+    sources = array("q")
+    targets = array("q")
+    weights = array("d")
+    with open_input(path) as handle:
+        for number, line in _text_lines(handle):
+            parts = line.split(delimiter)
+            if not parts or not parts[0].strip() or parts[0][:1] in comments:
+                continue
+            if len(parts) not in (2, 3):
+                raise _parse_error(path, number, "Expected 'source target [weight]'.")
+            try:
+                weight = float(parts[2]) if len(parts) == 3 else 1.0
+            except ValueError:
+                raise _parse_error(path, number, f"Invalid weight {parts[2].strip()!r}.")
+            sources.append(index(parts[0].strip()))
+            targets.append(index(parts[1].strip()))
+            weights.append(weight)
+    return _graph_from_arcs(index.ids, sources, targets, weights, directed,
+                            {"format": "edgelist"})
+
+
+@traced("load_csv_edges")
+def load_csv_edges(path: str | os.PathLike, source: str = "source", target: str = "target",
+                   weight: str | None = "weight", directed: bool | None = None,
+                   delimiter: str = ",") -> Graph:
+    """Import an edge table with a header row.
+
+    If the ``weight`` column is absent (or ``weight=None``) every edge weighs 1.
+    """
+    import csv
+
+    index = _NodeIndex()
+    sources = array("q")
+    targets = array("q")
+    weights = array("d")
+    with open_input(path) as handle:
+        reader = csv.reader(io.TextIOWrapper(handle, encoding="utf-8", newline=""),
+                            delimiter=delimiter)
+        header = [name.strip() for name in next(reader, [])]
+        missing = [name for name in (source, target) if name not in header]
+        if missing:
+            raise _parse_error(path, 1, f"Missing column(s): {', '.join(missing)}.")
+        src_col = header.index(source)
+        dst_col = header.index(target)
+        weight_col = header.index(weight) if weight in header else None
+        for row in reader:
+            if not row:
+                continue
+            try:
+                value = float(row[weight_col]) if weight_col is not None else 1.0
+                u, v = row[src_col].strip(), row[dst_col].strip()
+            except (IndexError, ValueError):
+                raise _parse_error(path, reader.line_num, "Malformed edge row.")
+            sources.append(index(u))
+            targets.append(index(v))
+            weights.append(value)
+    return _graph_from_arcs(index.ids, sources, targets, weights, directed,
+                            {"format": "csv"})
+
+
+def import_format(path: str | os.PathLike) -> str | None:
+    """The importer ``load_graph_file`` would use for ``path`` (``None`` for JSON/binary)."""
+    name = os.fspath(path).lower()
+    for suffix in _COMPRESSED_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return IMPORT_SUFFIXES.get(os.path.splitext(name)[1])
+
+
+def _coordinates_for(gr_path: str | os.PathLike) -> str | None:
+    base = os.fspath(gr_path)
+    for suffix in _COMPRESSED_SUFFIXES:
+        if base.lower().endswith(suffix):
+            base = base[:-len(suffix)]
+    base = os.path.splitext(base)[0]
+    for suffix in ("",) + _COMPRESSED_SUFFIXES:
+        candidate = f"{base}.co{suffix}"
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+@traced("load_graph_file")
+def load_graph_file(path: str | os.PathLike,
+                    progress: ProgressCallback | None = None) -> Graph:
+    """Load a graph file as an editable ``Graph``.
+
+    Handles JSON (optionally gzip/xz compressed), the binary format, and the
+    text formats in ``IMPORT_SUFFIXES``; a DIMACS ``.gr`` file picks up a
+    ``.co`` file with the same stem for coordinates.
+    """
+    from .binary import is_binary_graph, open_binary_graph
+
+    if is_binary_graph(path):
+        return open_binary_graph(path).thaw()
+    kind = import_format(path)
+    if kind == "dimacs":
+        return load_dimacs(path, _coordinates_for(path))
+    if kind == "csv":
+        return load_csv_edges(path)
+    if kind == "edgelist":
+        return load_edge_list(path)
+    return read_graph_file(path, progress=progress)
+
+
+def load_snapshot_file(path: str | os.PathLike,
+                       progress: ProgressCallback | None = None):
+    """Load a graph file as a read-only ``GraphSnapshot``.
+
+    Binary files are memory-mapped instead of parsed.
+    """
+    from .binary import is_binary_graph, open_binary_graph
+
+    if is_binary_graph(path):
+        return open_binary_graph(path)
+    return load_graph_file(path, progress=progress).freeze()
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+from .components import ComponentIndex, ComponentLabels
+from .schema import edge_id
+from .types import Edge, GraphStats, Node
+
+
+class SnapshotColumns(NamedTuple):
+    node_ids: Sequence[str]
+    labels: Sequence[str]
+    xs: Sequence[float]
+    ys: Sequence[float]
+    offsets: Sequence[int]
+    targets: Sequence[int]
+    weights: Sequence[float]
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only ``{node_id: [(neighbor, weight), ...]}`` view over CSR rows.
+
+    A row is decoded the first time it is read, so a query pays for the
+    nodes it settles rather than for every edge in the graph.
+    """
+
+    __slots__ = ("_ids", "_index", "_offsets", "_targets", "_weights", "_rows")
+
+    def __init__(self, ids: Sequence[str], index: Dict[str, int], offsets: Sequence[int],
+                 targets: Sequence[int], weights: Sequence[float]):
+        self._ids = ids
+        self._index = index
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._rows: List[List[Tuple[str, float]] | None] = [None] * len(ids)
+
+    def __getitem__(self, node_id: str) -> List[Tuple[str, float]]:
+        idx = self._index[node_id]
+        row = self._rows[idx]
+        if row is None:
+            # Racing threads build equal rows; whichever lands last is kept.
+            ids = self._ids
+            targets = self._targets
+            weights = self._weights
+            row = self._rows[idx] = [(ids[targets[i]], float(weights[i]))
+                                     for i in range(self._offsets[idx], self._offsets[idx + 1])]
+        return row
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._index
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class GraphSnapshot:
+    """Immutable, read-only graph stored as CSR arrays.
+
+    Exposes the read side of the ``Graph`` API so engines and layouts can
+    run on it unchanged. Adjacency rows are decoded on demand and shared
+    between callers, which makes a snapshot safe to query from many threads.
+    """
+
+    __slots__ = ("_directed", "_metadata", "_ids", "_labels", "_xs", "_ys",
+                 "_offsets", "_targets", "_weights", "_index", "_adjacency",
+                 "_has_negative", "_components", "_component_labels")
+
+    def __init__(self, directed: bool, metadata: dict,
+                 node_ids: Sequence[str], labels: Sequence[str],
+                 xs: Sequence[float], ys: Sequence[float],
+                 offsets: Sequence[int], targets: Sequence[int],
+                 weights: Sequence[float], has_negative: bool | None = None,
+                 component_labels: ComponentLabels | None = None):
+        if len(offsets) != len(node_ids) + 1:
+            raise ValueError("CSR offsets must have one entry per node plus one.")
+        if len(targets) != len(weights):
+            raise ValueError("CSR targets and weights must have the same length.")
+        self._directed = bool(directed)
+        self._metadata = dict(metadata or {})
+        self._ids = node_ids
+        self._labels = labels
+        self._xs = xs
+        self._ys = ys
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._index: Dict[str, int] | None = None
+        self._adjacency: _CSRAdjacency | None = None
+        # Known up front when the source already recorded it (binary files).
+        self._has_negative = has_negative
+        self._components: ComponentIndex | None = None
+        self._component_labels = component_labels
+
+    @classmethod
+    def from_graph(cls, graph) -> "GraphSnapshot":
+        nodes = list(graph.nodes())
+        ids = [node.id for node in nodes]
+        index = {node_id: idx for idx, node_id in enumerate(ids)}
+        buckets: List[List[Tuple[int, float]]] = [[] for _ in ids]
+        for edge in graph.edges():
+            u = index[edge.start]
+            v = index[edge.end]
+            buckets[u].append((v, edge.weight))
+            if not graph.directed:
+                buckets[v].append((u, edge.weight))
+
+        offsets = [0]
+        targets: List[int] = []
+        weights: List[float] = []
+        for bucket in buckets:
+            for v, weight in bucket:
+                targets.append(v)
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        snapshot = cls(
+            directed=graph.directed,
+            metadata=graph.metadata,
+            node_ids=ids,
+            labels=[node.label for node in nodes],
+            xs=[node.x for node in nodes],
+            ys=[node.y for node in nodes],
+            offsets=offsets,
+            targets=targets,
+            weights=weights,
+        )
+        snapshot._index = index
+        return snapshot
+
+    @classmethod
+    def from_edge_arrays(cls, directed: bool, node_ids: Sequence[str],
+                         xs: Sequence[float], ys: Sequence[float],
+                         sources: Sequence[int], targets: Sequence[int],
+                         weights: Sequence[float], labels: Sequence[str] | None = None,
+                         metadata: dict | None = None) -> "GraphSnapshot":
+        """Build CSR directly from parallel edge arrays of node indices."""
+        count = len(node_ids)
+        if not (len(sources) == len(targets) == len(weights)):
+            raise ValueError("Edge arrays must have the same length.")
+        degree = [0] * (count + 1)
+        for u in sources:
+            degree[u + 1] += 1
+        if not directed:
+            for v in targets:
+                degree[v + 1] += 1
+        for idx in range(count):
+            degree[idx + 1] += degree[idx]
+        offsets = degree
+        cursor = offsets[:-1]
+        csr_targets = [0] * offsets[-1]
+        csr_weights = [0.0] * offsets[-1]
+        for u, v, weight in zip(sources, targets, weights):
+            slot = cursor[u]
+            csr_targets[slot] = v
+            csr_weights[slot] = weight
+            cursor[u] = slot + 1
+            if not directed:
+                slot = cursor[v]
+                csr_targets[slot] = u
+                csr_weights[slot] = weight
+                cursor[v] = slot + 1
+        return cls(
+            directed=directed,
+            metadata=metadata or {},
+            node_ids=node_ids,
+            labels=labels if labels is not None else node_ids,
+            xs=xs,
+            ys=ys,
+            offsets=offsets,
+            targets=csr_targets,
+            weights=csr_weights,
+        )
+
+    @property
+    def directed(self) -> bool:
+        return self._directed
+
+    @property
+    def metadata(self) -> dict:
+        return dict(self._metadata)
+
+    def _node_index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {node_id: idx for idx, node_id in enumerate(self._ids)}
+        return self._index
+
+    def _lookup(self, node_id: str) -> int:
+        idx = self._node_index().get(node_id)
+        if idx is None:
+            raise ValueError(f"Node '{node_id}' not found.")
+        return idx
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._node_index()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self._node_index()
+
+    def get_nodes(self) -> List[str]:
+        return list(self._ids)
+
+    def get_node_label(self, node_id: str) -> str:
+        return self._labels[self._lookup(node_id)]
+
+    def get_node_position(self, node_id: str) -> tuple[float, float]:
+        idx = self._lookup(node_id)
+        return (float(self._xs[idx]), float(self._ys[idx]))
+
+    def get_neighbors(self, node_id: str) -> List[Tuple[str, float]]:
+        idx = self._lookup(node_id)
+        ids = self._ids
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        return [(ids[self._targets[i]], float(self._weights[i])) for i in range(start, end)]
+
+    def get_edges(self) -> List[Tuple[str, str, float]]:
+        return [(edge.start, edge.end, edge.weight) for edge in self.edges()]
+
+    def to_adjacency_dict(self) -> Mapping[str, List[Tuple[str, float]]]:
+        """Read-only adjacency mapping, shared between callers.
+
+        Unlike ``Graph.to_adjacency_dict`` this is a lazy view over the CSR
+        arrays rather than a ``dict``.
+        """
+        if self._adjacency is None:
+            self._adjacency = _CSRAdjacency(self._ids, self._node_index(), self._offsets,
+                                            self._targets, self._weights)
+        return self._adjacency
+
+    def columns(self) -> SnapshotColumns:
+        """The raw node columns and CSR arrays backing this snapshot."""
+        return SnapshotColumns(self._ids, self._labels, self._xs, self._ys,
+                               self._offsets, self._targets, self._weights)
+
+    def freeze(self) -> "GraphSnapshot":
+        return self
+
+    def to_dict(self) -> dict:
+        from .serialization import graph_to_dict
+
+        return graph_to_dict(self)
+
+    def thaw(self):
+        from .graph import Graph
+
+        graph = Graph(directed=self._directed, metadata=self._metadata)
+        graph.add_nodes_from(((node.id, node.label, node.x, node.y) for node in self.nodes()),
+                             validate=False)
+        graph.add_edges_from(((edge.start, edge.end, edge.weight) for edge in self.edges()),
+                             validate=False)
+        return graph
+
+    def _arcs(self) -> Iterable[Tuple[int, int]]:
+        offsets = self._offsets
+        targets = self._targets
+        return ((u, targets[i]) for u in range(len(self._ids))
+                for i in range(offsets[u], offsets[u + 1]))
+
+    def component_index(self) -> ComponentIndex:
+        if self._components is None:
+            if self._component_labels is not None:
+                self._components = ComponentIndex.from_labels(
+                    self._directed, self._ids, self._component_labels, self._arcs,
+                    index=self._node_index())
+            else:
+                self._components = ComponentIndex(self._directed, self._ids, self._arcs())
+        return self._components
+
+    def has_negative_weights(self) -> bool:
+        if self._has_negative is None:
+            self._has_negative = any(weight < 0 for weight in self._weights)
+        return self._has_negative
+
+    def get_stats(self) -> GraphStats:
+        edge_count = len(self._targets)
+        if not self._directed:
+            edge_count //= 2
+        return GraphStats(node_count=len(self._ids), edge_count=edge_count,
+                          directed=self._directed)
+
+    def nodes(self) -> Iterable[Node]:
+        return [Node(id=node_id, label=self._labels[idx],
+                     x=float(self._xs[idx]), y=float(self._ys[idx]))
+                for idx, node_id in enumerate(self._ids)]
+
+    def edges(self) -> Iterable[Edge]:
+        ids = self._ids
+        targets = self._targets
+        weights = self._weights
+        offsets = self._offsets
+        edges: List[Edge] = []
+        for u, start in enumerate(ids):
+            for i in range(offsets[u], offsets[u + 1]):
+                end = ids[targets[i]]
+                # Undirected edges are stored in both rows; keep the normalized one.
+                if not self._directed and end < start:
+                    continue
+                edges.append(Edge(id=edge_id(start, end, self._directed), start=start,
+                                  end=end, weight=float(weights[i])))
+        return edges
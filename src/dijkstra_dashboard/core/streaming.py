@@ -0,0 +1,562 @@
+"""Incremental reader and writer for graph JSON files.
+
+``read_graph`` parses a file object chunk by chunk and feeds nodes and edges
+into ``Graph.add_nodes_from``/``add_edges_from`` in batches, so loading never
+holds the whole document (or a full dict copy of it) in memory. Items are
+validated with the same per-item rules as ``validate_graph_data``; errors are
+collected and raised together as a ``ValidationError``. Version 2
+(columnar) documents are already compact, so their arrays are decoded whole.
+
+``write_graph_file`` goes the other way: it formats nodes and edges straight
+from the graph in chunks (optionally gzip/lzma compressed) and replaces the
+target file atomically.
+"""
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .errors import ValidationError
+from .fileio import atomic_write
+from .graph import Graph
+from .schema import COLUMNAR_SCHEMA_VERSION, GRAPH_SCHEMA_VERSION
+from .tracing import traced
+from .types import Edge, GraphIssue, Node
+from .validation import _issue, edge_issues, node_issues
+
+ProgressCallback = Callable[[int, "int | None"], None]
+
+CHUNK_SIZE = 1 << 20
+BATCH_SIZE = 10_000
+_WHITESPACE = " \t\n\r"
+INF = float("inf")
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".xz": "lzma", ".lzma": "lzma"}
+
+
+_TOKEN_ENDS = frozenset(_WHITESPACE + ',:[]{}"')
+
+
+def _truncated(buffer: str, exc: json.JSONDecodeError) -> bool:
+    # An unterminated string runs to the end by definition; any other error
+    # is at a token (a partial literal, number or escape) that must reach
+    # the end of the buffer without a delimiter.
+    if exc.msg.startswith("Unterminated string"):
+        return True
+    return _TOKEN_ENDS.isdisjoint(buffer[exc.pos:])
+
+
+class _Stream:
+    """Character buffer over a file object that decodes one JSON value at a time."""
+
+    def __init__(self, handle: IO, chunk_size: int, progress: ProgressCallback | None,
+                 total: int | None):
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._progress = progress
+        self._total = total
+        self._decoder = json.JSONDecoder()
+        self._scan = self._decoder.scan_once
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0
+        self._bytes_read = 0
+        self._eof = False
+
+    def _fill(self, at_least: int = 0) -> bool:
+        if self._eof:
+            return False
+        chunk = self._handle.read(max(self._chunk_size, at_least))
+        if isinstance(chunk, bytes):
+            self._bytes_read += len(chunk)
+            text = self._text_decoder.decode(chunk, final=not chunk)
+        else:
+            self._bytes_read += len(chunk.encode("utf-8"))
+            text = chunk
+        if not chunk:
+            self._eof = True
+        if self._progress is not None:
+            self._progress(self._bytes_read, self._total)
+        # Drop everything already consumed so the buffer stays about one chunk.
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(chunk)
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid graph JSON at offset {self._offset + self._pos}: {message}")
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        buffer = self._buffer
+        pos = self._pos
+        length = len(buffer)
+        while pos < length and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos < length and buffer[pos] in chars:
+            self._pos = pos + 1
+            return buffer[pos]
+        self._pos = pos
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of file"
+            raise self._error(f"expected one of {chars!r}, found {found}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        # Fast path: a value that ends inside the buffer, decoded by the C
+        # scanner without the raw_decode wrapper.
+        buffer = self._buffer
+        pos = self._pos
+        length = len(buffer)
+        while pos < length and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        if pos < length:
+            try:
+                value, end = self._scan(buffer, pos)
+            except (StopIteration, json.JSONDecodeError):
+                pass
+            else:
+                if end < length:
+                    self._pos = end
+                    return value
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                # Only a token that runs into the end of the buffer may be cut
+                # off by the chunk boundary; anything else is a real syntax
+                # error and is reported without reading the rest of the file.
+                if _truncated(self._buffer, exc) and self._fill(len(self._buffer) - self._pos):
+                    continue
+                self._pos = exc.pos
+                raise self._error(exc.msg) from None
+            # A number ending exactly at the buffer edge may continue in the
+            # next chunk, so only trust it once more input (or EOF) is seen.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def items(self, close: str):
+        """Yield once per element of the container just opened, until ``close``."""
+        if self.peek() == close:
+            self._pos += 1
+            return
+        while True:
+            yield
+            if self.expect("," + close) == close:
+                return
+
+
+class _EdgeKeys:
+    """Duplicate tracking for ``edge_issues`` backed by the graph being built.
+
+    Behaves like the ``set`` that ``validate_graph_data`` uses, but only the
+    current, not yet inserted batch is kept on the side.
+    """
+
+    def __init__(self, graph: Graph):
+        self._graph = graph
+        self.pending: set[Tuple[str, str]] = set()
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self.pending or self._graph.has_edge(*key)
+
+    def add(self, key: Tuple[str, str]) -> None:
+        self.pending.add(key)
+
+
+class _NodeIds:
+    def __init__(self, graph: Graph, rejected: set):
+        self._graph = graph
+        self._rejected = rejected
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._graph or node_id in self._rejected
+
+
+class _GraphBuilder:
+    def __init__(self, batch_size: int):
+        self.graph = Graph()
+        self.errors: List[GraphIssue] = []
+        self._batch_size = batch_size
+        self._fields: dict = {}
+        self.sections: set = set()
+        self._directed: bool | None = None
+        self._nodes_done = False
+        self._rejected: set = set()
+        self._node_batch: List[tuple] = []
+        self._node_batch_ids: set = set()
+        self._edge_batch: List[tuple] = []
+        self._edge_keys = _EdgeKeys(self.graph)
+        self._node_ids = _NodeIds(self.graph, self._rejected)
+        self._edge_count = 0
+        self._pending_edges: List[Any] = []
+
+    def report(self, issues: List[GraphIssue]) -> bool:
+        if not issues:
+            return True
+        errors = [issue for issue in issues if issue.severity == "error"]
+        self.errors.extend(errors)
+        return not errors
+
+    def set_field(self, key: str, value: Any) -> None:
+        self._fields[key] = value
+        if key == "directed":
+            if not isinstance(value, bool):
+                self.report([_issue("invalid_directed", "Graph 'directed' must be a boolean.",
+                                    "error", path="directed")])
+                value = False
+            self._directed = value
+            # No edges can be stored yet: they wait in _pending_edges until
+            # 'directed' is known.
+            self.graph.set_directed(value)
+        elif key == "metadata":
+            self.graph.set_metadata(value or {})
+
+    def add_node(self, node_id: str, node_data: Any) -> None:
+        if node_id in self.graph or node_id in self._node_batch_ids:
+            self.report([_issue("duplicate_node", f"Node '{node_id}' appears more than once.",
+                                "error", path=f"nodes.{node_id}")])
+            return
+        if not self.report(node_issues(node_id, node_data)):
+            self._rejected.add(node_id)
+            return
+        self._node_batch.append((node_id, node_data.get("label"), node_data.get("x", 0),
+                                 node_data.get("y", 0)))
+        self._node_batch_ids.add(node_id)
+        if len(self._node_batch) >= self._batch_size:
+            self._flush_nodes()
+
+    def _flush_nodes(self) -> None:
+        self.graph.add_nodes_from(self._node_batch, validate=False)
+        self._node_batch = []
+        self._node_batch_ids = set()
+
+    def end_nodes(self) -> None:
+        self._flush_nodes()
+        self._nodes_done = True
+        self._drain_pending()
+
+    def add_edge(self, edge: Any) -> None:
+        if not self._nodes_done or self._directed is None:
+            # Edges can only be checked once every node id and the graph's
+            # direction are known; files written by this package never hit this.
+            self._pending_edges.append(edge)
+            return
+        idx = self._edge_count
+        self._edge_count += 1
+        if not self.report(edge_issues(idx, edge, self._node_ids, self._directed,
+                                       self._edge_keys)):
+            return
+        if self.errors:
+            return
+        self._edge_batch.append((edge["start"], edge["end"], edge["weight"]))
+        if len(self._edge_batch) >= self._batch_size:
+            self._flush_edges()
+
+    def _flush_edges(self) -> None:
+        self.graph.add_edges_from(self._edge_batch, validate=False)
+        self._edge_batch = []
+        self._edge_keys.pending.clear()
+
+    def _drain_pending(self) -> None:
+        if not self._nodes_done or self._directed is None:
+            return
+        pending, self._pending_edges = self._pending_edges, []
+        for edge in pending:
+            self.add_edge(edge)
+
+    def finish(self) -> Graph:
+        fields = self._fields
+        if fields.get("version") == COLUMNAR_SCHEMA_VERSION and not self.sections:
+            # Version 2 documents are a handful of flat arrays that were
+            # decoded whole as plain fields; build them the regular way.
+            from .serialization import dict_to_graph
+
+            return dict_to_graph(fields)
+        if fields.get("version") != GRAPH_SCHEMA_VERSION:
+            self.report([_issue("invalid_version",
+                                f"Unsupported graph version: {fields.get('version')}",
+                                "error", path="version")])
+        if self._directed is None:
+            self.set_field("directed", None)
+        if "nodes" not in self.sections:
+            self.report([_issue("invalid_nodes", "Graph 'nodes' must be a dictionary.",
+                                "error", path="nodes")])
+            self.end_nodes()
+        if "edges" not in self.sections:
+            self.report([_issue("invalid_edges", "Graph 'edges' must be a list.",
+                                "error", path="edges")])
+        self._drain_pending()
+        self._flush_edges()
+        if self.errors:
+            raise ValidationError(self.errors)
+        return self.graph
+
+
+def _read_nodes(stream: _Stream, builder: _GraphBuilder) -> None:
+    if stream.peek() != "{":
+        stream.value()
+        builder.report([_issue("invalid_nodes", "Graph 'nodes' must be a dictionary.",
+                               "error", path="nodes")])
+        builder.end_nodes()
+        return
+    stream.expect("{")
+    for _ in stream.items("}"):
+        node_id = stream.value()
+        stream.expect(":")
+        builder.add_node(node_id, stream.value())
+    builder.end_nodes()
+
+
+def _read_edges(stream: _Stream, builder: _GraphBuilder) -> None:
+    if stream.peek() != "[":
+        stream.value()
+        builder.report([_issue("invalid_edges", "Graph 'edges' must be a list.",
+                               "error", path="edges")])
+        return
+    stream.expect("[")
+    for _ in stream.items("]"):
+        builder.add_edge(stream.value())
+
+
+@traced("read_graph")
+def read_graph(handle: IO, progress: ProgressCallback | None = None,
+               total: int | None = None, chunk_size: int = CHUNK_SIZE,
+               batch_size: int = BATCH_SIZE) -> Graph:
+    """Load a graph document from a binary or text file object.
+
+    ``progress(bytes_read, total)`` is called after every chunk; ``total`` is
+    passed through unchanged (``None`` when the size is unknown).
+    """
+    stream = _Stream(handle, chunk_size, progress, total)
+    builder = _GraphBuilder(batch_size)
+    if stream.peek() != "{":
+        raise ValidationError([_issue("invalid_type", "Graph data must be a dictionary.",
+                                      "error")])
+    stream.expect("{")
+    for _ in stream.items("}"):
+        key = stream.value()
+        if not isinstance(key, str):
+            raise stream._error("object keys must be strings")
+        stream.expect(":")
+        if key == "nodes":
+            builder.sections.add(key)
+            _read_nodes(stream, builder)
+        elif key == "edges":
+            builder.sections.add(key)
+            _read_edges(stream, builder)
+        else:
+            builder.set_field(key, stream.value())
+    if stream.peek():
+        raise stream._error("unexpected data after the graph object")
+    return builder.finish()
+
+
+def _open_compressed(raw: IO[bytes], compression: str | None, mode: str) -> IO[bytes]:
+    if compression is None:
+        return raw
+    if compression == "gzip":
+        import gzip
+
+        return gzip.GzipFile(fileobj=raw, mode=mode, filename="")
+    if compression == "lzma":
+        import lzma
+
+        return lzma.LZMAFile(raw, mode)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def detect_compression(handle: IO[bytes]) -> str | None:
+    """Sniff gzip/xz magic bytes at the start of a seekable binary file."""
+    position = handle.tell()
+    head = handle.read(len(XZ_MAGIC))
+    handle.seek(position)
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(XZ_MAGIC):
+        return "lzma"
+    return None
+
+
+@contextmanager
+def open_input(path: str | os.PathLike) -> Iterator[IO[bytes]]:
+    """Open ``path`` for binary reading, transparently decompressing gzip/xz."""
+    with open(path, "rb") as raw:
+        compression = detect_compression(raw)
+        if compression is None:
+            yield raw
+        else:
+            with _open_compressed(raw, compression, "rb") as handle:
+                yield handle
+
+
+def read_graph_file(path: str | os.PathLike,
+                    progress: ProgressCallback | None = None) -> Graph:
+    """``read_graph`` on a path, transparently decompressing gzip/xz files.
+
+    Progress is reported against the size of the file on disk.
+    """
+    with open(path, "rb") as raw:
+        total = os.fstat(raw.fileno()).st_size
+        compression = detect_compression(raw)
+        if compression is None:
+            return read_graph(raw, progress=progress, total=total)
+        with _open_compressed(raw, compression, "rb") as handle:
+            on_chunk = None
+            if progress is not None:
+                def on_chunk(_done, _total):
+                    progress(raw.tell(), total)
+            return read_graph(handle, progress=on_chunk, total=total)
+
+
+class GraphItems(NamedTuple):
+    """Point-in-time copy of a graph's node and edge lists.
+
+    ``Node`` and ``Edge`` are immutable, so this only copies references; it is
+    cheap to take on the UI thread and safe to write from another thread.
+    """
+
+    directed: bool
+    metadata: dict
+    node_list: List[Node]
+    edge_list: List[Edge]
+
+    @classmethod
+    def of(cls, graph) -> "GraphItems":
+        return cls(graph.directed, graph.metadata, list(graph.nodes()), list(graph.edges()))
+
+    def nodes(self) -> List[Node]:
+        return self.node_list
+
+    def edges(self) -> List[Edge]:
+        return self.edge_list
+
+
+def _float(value: float) -> str:
+    # Same spelling as json.dumps, including its non-standard constants.
+    if value != value:
+        return "NaN"
+    if value == INF:
+        return "Infinity"
+    if value == -INF:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _chunks(graph, compact: bool, chunk_size: int) -> Iterable[str]:
+    string = json.encoder.encode_basestring_ascii
+    if compact:
+        newline, indent, colon = "", "", ":"
+        metadata = json.dumps(graph.metadata, separators=(",", ":"), ensure_ascii=True)
+        node_format = '{id}:{{"label":{label},"x":{x},"y":{y}}}'
+        edge_format = '{{"id":{id},"start":{start},"end":{end},"weight":{weight}}}'
+    else:
+        newline, indent, colon = "\n", "  ", ": "
+        metadata = json.dumps(graph.metadata, indent=2, ensure_ascii=True).replace("\n", "\n  ")
+        node_format = ('    {id}: {{\n      "label": {label},\n      "x": {x},\n'
+                       '      "y": {y}\n    }}')
+        edge_format = ('    {{\n      "id": {id},\n      "start": {start},\n'
+                       '      "end": {end},\n      "weight": {weight}\n    }}')
+    separator = "," + newline
+
+    pieces = [
+        "{", newline,
+        indent, '"version"', colon, str(GRAPH_SCHEMA_VERSION), separator,
+        indent, '"directed"', colon, "true" if graph.directed else "false", separator,
+        indent, '"metadata"', colon, metadata, separator,
+        indent, '"nodes"', colon, "{",
+    ]
+    size = 0
+    first = True
+    for node in graph.nodes():
+        pieces.append(newline if first else separator)
+        first = False
+        text = node_format.format(id=string(node.id), label=string(node.label),
+                                  x=_float(node.x), y=_float(node.y))
+        pieces.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            yield "".join(pieces)
+            pieces = []
+            size = 0
+    if not first:
+        pieces.extend((newline, indent))
+    pieces.extend(("}", separator, indent, '"edges"', colon, "["))
+
+    first = True
+    for edge in graph.edges():
+        pieces.append(newline if first else separator)
+        first = False
+        text = edge_format.format(id=string(edge.id), start=string(edge.start),
+                                  end=string(edge.end), weight=_float(edge.weight))
+        pieces.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            yield "".join(pieces)
+            pieces = []
+            size = 0
+    if not first:
+        pieces.extend((newline, indent))
+    pieces.extend(("]", newline, "}", "\n"))
+    yield "".join(pieces)
+
+
+def dump_graph(graph, handle: IO[str], compact: bool = False,
+               chunk_size: int = CHUNK_SIZE) -> None:
+    """Write ``graph`` as a v1 document to a text file object.
+
+    The indented output is byte-for-byte what ``json.dump(graph_to_dict(graph),
+    indent=2, ensure_ascii=True)`` plus a trailing newline would produce.
+    """
+    for chunk in _chunks(graph, compact, chunk_size):
+        handle.write(chunk)
+
+
+@traced("write_graph_file")
+def write_graph_file(graph, path: str | os.PathLike, compact: bool = False,
+                     compression: str | None = None, chunk_size: int = CHUNK_SIZE) -> None:
+    """Stream ``graph`` to ``path`` through a temporary file and an atomic rename.
+
+    ``compression`` is ``"gzip"``, ``"lzma"`` or ``None``; when ``None`` it is
+    picked from the suffix (``.gz``, ``.xz``, ``.lzma``), otherwise plain text.
+    """
+    path = os.fspath(path)
+    if compression is None:
+        compression = COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1].lower())
+    with atomic_write(path) as raw:
+        binary = _open_compressed(raw, compression, "wb")
+        try:
+            text = io.TextIOWrapper(binary, encoding="utf-8", newline="\n")
+            dump_graph(graph, text, compact=compact, chunk_size=chunk_size)
+            text.flush()
+            # Detach so closing the wrapper cannot close ``raw`` before fsync.
+            text.detach()
+        finally:
+            if binary is not raw:
+                binary.close()
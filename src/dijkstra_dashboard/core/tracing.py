@@ -0,0 +1,212 @@
+"""Lightweight span tracing that writes Chrome ``trace_event`` JSON.
+
+Tracing is off unless ``DIJKSTRA_DASHBOARD_TRACE`` or the config file's
+``trace`` key names an output file (or is a true value such as ``1``, which
+writes ``dijkstra_trace.json``), or ``configure`` is called. False values
+(``0``, ``false``, ``no``, ``off`` or empty) leave it off. Open the resulting file in Perfetto or
+``chrome://tracing``. When disabled, ``span`` returns a shared no-op object
+and ``traced`` functions call straight through.
+"""
+from __future__ import annotations
+
+import os
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, TypeVar
+
+DEFAULT_TRACE_FILE = "dijkstra_trace.json"
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"", "0", "false", "no", "off"})
+MAX_EVENTS = 1_000_000
+_CO_GENERATOR = 0x20
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _TraceState:
+    def __init__(self):
+        self.resolved = False
+        self.enabled = False
+        self.path: str | None = None
+        self.events: List[Dict[str, Any]] = []
+        self.thread_names: Dict[int, str] = {}
+        self.dropped = 0
+        self.exit_hook = False
+
+
+_state = _TraceState()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: Dict[str, Any]):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _record(self.name, self.start, end, self.args)
+        return False
+
+
+def _resolve() -> None:
+    _state.resolved = True
+    from dijkstra_dashboard.config import env_config, resolve_config
+
+    try:
+        target = resolve_config().get("trace")
+    except (OSError, ValueError):
+        # A broken config file should not break the code being traced.
+        target = env_config().get("trace")
+    configure(target or None)
+
+
+def _record(name: str, start_ns: int, end_ns: int, args: Dict[str, Any]) -> None:
+    if len(_state.events) >= MAX_EVENTS:
+        _state.dropped += 1
+        return
+    import threading
+
+    thread = threading.current_thread()
+    tid = thread.ident or 0
+    if tid not in _state.thread_names:
+        _state.thread_names[tid] = thread.name
+    event = {
+        "name": name,
+        "cat": "dijkstra_dashboard",
+        "ph": "X",
+        "ts": start_ns / 1000,
+        "dur": (end_ns - start_ns) / 1000,
+        "pid": os.getpid(),
+        "tid": tid,
+    }
+    if args:
+        event["args"] = args
+    # list.append is atomic, so spans from worker threads need no lock.
+    _state.events.append(event)
+
+
+def configure(path: str | os.PathLike | None) -> None:
+    """Enable tracing into ``path`` (written at exit), or disable it with ``None``."""
+    _state.resolved = True
+    if path is not None:
+        path = os.fspath(path)
+        flag = path.strip().lower()
+        if flag in _TRUE_VALUES:
+            path = DEFAULT_TRACE_FILE
+        elif flag in _FALSE_VALUES:
+            path = None
+    if path is None:
+        _state.enabled = False
+        _state.path = None
+        return
+    _state.enabled = True
+    _state.path = path
+    if not _state.exit_hook:
+        import atexit
+
+        atexit.register(_write_at_exit)
+        _state.exit_hook = True
+
+
+def is_enabled() -> bool:
+    if not _state.resolved:
+        _resolve()
+    return _state.enabled
+
+
+def span(name: str, **args: Any):
+    if not _state.resolved:
+        _resolve()
+    if not _state.enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """Decorate a function (or generator function) to record a span per call."""
+
+    def decorator(fn: F) -> F:
+        label = name or fn.__qualname__
+
+        if fn.__code__.co_flags & _CO_GENERATOR:
+            def _iterate(args, kwargs):
+                with _Span(label, {}):
+                    yield from fn(*args, **kwargs)
+
+            @wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                if not is_enabled():
+                    return fn(*args, **kwargs)
+                return _iterate(args, kwargs)
+
+            return generator_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not is_enabled():
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def trace_events() -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    pid = os.getpid()
+    for tid, thread_name in _state.thread_names.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                       "args": {"name": thread_name}})
+    events.extend(_state.events)
+    return events
+
+
+def write_trace(path: str | os.PathLike | None = None) -> str | None:
+    import json
+
+    target = os.fspath(path) if path is not None else _state.path
+    if target is None:
+        return None
+    payload = {
+        "traceEvents": trace_events(),
+        "displayTimeUnit": "ms",
+        "otherData": {"dropped_events": _state.dropped},
+    }
+    with open(target, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    return target
+
+
+def clear() -> None:
+    _state.events.clear()
+    _state.thread_names.clear()
+    _state.dropped = 0
+
+
+def _write_at_exit() -> None:
+    if _state.enabled and _state.events:
+        try:
+            write_trace()
+        except OSError:
+            pass
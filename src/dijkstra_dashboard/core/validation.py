@@ -1,188 +1,354 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Any, Dict, Iterable
+import os
+import zlib
+from array import array
+from typing import Any, Container, Dict, Iterable
 
 from .errors import ValidationError
-from .schema import GRAPH_SCHEMA_VERSION, edge_id
+from .schema import (
+    COLUMNAR_SCHEMA_VERSION,
+    EDGE_COLUMNS,
+    NODE_COLUMNS,
+    SUPPORTED_SCHEMA_VERSIONS,
+    edge_id,
+)
+from .tracing import traced
 from .types import GraphIssue
 
+VALIDATION_CHUNK_SIZE = 50_000
+# Per-edge issues are reported in this order; the duplicate check sits
+# between the endpoint/weight checks and the id checks.
+_EDGE_ID_CODES = frozenset({"missing_edge_id", "invalid_edge_id", "edge_id_mismatch"})
+
 
 def _issue(code: str, message: str, severity: str, path: str | None = None) -> GraphIssue:
     return GraphIssue(code=code, message=message, severity=severity, path=path)
 
 
+def _disconnected_issue(path: str) -> GraphIssue:
+    return _issue(
+        "graph_disconnected",
+        "Graph is disconnected; some nodes may be unreachable.",
+        "warning",
+        path=path,
+    )
+
+
 def _is_number(value: Any) -> bool:
     return isinstance(value, (int, float))
 
 
-def _build_undirected_adjacency(nodes: Iterable[str], edges: list[dict]) -> Dict[str, set[str]]:
-    adjacency: Dict[str, set[str]] = {node_id: set() for node_id in nodes}
+def _find_root(parent: dict, item: Any) -> Any:
+    root = parent.setdefault(item, item)
+    while parent[root] != root:
+        parent[root] = parent[parent[root]]
+        root = parent[root]
+    return root
+
+
+def _edge_key(start: str, end: str, directed: bool) -> tuple[str, str]:
+    return (start, end) if directed or start <= end else (end, start)
+
+
+def _edge_endpoints(edges: Iterable[Any]) -> Iterable[tuple[Any, Any]]:
     for edge in edges:
-        start = edge.get("start")
-        end = edge.get("end")
-        if start in adjacency and end in adjacency:
-            adjacency[start].add(end)
-            adjacency[end].add(start)
-    return adjacency
+        if isinstance(edge, dict):
+            yield edge.get("start"), edge.get("end")
+        else:
+            yield None, None
+
+
+def _spanning_forest(pairs: Iterable[tuple[Any, Any]], nodes: Container[str]) -> list[int]:
+    """Positions of the pairs that join two separate components of ``nodes``."""
+    parent: dict[str, str] = {}
+    forest: list[int] = []
+    for position, (start, end) in enumerate(pairs):
+        if not (isinstance(start, str) and isinstance(end, str)
+                and start in nodes and end in nodes):
+            continue
+        root_a = _find_root(parent, start)
+        root_b = _find_root(parent, end)
+        if root_a != root_b:
+            parent[root_b] = root_a
+            forest.append(position)
+    return forest
 
 
 def _is_connected(nodes: list[str], edges: list[dict]) -> bool:
     if not nodes:
         return True
+    return len(_spanning_forest(_edge_endpoints(edges), set(nodes))) == len(nodes) - 1
 
-    adjacency = _build_undirected_adjacency(nodes, edges)
-    visited = set()
-    queue: deque[str] = deque([nodes[0]])
 
-    while queue:
-        current = queue.popleft()
-        if current in visited:
-            continue
-        visited.add(current)
-        for neighbor in adjacency[current]:
-            if neighbor not in visited:
-                queue.append(neighbor)
+def node_issues(node_id: Any, node_data: Any) -> list[GraphIssue]:
+    """Issues for one entry of a v1 ``nodes`` mapping."""
+    issues: list[GraphIssue] = []
+    if not isinstance(node_id, str) or not node_id:
+        issues.append(_issue(
+            "invalid_node_id",
+            "Node IDs must be non-empty strings.",
+            "error",
+            path=f"nodes.{node_id}",
+        ))
+        return issues
+
+    if not isinstance(node_data, dict):
+        issues.append(_issue(
+            "invalid_node",
+            "Node data must be a dictionary.",
+            "error",
+            path=f"nodes.{node_id}",
+        ))
+        return issues
+
+    label = node_data.get("label")
+    if label is None:
+        issues.append(_issue(
+            "missing_label",
+            f"Node '{node_id}' is missing a label.",
+            "warning",
+            path=f"nodes.{node_id}.label",
+        ))
+    elif not isinstance(label, str):
+        issues.append(_issue(
+            "invalid_label",
+            f"Node '{node_id}' label must be a string.",
+            "error",
+            path=f"nodes.{node_id}.label",
+        ))
+
+    x_val = node_data.get("x", 0)
+    y_val = node_data.get("y", 0)
+    if not _is_number(x_val):
+        issues.append(_issue(
+            "invalid_x",
+            f"Node '{node_id}' x must be numeric.",
+            "error",
+            path=f"nodes.{node_id}.x",
+        ))
+    if not _is_number(y_val):
+        issues.append(_issue(
+            "invalid_y",
+            f"Node '{node_id}' y must be numeric.",
+            "error",
+            path=f"nodes.{node_id}.y",
+        ))
+    return issues
 
-    return len(visited) == len(nodes)
 
+def edge_issues(idx: int, edge: Any, nodes: Container[str], directed: bool,
+                edge_keys: set[tuple[str, str]]) -> list[GraphIssue]:
+    """Issues for one entry of a v1 ``edges`` list.
 
-def validate_graph_data(data: Dict[str, Any]) -> list[GraphIssue]:
+    ``edge_keys`` collects the keys seen so far and is updated in place.
+    """
+    # Paths are only formatted once an issue is found; valid edges are the
+    # common case and should not pay for them.
     issues: list[GraphIssue] = []
+    if not isinstance(edge, dict):
+        issues.append(_issue(
+            "invalid_edge",
+            "Edge must be a dictionary.",
+            "error",
+            path=f"edges[{idx}]",
+        ))
+        return issues
 
-    if not isinstance(data, dict):
-        return [_issue("invalid_type", "Graph data must be a dictionary.", "error")]
+    start = edge.get("start")
+    end = edge.get("end")
+    weight = edge.get("weight")
 
-    version = data.get("version")
-    if version != GRAPH_SCHEMA_VERSION:
+    if not isinstance(start, str) or not isinstance(end, str):
         issues.append(_issue(
-            "invalid_version",
-            f"Unsupported graph version: {version}",
+            "invalid_edge_nodes",
+            "Edge 'start' and 'end' must be strings.",
             "error",
-            path="version",
+            path=f"edges[{idx}]",
         ))
+        return issues
 
-    directed = data.get("directed")
-    if not isinstance(directed, bool):
+    if start not in nodes or end not in nodes:
         issues.append(_issue(
-            "invalid_directed",
-            "Graph 'directed' must be a boolean.",
+            "edge_missing_node",
+            "Edge references missing node IDs.",
             "error",
-            path="directed",
+            path=f"edges[{idx}]",
         ))
-        directed = False
 
-    nodes = data.get("nodes")
-    if not isinstance(nodes, dict):
+    if start == end:
         issues.append(_issue(
-            "invalid_nodes",
-            "Graph 'nodes' must be a dictionary.",
+            "self_loop",
+            "Edge start and end cannot be the same.",
             "error",
-            path="nodes",
+            path=f"edges[{idx}]",
         ))
-        nodes = {}
 
-    edges = data.get("edges")
-    if not isinstance(edges, list):
+    if not _is_number(weight):
         issues.append(_issue(
-            "invalid_edges",
-            "Graph 'edges' must be a list.",
+            "invalid_weight",
+            "Edge weight must be numeric.",
             "error",
-            path="edges",
+            path=f"edges[{idx}].weight",
+        ))
+    elif weight < 0:
+        issues.append(_issue(
+            "negative_weight",
+            "Edge has negative weight; only some algorithms support this.",
+            "warning",
+            path=f"edges[{idx}].weight",
         ))
-        edges = []
 
-    for node_id, node_data in nodes.items():
-        if not isinstance(node_id, str) or not node_id:
+    edge_key = _edge_key(start, end, directed)
+    if edge_key in edge_keys:
+        issues.append(_issue(
+            "duplicate_edge",
+            "Duplicate edge detected.",
+            "error",
+            path=f"edges[{idx}]",
+        ))
+    else:
+        edge_keys.add(edge_key)
+
+    provided_id = edge.get("id")
+    if provided_id is None:
+        issues.append(_issue(
+            "missing_edge_id",
+            "Edge id is missing; expected deterministic id.",
+            "warning",
+            path=f"edges[{idx}].id",
+        ))
+    elif not isinstance(provided_id, str):
+        issues.append(_issue(
+            "invalid_edge_id",
+            "Edge id must be a string.",
+            "error",
+            path=f"edges[{idx}].id",
+        ))
+    else:
+        expected_id = edge_id(start, end, directed)
+        if provided_id != expected_id:
             issues.append(_issue(
-                "invalid_node_id",
-                "Node IDs must be non-empty strings.",
-                "error",
-                path=f"nodes.{node_id}",
+                "edge_id_mismatch",
+                f"Edge id '{provided_id}' does not match expected '{expected_id}'.",
+                "warning",
+                path=f"edges[{idx}].id",
             ))
-            continue
+    return issues
+
 
-        if not isinstance(node_data, dict):
+def _is_connected_indices(count: int, sources: list, targets: list) -> bool:
+    adjacency: list[list[int]] = [[] for _ in range(count)]
+    for u, v in zip(sources, targets):
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+    visited = bytearray(count)
+    visited[0] = 1
+    stack = [0]
+    seen = 1
+    while stack:
+        for neighbor in adjacency[stack.pop()]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                seen += 1
+                stack.append(neighbor)
+    return seen == count
+
+
+def _columnar_issues(data: Dict[str, Any], directed: bool) -> list[GraphIssue]:
+    """Issues for a version 2 (parallel array) graph document."""
+    issues: list[GraphIssue] = []
+    columns: Dict[str, list] = {}
+    for name in NODE_COLUMNS + EDGE_COLUMNS:
+        column = data.get(name)
+        if column is None and name == "labels":
+            continue
+        if not isinstance(column, list):
             issues.append(_issue(
-                "invalid_node",
-                "Node data must be a dictionary.",
+                "invalid_column",
+                f"Graph '{name}' must be a list.",
                 "error",
-                path=f"nodes.{node_id}",
+                path=name,
             ))
             continue
-
-        label = node_data.get("label")
-        if label is None:
+        columns[name] = column
+    if issues:
+        return issues
+
+    node_ids = columns["node_ids"]
+    node_count = len(node_ids)
+    edge_count = len(columns["edge_src"])
+    for name, column in columns.items():
+        expected = node_count if name in NODE_COLUMNS else edge_count
+        if len(column) != expected:
             issues.append(_issue(
-                "missing_label",
-                f"Node '{node_id}' is missing a label.",
-                "warning",
-                path=f"nodes.{node_id}.label",
-            ))
-        elif not isinstance(label, str):
-            issues.append(_issue(
-                "invalid_label",
-                f"Node '{node_id}' label must be a string.",
+                "column_length",
+                f"Graph '{name}' has {len(column)} entries, expected {expected}.",
                 "error",
-                path=f"nodes.{node_id}.label",
+                path=name,
             ))
+    if issues:
+        return issues
 
-        x_val = node_data.get("x", 0)
-        y_val = node_data.get("y", 0)
-        if not _is_number(x_val):
-            issues.append(_issue(
-                "invalid_x",
-                f"Node '{node_id}' x must be numeric.",
-                "error",
-                path=f"nodes.{node_id}.x",
-            ))
-        if not _is_number(y_val):
+    seen_ids: set[str] = set()
+    for idx, node_id in enumerate(node_ids):
+        if not isinstance(node_id, str) or not node_id:
             issues.append(_issue(
-                "invalid_y",
-                f"Node '{node_id}' y must be numeric.",
+                "invalid_node_id",
+                "Node IDs must be non-empty strings.",
                 "error",
-                path=f"nodes.{node_id}.y",
+                path=f"node_ids[{idx}]",
             ))
-
-    edge_keys: set[tuple[str, str]] = set()
-    for idx, edge in enumerate(edges):
-        path = f"edges[{idx}]"
-        if not isinstance(edge, dict):
+        elif node_id in seen_ids:
             issues.append(_issue(
-                "invalid_edge",
-                "Edge must be a dictionary.",
+                "duplicate_node",
+                f"Node '{node_id}' appears more than once.",
                 "error",
-                path=path,
+                path=f"node_ids[{idx}]",
             ))
-            continue
-
-        start = edge.get("start")
-        end = edge.get("end")
-        weight = edge.get("weight")
+        else:
+            seen_ids.add(node_id)
 
-        if not isinstance(start, str) or not isinstance(end, str):
+    for idx, label in enumerate(columns.get("labels", ())):
+        if label is not None and not isinstance(label, str):
             issues.append(_issue(
-                "invalid_edge_nodes",
-                "Edge 'start' and 'end' must be strings.",
+                "invalid_label",
+                "Node labels must be strings or null.",
                 "error",
-                path=path,
+                path=f"labels[{idx}]",
             ))
-            continue
 
-        if start not in nodes or end not in nodes:
+    for axis in ("x", "y"):
+        for idx, value in enumerate(columns[axis]):
+            if not _is_number(value):
+                issues.append(_issue(
+                    f"invalid_{axis}",
+                    f"Node {axis} must be numeric.",
+                    "error",
+                    path=f"{axis}[{idx}]",
+                ))
+
+    sources = columns["edge_src"]
+    targets = columns["edge_dst"]
+    endpoints_valid = True
+    edge_keys: set[tuple[int, int]] = set()
+    for idx, (start, end, weight) in enumerate(zip(sources, targets, columns["weights"])):
+        if not all(type(value) is int and 0 <= value < node_count for value in (start, end)):
             issues.append(_issue(
                 "edge_missing_node",
-                "Edge references missing node IDs.",
+                "Edge endpoints must be indices into 'node_ids'.",
                 "error",
-                path=path,
+                path=f"edge_src[{idx}]",
             ))
+            endpoints_valid = False
+            continue
 
         if start == end:
             issues.append(_issue(
                 "self_loop",
                 "Edge start and end cannot be the same.",
                 "error",
-                path=path,
+                path=f"edge_src[{idx}]",
             ))
 
         if not _is_number(weight):
@@ -190,60 +356,326 @@ def validate_graph_data(data: Dict[str, Any]) -> list[GraphIssue]:
                 "invalid_weight",
                 "Edge weight must be numeric.",
                 "error",
-                path=f"{path}.weight",
+                path=f"weights[{idx}]",
             ))
         elif weight < 0:
             issues.append(_issue(
                 "negative_weight",
                 "Edge has negative weight; only some algorithms support this.",
                 "warning",
-                path=f"{path}.weight",
+                path=f"weights[{idx}]",
             ))
 
-        edge_key = (start, end) if directed else tuple(sorted([start, end]))
+        edge_key = (start, end) if directed or start < end else (end, start)
         if edge_key in edge_keys:
             issues.append(_issue(
                 "duplicate_edge",
                 "Duplicate edge detected.",
                 "error",
-                path=path,
+                path=f"edge_src[{idx}]",
             ))
         else:
             edge_keys.add(edge_key)
 
-        expected_id = edge_id(start, end, directed)
-        provided_id = edge.get("id")
-        if provided_id is None:
-            issues.append(_issue(
-                "missing_edge_id",
-                "Edge id is missing; expected deterministic id.",
+    if node_count and endpoints_valid and not _is_connected_indices(node_count, sources,
+                                                                    targets):
+        issues.append(_disconnected_issue("edge_src"))
+    return issues
+
+
+class _IssueLimit:
+    """Collects issues until ``max_issues`` or, with ``fail_fast``, the first error."""
+
+    def __init__(self, max_issues: int | None, fail_fast: bool):
+        self.issues: list[GraphIssue] = []
+        self.max_issues = max_issues
+        self.fail_fast = fail_fast
+        self.full = False
+        self.truncated = False
+
+    def would_stop(self, pending: list[GraphIssue]) -> bool:
+        if self.max_issues is not None and len(self.issues) + len(pending) > self.max_issues:
+            return True
+        return self.fail_fast and any(issue.severity == "error" for issue in pending)
+
+    def extend(self, found: Iterable[GraphIssue]) -> bool:
+        """Add ``found``; returns True once no more issues should be collected."""
+        if self.full:
+            return True
+        for issue in found:
+            if self.max_issues is not None and len(self.issues) >= self.max_issues:
+                self.full = self.truncated = True
+                return True
+            self.issues.append(issue)
+            if self.fail_fast and issue.severity == "error":
+                self.full = True
+                return True
+        return False
+
+    def result(self) -> list[GraphIssue]:
+        if self.truncated:
+            self.issues.append(_issue(
+                "issues_truncated",
+                f"Stopped after {self.max_issues} issues.",
                 "warning",
-                path=f"{path}.id",
             ))
-        elif not isinstance(provided_id, str):
-            issues.append(_issue(
-                "invalid_edge_id",
-                "Edge id must be a string.",
+        return self.issues
+
+
+class _KeyPartitions:
+    """Stands in for the ``edge_keys`` set inside a worker process.
+
+    Nothing counts as seen; the index of each keyed edge is bucketed by a
+    stable hash of its key instead, so that duplicates across chunks can be
+    found one bucket at a time.
+    """
+
+    def __init__(self, count: int):
+        self.buckets = [array("q") for _ in range(count)]
+        self.index = 0
+
+    def __contains__(self, key: object) -> bool:
+        return False
+
+    def add(self, key: tuple[str, str]) -> None:
+        encoded = f"{key[0]}\0{key[1]}".encode("utf-8", "surrogatepass")
+        self.buckets[zlib.crc32(encoded) % len(self.buckets)].append(self.index)
+
+
+# The document being validated, handed to each worker once by the pool
+# initializer (inherited for free where processes fork) so that tasks only
+# carry index ranges.
+_worker_nodes: dict = {}
+_worker_node_items: list | None = None
+_worker_edges: list = []
+_worker_directed = False
+
+
+def _init_worker(nodes: dict, edges: list, directed: bool) -> None:
+    global _worker_nodes, _worker_node_items, _worker_edges, _worker_directed
+    _worker_nodes = nodes
+    _worker_node_items = None
+    _worker_edges = edges
+    _worker_directed = directed
+
+
+def _node_chunk_issues(start: int, stop: int) -> list[GraphIssue]:
+    global _worker_node_items
+    if _worker_node_items is None:
+        _worker_node_items = list(_worker_nodes.items())
+    issues: list[GraphIssue] = []
+    for node_id, node_data in _worker_node_items[start:stop]:
+        issues.extend(node_issues(node_id, node_data))
+    return issues
+
+
+def _edge_chunk_issues(start: int, stop: int, partitions: int):
+    """Checks ``edges[start:stop]``.
+
+    Returns ``(issues, key_buckets, forest)``: issues as ``(index, rank,
+    issue)`` so they can be merged with duplicates later, the indices of
+    keyed edges bucketed for the duplicate pass, and the indices of a
+    spanning forest of the slice for the connectivity check.
+    """
+    nodes = _worker_nodes
+    edges = _worker_edges[start:stop]
+    keys = _KeyPartitions(partitions)
+    issues = []
+    for idx, edge in enumerate(edges, start):
+        keys.index = idx
+        for issue in edge_issues(idx, edge, nodes, _worker_directed, keys):
+            issues.append((idx, 2 if issue.code in _EDGE_ID_CODES else 0, issue))
+    forest = array("q", (start + pos for pos in
+                         _spanning_forest(_edge_endpoints(edges), nodes)))
+    return issues, keys.buckets, forest
+
+
+def _duplicate_indices(chunks: list[array]) -> list[int]:
+    edges = _worker_edges
+    directed = _worker_directed
+    seen: set[tuple[str, str]] = set()
+    duplicates: list[int] = []
+    for indices in chunks:
+        for idx in indices:
+            edge = edges[idx]
+            key = _edge_key(edge["start"], edge["end"], directed)
+            if key in seen:
+                duplicates.append(idx)
+            else:
+                seen.add(key)
+    return duplicates
+
+
+def _merge_forests(parts: list[array]) -> array:
+    indices = array("q")
+    for part in parts:
+        indices.extend(part)
+    edges = _worker_edges
+    joins = _spanning_forest(_edge_endpoints(edges[idx] for idx in indices), _worker_nodes)
+    return array("q", (indices[pos] for pos in joins))
+
+
+def _parallel_v1_issues(nodes: dict, edges: list, directed: bool, workers: int,
+                        chunk_size: int, limit: _IssueLimit) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    partitions = workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(nodes, edges, directed)) as pool:
+        node_futures = [pool.submit(_node_chunk_issues, i, i + chunk_size)
+                        for i in range(0, len(nodes), chunk_size)]
+        edge_futures = [pool.submit(_edge_chunk_issues, i, i + chunk_size, partitions)
+                        for i in range(0, len(edges), chunk_size)]
+        for future in node_futures:
+            if limit.extend(future.result()):
+                pool.shutdown(cancel_futures=True)
+                return
+
+        found = []
+        buckets: list[list[array]] = [[] for _ in range(partitions)]
+        forests: list[array] = []
+        complete = True
+        for future in edge_futures:
+            chunk_issues, chunk_buckets, chunk_forest = future.result()
+            found.extend(chunk_issues)
+            for bucket, indices in zip(buckets, chunk_buckets):
+                bucket.append(indices)
+            forests.append(chunk_forest)
+            # Later chunks can only add issues after the cut-off; duplicates
+            # are still resolved for everything read so far.
+            if limit.would_stop([issue for _, _, issue in found]):
+                complete = False
+                for pending in edge_futures:
+                    pending.cancel()
+                break
+
+        for duplicates in pool.map(_duplicate_indices, buckets):
+            found.extend((idx, 1, _issue(
+                "duplicate_edge",
+                "Duplicate edge detected.",
                 "error",
-                path=f"{path}.id",
-            ))
-        elif provided_id != expected_id:
-            issues.append(_issue(
-                "edge_id_mismatch",
-                f"Edge id '{provided_id}' does not match expected '{expected_id}'.",
-                "warning",
-                path=f"{path}.id",
-            ))
+                path=f"edges[{idx}]",
+            )) for idx in duplicates)
+        found.sort(key=lambda item: (item[0], item[1]))
+        if limit.extend(issue for _, _, issue in found) or not complete:
+            return
+
+        # Merge the chunk forests pairwise; every round runs on the pool.
+        while len(forests) > 1:
+            forests = list(pool.map(_merge_forests, (forests[i:i + 2]
+                                                     for i in range(0, len(forests), 2))))
+
+    node_count = sum(1 for node_id in nodes if isinstance(node_id, str))
+    joined = len(forests[0]) if forests else 0
+    if node_count and joined != node_count - 1:
+        limit.extend([_disconnected_issue("edges")])
+
+
+@traced("validate_graph_data")
+def validate_graph_data(data: Dict[str, Any], *, workers: int | None = 1,
+                        chunk_size: int = VALIDATION_CHUNK_SIZE,
+                        max_issues: int | None = None,
+                        fail_fast: bool = False) -> list[GraphIssue]:
+    """Return the issues found in a graph document.
+
+    ``workers`` > 1 (or None for one per CPU) checks version 1 documents in
+    chunks of ``chunk_size`` items on a process pool; the result is the
+    same as a serial run. ``max_issues`` caps the list and appends an
+    ``issues_truncated`` warning when more were found; ``fail_fast`` stops
+    at the first error.
+    """
+    limit = _IssueLimit(max_issues, fail_fast)
+
+    if not isinstance(data, dict):
+        return [_issue("invalid_type", "Graph data must be a dictionary.", "error")]
+
+    version = data.get("version")
+    if version not in SUPPORTED_SCHEMA_VERSIONS:
+        limit.extend([_issue(
+            "invalid_version",
+            f"Unsupported graph version: {version}",
+            "error",
+            path="version",
+        )])
+
+    directed = data.get("directed")
+    if not isinstance(directed, bool):
+        limit.extend([_issue(
+            "invalid_directed",
+            "Graph 'directed' must be a boolean.",
+            "error",
+            path="directed",
+        )])
+        directed = False
+
+    if version == COLUMNAR_SCHEMA_VERSION:
+        limit.extend(_columnar_issues(data, directed))
+        return limit.result()
+
+    nodes = data.get("nodes")
+    if not isinstance(nodes, dict):
+        limit.extend([_issue(
+            "invalid_nodes",
+            "Graph 'nodes' must be a dictionary.",
+            "error",
+            path="nodes",
+        )])
+        nodes = {}
+
+    edges = data.get("edges")
+    if not isinstance(edges, list):
+        limit.extend([_issue(
+            "invalid_edges",
+            "Graph 'edges' must be a list.",
+            "error",
+            path="edges",
+        )])
+        edges = []
+    if limit.full:
+        return limit.result()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(nodes) + len(edges) > chunk_size:
+        _parallel_v1_issues(nodes, edges, directed, workers, chunk_size, limit)
+        return limit.result()
+
+    for node_id, node_data in nodes.items():
+        found = node_issues(node_id, node_data)
+        if found and limit.extend(found):
+            return limit.result()
+
+    edge_keys: set[tuple[str, str]] = set()
+    for idx, edge in enumerate(edges):
+        found = edge_issues(idx, edge, nodes, directed, edge_keys)
+        if found and limit.extend(found):
+            return limit.result()
 
     node_ids = [node_id for node_id in nodes.keys() if isinstance(node_id, str)]
     if node_ids and not _is_connected(node_ids, edges):
-        issues.append(_issue(
-            "graph_disconnected",
-            "Graph is disconnected; some nodes may be unreachable.",
-            "warning",
-            path="edges",
-        ))
+        limit.extend([_disconnected_issue("edges")])
+
+    return limit.result()
 
+
+def _live_graph_issues(graph: Any) -> list[GraphIssue]:
+    # A live Graph cannot hold structural errors, and it tracks negative
+    # edges and components as it is edited, so only warnings remain.
+    issues = []
+    negative = {edge.id for edge in graph.negative_edges()}
+    if negative:
+        # Report at the index the edge gets in to_dict(), as validate_graph_data does.
+        issues = [
+            _issue(
+                "negative_weight",
+                "Edge has negative weight; only some algorithms support this.",
+                "warning",
+                path=f"edges[{idx}].weight",
+            )
+            for idx, edge in enumerate(graph.edges()) if edge.id in negative
+        ]
+    if graph.component_count() > 1:
+        issues.append(_disconnected_issue("edges"))
     return issues
 
 
@@ -251,6 +683,9 @@ def validate_graph(graph: Any) -> list[GraphIssue]:
     if isinstance(graph, dict):
         return validate_graph_data(graph)
 
+    if hasattr(graph, "negative_edges") and hasattr(graph, "component_count"):
+        return _live_graph_issues(graph)
+
     if hasattr(graph, "to_dict"):
         return validate_graph_data(graph.to_dict())
 
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class FileSignature(NamedTuple):
+    mtime_ns: int
+    inode: int
+    size: int
+
+
+def file_signature(path: str | os.PathLike) -> FileSignature | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return FileSignature(mtime_ns=stat.st_mtime_ns, inode=stat.st_ino, size=stat.st_size)
+
+
+def _load_snapshot(path: str | os.PathLike):
+    from .serialization import load_snapshot_file
+
+    return load_snapshot_file(path)
+
+
+class GraphWatcher(Generic[T]):
+    """Polls a graph file and swaps in a freshly loaded value when it changes.
+
+    Loading happens on the polling thread; readers only ever see a fully
+    built value through ``current``, so queries that already hold the old
+    value finish on it undisturbed.
+    """
+
+    def __init__(self, path: str | os.PathLike,
+                 loader: Callable[[str | os.PathLike], T] = _load_snapshot,
+                 interval: float = 1.0,
+                 on_reload: Callable[[T], Any] | None = None,
+                 on_error: Callable[[Exception], Any] | None = None):
+        if interval <= 0:
+            raise ValueError("Poll interval must be positive.")
+        self.path = path
+        self.interval = interval
+        self._loader = loader
+        self._on_reload = on_reload
+        self._on_error = on_error
+        self._current: T | None = None
+        self._signature: FileSignature | None = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def current(self) -> T | None:
+        return self._current
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def load(self) -> T:
+        signature = file_signature(self.path)
+        value = self._loader(self.path)
+        self._swap(value, signature)
+        return value
+
+    def acknowledge(self) -> None:
+        """Accept the file's current state without reloading it (e.g. after saving it)."""
+        with self._lock:
+            self._signature = file_signature(self.path)
+
+    @contextmanager
+    def writing(self):
+        """Hold off polling while we rewrite the file, then acknowledge the result.
+
+        Safe to use from any thread; a failed write leaves the signature alone.
+        """
+        with self._lock:
+            yield
+            self._signature = file_signature(self.path)
+
+    def check(self) -> bool:
+        with self._lock:
+            known = self._signature
+        signature = file_signature(self.path)
+        if signature is None or signature == known:
+            return False
+        # Load without the lock so a concurrent ``writing()`` is not held up
+        # behind a full parse of a large file.
+        try:
+            value = self._loader(self.path)
+        except Exception as exc:
+            with self._lock:
+                if self._signature != known or file_signature(self.path) != signature:
+                    # Rewritten meanwhile; judge the new contents on the next poll.
+                    return False
+                # Keep serving the previous value; retry once the file changes again.
+                self._signature = signature
+            if self._on_error:
+                self._on_error(exc)
+            return False
+        with self._lock:
+            if self._signature != known or file_signature(self.path) != signature:
+                # Written by us, or still being written, while we were loading;
+                # pick up whatever is there on the next poll.
+                return False
+            self._swap(value, signature)
+        if self._on_reload:
+            self._on_reload(value)
+        return True
+
+    def _swap(self, value: T, signature: FileSignature | None) -> None:
+        self._current = value
+        self._signature = signature
+        self._version += 1
+
+    def start(self, initial: T | None = None) -> None:
+        if self._thread is not None:
+            return
+        if initial is None:
+            self.load()
+        else:
+            self._swap(initial, file_signature(self.path))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="graph-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval * 2)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import List
+
+from dijkstra_dashboard.core.errors import GraphError, ValidationError
+from dijkstra_dashboard.core.fileio import atomic_write
+from dijkstra_dashboard.core.schema import COLUMNAR_SCHEMA_VERSION, GRAPH_SCHEMA_VERSION
+from dijkstra_dashboard.core.serialization import graph_to_dict, load_graph_file
+
+TARGETS = {
+    "1": GRAPH_SCHEMA_VERSION,
+    "2": COLUMNAR_SCHEMA_VERSION,
+    "binary": None,
+}
+
+
+def migrate_file(source: str | os.PathLike, destination: str | os.PathLike,
+                 target: str = "2") -> None:
+    """Rewrite a graph file (JSON v1/v2 or binary) in another format."""
+    if target not in TARGETS:
+        raise ValueError(f"Unsupported migration target: {target}")
+    graph = load_graph_file(source)
+    if target == "binary":
+        from dijkstra_dashboard.core.binary import write_binary_graph
+
+        write_binary_graph(graph, destination)
+        return
+
+    version = TARGETS[target]
+    data = graph_to_dict(graph, version=version)
+    with atomic_write(destination, "w", encoding="utf-8") as handle:
+        if version == COLUMNAR_SCHEMA_VERSION:
+            json.dump(data, handle, separators=(",", ":"), ensure_ascii=True)
+        else:
+            json.dump(data, handle, indent=2, ensure_ascii=True)
+        handle.write("\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dijkstra-migrate",
+        description="Convert graph files between schema versions and the binary format.",
+    )
+    parser.add_argument("source", help="Graph file to read (JSON v1/v2 or binary).")
+    parser.add_argument("destination", help="File to write.")
+    parser.add_argument("--to", choices=tuple(TARGETS), default="2",
+                        help="Output format: schema version 1, 2 (columnar), or binary.")
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        migrate_file(args.source, args.destination, args.to)
+    except ValidationError as exc:
+        for issue in exc.issues:
+            print(f"dijkstra-migrate: {issue.path or '-'}: {issue.message}", file=sys.stderr)
+        return 1
+    except (GraphError, OSError, ValueError) as exc:
+        print(f"dijkstra-migrate: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from dijkstra_dashboard.core.cache import LRUCache
+from dijkstra_dashboard.core.errors import GraphError
+from dijkstra_dashboard.core.query import QUERY_KINDS, run_query
+from dijkstra_dashboard.core.serialization import load_snapshot_file
+from dijkstra_dashboard.core.watch import GraphWatcher
+
+MAX_HEADER_BYTES = 64 * 1024
+INTERNAL_ERROR = "Internal server error."
+MAX_BODY_BYTES = 16 * 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15.0
+
+logger = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class QueryService:
+    """Answers queries against a resident snapshot with caching and coalescing."""
+
+    def __init__(self, snapshot, cache_size: int = 1024, workers: int | None = None):
+        # (generation, snapshot) is swapped as one reference so readers never mix them.
+        self._state = (0, snapshot)
+        self._cache = LRUCache(cache_size)
+        self._pending: Dict[Tuple[int, str, str], asyncio.Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix="dijkstra-query")
+
+    @property
+    def snapshot(self):
+        return self._state[1]
+
+    def swap(self, snapshot) -> None:
+        """Serve new queries from ``snapshot``; in-flight queries keep the old one."""
+        self._state = (self._state[0] + 1, snapshot)
+
+    @property
+    def cache(self) -> LRUCache:
+        return self._cache
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _key(generation: int, kind: str, params: dict) -> Tuple[int, str, str]:
+        return generation, kind, json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+    @staticmethod
+    def _evaluate(snapshot, kind: str, params: dict) -> Dict[str, Any]:
+        try:
+            return run_query(snapshot, kind, params)
+        except (GraphError, ValueError, TypeError) as exc:
+            return {"error": str(exc)}
+        except Exception:
+            # An engine bug must still produce a response (and not be cached).
+            logger.exception("%s query failed: %r", kind, params)
+            return {"error": INTERNAL_ERROR}
+
+    def _evaluate_batch(self, snapshot, kind: str, batch: List[dict]) -> List[Dict[str, Any]]:
+        return [self._evaluate(snapshot, kind, params) for params in batch]
+
+    async def query(self, kind: str, params: dict) -> Dict[str, Any]:
+        generation, snapshot = self._state
+        key = self._key(generation, kind, params)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Identical in-flight requests share one evaluation.
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._evaluate,
+                                      snapshot, kind, params)
+        self._pending[key] = future
+        try:
+            result = await future
+        finally:
+            self._pending.pop(key, None)
+        if "error" not in result:
+            self._cache.put(key, result)
+        return result
+
+    async def query_batch(self, kind: str, batch: List[dict]) -> List[Dict[str, Any]]:
+        generation, snapshot = self._state
+        results: List[Dict[str, Any] | None] = []
+        missing: List[int] = []
+        for idx, params in enumerate(batch):
+            cached = (self._cache.get(self._key(generation, kind, params))
+                      if isinstance(params, dict) else None)
+            results.append(cached)
+            if cached is None:
+                missing.append(idx)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            computed = await loop.run_in_executor(
+                self._executor, self._evaluate_batch, snapshot, kind,
+                [batch[idx] for idx in missing],
+            )
+            for idx, result in zip(missing, computed):
+                results[idx] = result
+                if "error" not in result:
+                    self._cache.put(self._key(generation, kind, batch[idx]), result)
+        return results
+
+    def health(self) -> Dict[str, Any]:
+        generation, snapshot = self._state
+        stats = snapshot.get_stats()
+        return {
+            "status": "ok",
+            "generation": generation,
+            "nodes": stats.node_count,
+            "edges": stats.edge_count,
+            "directed": stats.directed,
+            "cache": {"size": len(self._cache), "hits": self._cache.hits,
+                      "misses": self._cache.misses},
+        }
+
+
+def _params_from_query_string(query: str) -> dict:
+    params: Dict[str, Any] = {}
+    for name, values in parse_qs(query).items():
+        value = values[-1]
+        if name in ("sources", "targets"):
+            params[name] = [item for item in value.split(",") if item]
+        elif name == "max_distance":
+            try:
+                params[name] = float(value)
+            except ValueError:
+                raise RequestError(HTTPStatus.BAD_REQUEST, "max_distance must be numeric.")
+        else:
+            params[name] = value
+    return params
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial.strip():
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Incomplete request.")
+        return None
+    except asyncio.LimitOverrunError:
+        raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Headers too large.")
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+    if length < 0 or length > MAX_BODY_BYTES:
+        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large.")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, version.upper(), headers, body
+
+
+def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+def _encode_response(status: HTTPStatus, payload: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def _dispatch(service: QueryService, method: str, target: str,
+                    body: bytes) -> Tuple[HTTPStatus, Any]:
+    url = urlsplit(target)
+    kind = url.path.strip("/")
+
+    if kind == "health" and method == "GET":
+        return HTTPStatus.OK, service.health()
+    if kind not in QUERY_KINDS:
+        raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}")
+
+    if method == "GET":
+        payload: Any = _params_from_query_string(url.query)
+    elif method == "POST":
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Request body must be JSON.")
+    else:
+        raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"Unsupported method: {method}")
+
+    if isinstance(payload, list):
+        return HTTPStatus.OK, await service.query_batch(kind, payload)
+    if not isinstance(payload, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Request body must be an object or a list.")
+
+    result = await service.query(kind, payload)
+    if "error" in result:
+        if result["error"] == INTERNAL_ERROR:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, result
+        return HTTPStatus.BAD_REQUEST, result
+    return HTTPStatus.OK, result
+
+
+async def handle_connection(service: QueryService, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            try:
+                request = await asyncio.wait_for(_read_request(reader), KEEP_ALIVE_TIMEOUT)
+            except asyncio.TimeoutError:
+                break
+            except RequestError as exc:
+                writer.write(_encode_response(exc.status, {"error": str(exc)}, False))
+                await writer.drain()
+                break
+            if request is None:
+                break
+
+            method, target, version, headers, body = request
+            keep_alive = _keep_alive(version, headers)
+            try:
+                status, payload = await _dispatch(service, method, target, body)
+            except RequestError as exc:
+                status, payload = exc.status, {"error": str(exc)}
+            except Exception:
+                logger.exception("%s %s failed", method, target)
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": INTERNAL_ERROR}
+            writer.write(_encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_server(service: QueryService, host: str = "127.0.0.1",
+                       port: int = 8080) -> asyncio.AbstractServer:
+    async def _on_connect(reader, writer):
+        await handle_connection(service, reader, writer)
+
+    return await asyncio.start_server(_on_connect, host, port, limit=MAX_HEADER_BYTES)
+
+
+async def serve(service: QueryService, host: str, port: int) -> None:
+    server = await start_server(service, host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving graph queries on {addresses}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dijkstra-serve",
+        description="Serve shortest-path queries over HTTP from a resident graph.",
+    )
+    parser.add_argument("graph", help="Path to a graph JSON file.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="Maximum number of cached query results.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Query worker threads (default: executor default).")
+    parser.add_argument("--watch", action="store_true",
+                        help="Reload the graph in the background when the file changes.")
+    parser.add_argument("--watch-interval", type=float, default=1.0,
+                        help="Seconds between file change checks.")
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    snapshot = load_snapshot_file(args.graph)
+    service = QueryService(snapshot, cache_size=args.cache_size, workers=args.workers)
+
+    watcher = None
+    if args.watch:
+        watcher = GraphWatcher(
+            args.graph,
+            interval=args.watch_interval,
+            on_reload=service.swap,
+            on_error=lambda exc: print(f"Reload failed: {exc}", file=sys.stderr, flush=True),
+        )
+        watcher.start(initial=snapshot)
+
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,16 +3,26 @@ from PyQt6.QtCore import Qt, QPointF, QTimer, QRectF, QPoint, pyqtSignal
 from PyQt6.QtGui import QPen, QBrush, QColor, QLinearGradient, QWheelEvent, QMouseEvent, QResizeEvent
 from .graph_node import GraphNode
 from .graph_edge import GraphEdge
-from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.algorithms.registry import get_algorithm, select_algorithm
 from dijkstra_dashboard.core.algorithms.runner import apply_step, init_state
 from dijkstra_dashboard.core.errors import AlgorithmError
 from dijkstra_dashboard.core.graph import Graph
+from dijkstra_dashboard.core.layouts import incremental_layout
+from dijkstra_dashboard.core.layouts.jobs import LayoutJob
+from dijkstra_dashboard.core.tracing import traced
 import math
+import threading
 
 class GraphView(QGraphicsView):
     graph_changed = pyqtSignal()
     message_changed = pyqtSignal(str)
     playback_finished = pyqtSignal()
+    layout_finished = pyqtSignal()
+    layout_failed = pyqtSignal(str)
+    # Emitted from layout worker threads; queued onto the UI thread by Qt.
+    _layout_frame_ready = pyqtSignal()
+    _layout_done = pyqtSignal(object, object)
+    _layout_error = pyqtSignal(object, str)
 
     def __init__(self, status_panel=None):
         super().__init__()
@@ -54,6 +64,16 @@ class GraphView(QGraphicsView):
         self.edges = {}
         self.graph = None
         self.pending_edge_start = None
+
+        # Background layout: only the newest frame waits to be applied.
+        self._layout_job = None
+        self.layout_cache = None
+        self._frame_lock = threading.Lock()
+        self._pending_frame = None
+        self._moving_batch = False
+        self._layout_frame_ready.connect(self._apply_pending_frame)
+        self._layout_done.connect(self._on_layout_done)
+        self._layout_error.connect(self._on_layout_error)
         
         # Animation timer
         self.animation_timer = QTimer()
@@ -297,7 +317,9 @@ class GraphView(QGraphicsView):
 
         self.set_graph(graph)
 
+    @traced("GraphView.set_graph")
     def set_graph(self, graph):
+        self.cancel_layout()
         self.graph = graph
         self.pending_edge_start = None
         self._clear_message()
@@ -397,6 +419,96 @@ class GraphView(QGraphicsView):
         self.scene.addItem(node_item)
         self.graph_changed.emit()
 
+    def settle_nodes(self, node_ids, positioned=True):
+        """Lay out the neighbourhood of ``node_ids`` and leave the rest in place.
+
+        With ``positioned=False`` their current coordinates are ignored and
+        they start next to their neighbours instead.
+        """
+        if not self.graph or not node_ids:
+            return
+        changed = set(node_ids)
+        positions = {node.id: (node.x, node.y) for node in self.graph.nodes()
+                     if positioned or node.id not in changed}
+        edges = [(start, end) for start, end, _ in self.graph.get_edges()]
+        layout = incremental_layout(self.graph.get_nodes(), edges, positions, changed=changed)
+        self.apply_positions({node_id: xy for node_id, xy in layout.items()
+                              if positions.get(node_id) != xy})
+
+    def apply_positions(self, positions):
+        """Move many nodes at once, then refresh every edge in a single pass."""
+        if not positions:
+            return
+        self._moving_batch = True
+        try:
+            for node_id, (x, y) in positions.items():
+                node_item = self.nodes.get(node_id)
+                if node_item is not None:
+                    # The move callback keeps the graph's coordinates in sync.
+                    node_item.setPos(QPointF(x, y))
+        finally:
+            self._moving_batch = False
+        for edge in self.edges.values():
+            edge.update_position()
+
+    def run_layout(self, name, **params):
+        """Lay the graph out with a ``core.layouts`` engine on a worker thread.
+
+        Intermediate frames animate the nodes into place; a layout found in
+        ``layout_cache`` is applied straight away. Starting another layout or
+        loading a graph cancels the running one.
+        """
+        if not self.graph:
+            return None
+        self.cancel_layout()
+        self._clear_message()
+        edges = [(start, end) for start, end, _ in self.graph.get_edges()]
+        job = LayoutJob(name, self.graph.get_nodes(), edges, params,
+                        on_frame=lambda positions: self._queue_frame(job, positions),
+                        on_done=lambda positions: self._layout_done.emit(job, positions),
+                        on_error=lambda exc: self._layout_error.emit(job, str(exc)),
+                        cache=self.layout_cache)
+        self._layout_job = job
+        return job.start()
+
+    def cancel_layout(self):
+        job = self._layout_job
+        self._layout_job = None
+        if job is not None:
+            job.cancel()
+        with self._frame_lock:
+            self._pending_frame = None
+
+    def is_layout_running(self):
+        return self._layout_job is not None
+
+    def _queue_frame(self, job, positions):
+        with self._frame_lock:
+            idle = self._pending_frame is None
+            self._pending_frame = (job, positions)
+        if idle:
+            self._layout_frame_ready.emit()
+
+    def _apply_pending_frame(self):
+        with self._frame_lock:
+            pending = self._pending_frame
+            self._pending_frame = None
+        if pending is not None and pending[0] is self._layout_job:
+            self.apply_positions(pending[1])
+
+    def _on_layout_done(self, job, positions):
+        if job is not self._layout_job:
+            return
+        self.cancel_layout()
+        self.apply_positions(positions)
+        self.layout_finished.emit()
+
+    def _on_layout_error(self, job, message):
+        if job is not self._layout_job:
+            return
+        self.cancel_layout()
+        self.layout_failed.emit(message)
+
     def handle_node_click(self, node_item):
         node_id = node_item.node_id
         if self.pending_edge_start is None:
@@ -453,6 +565,8 @@ class GraphView(QGraphicsView):
         node_id = node_item.node_id
         if self.graph:
             self.graph.set_node_position(node_id, new_pos.x(), new_pos.y())
+        if self._moving_batch:
+            return
         for edge in self.edges.values():
             if edge.start_node is node_item or edge.end_node is node_item:
                 edge.update_position()
@@ -687,8 +801,9 @@ class GraphView(QGraphicsView):
         if not self.graph:
             return False
 
-        algorithm = DijkstraAlgorithm()
         try:
+            # Directed acyclic graphs get the linear-time engine.
+            algorithm = get_algorithm(select_algorithm(self.graph))()
             result = algorithm.solve(self.graph, {
                 "start": start_node,
                 "target": target_node,
@@ -742,6 +857,7 @@ class GraphView(QGraphicsView):
     def set_animation_interval(self, interval_ms):
         self.animation_timer.setInterval(max(50, int(interval_ms)))
 
+    @traced("GraphView.animate_step")
     def animate_step(self):
         if self.step_index >= len(self.steps):
             self._finalize_visualization()
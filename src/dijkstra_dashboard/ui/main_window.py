@@ -1,19 +1,38 @@
-import json
+import threading
 
-from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QLabel, QProgressDialog
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPalette, QColor, QAction
 from .graph_view import GraphView
 from .controls_panel import ControlsPanel
 from .status_panel import StatusPanel
-from dijkstra_dashboard.core.graph import Graph
+from dijkstra_dashboard.core.layouts import LayoutCache
+from dijkstra_dashboard.core.serialization import load_graph_file
+from dijkstra_dashboard.core.streaming import GraphItems, write_graph_file
+from dijkstra_dashboard.core.watch import GraphWatcher
+
+# Graphs opened without coordinates are laid out on a fixed canvas so the
+# result is cached under the same key whatever the window size.
+AUTO_LAYOUT_SIZE = (800.0, 600.0)
+AUTO_SPRING_MAX_NODES = 5000
+
 
 class MainWindow(QMainWindow):
+    # Emitted from the watcher and save threads; queued onto the UI thread by Qt.
+    graph_file_reloaded = pyqtSignal(object)
+    graph_reload_failed = pyqtSignal(str)
+    graph_saved = pyqtSignal(str)
+    graph_save_failed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Dijkstra Path Visualizer")
         self.setMinimumSize(1000, 700)
         self.graph_path = None
+        self.graph_watcher = None
+        self.save_thread = None
+        self._saved_state = None
+        self._saving_state = None
         
         # Set dark theme
         self.set_dark_theme()
@@ -54,6 +73,8 @@ class MainWindow(QMainWindow):
         self.graph_view = GraphView()
         left_layout.addWidget(self.graph_view)
         self.graph_view.status_panel = self.status_panel
+        self.layout_cache = LayoutCache()
+        self.graph_view.layout_cache = self.layout_cache
         self.controls_panel.set_nodes(self.graph_view.get_node_items())
         if self.graph_view.get_graph():
             self._set_directed_toggle(self.graph_view.get_graph().directed)
@@ -80,6 +101,12 @@ class MainWindow(QMainWindow):
         self.graph_view.graph_changed.connect(self.on_graph_changed)
         self.graph_view.message_changed.connect(self.on_message_changed)
         self.graph_view.playback_finished.connect(self.on_playback_finished)
+        self.graph_view.layout_finished.connect(self.on_layout_finished)
+        self.graph_view.layout_failed.connect(self.on_layout_failed)
+        self.graph_file_reloaded.connect(self.on_graph_file_reloaded)
+        self.graph_reload_failed.connect(self.on_graph_reload_failed)
+        self.graph_saved.connect(self.on_graph_saved)
+        self.graph_save_failed.connect(self.on_graph_save_failed)
 
         self.on_speed_changed(self.controls_panel.speed_slider.value())
 
@@ -115,6 +142,24 @@ class MainWindow(QMainWindow):
         save_as_action.triggered.connect(self.save_graph_as)
         file_menu.addAction(save_as_action)
 
+        file_menu.addSeparator()
+        self.reload_action = QAction("Reload on Change", self)
+        self.reload_action.setCheckable(True)
+        self.reload_action.toggled.connect(self.on_reload_toggled)
+        file_menu.addAction(self.reload_action)
+
+        layout_menu = self.menuBar().addMenu("Layout")
+        for title, name in (("Spring", "spring"), ("Multilevel (Large Graphs)", "multilevel"),
+                            ("Pivot MDS (Large Graphs, NumPy)", "pivot_mds"),
+                            ("Circle", "circle")):
+            action = QAction(title, self)
+            action.triggered.connect(lambda checked=False, name=name: self.run_layout(name))
+            layout_menu.addAction(action)
+        layout_menu.addSeparator()
+        cancel_layout_action = QAction("Cancel Layout", self)
+        cancel_layout_action.triggered.connect(self.cancel_layout)
+        layout_menu.addAction(cancel_layout_action)
+
         help_menu = self.menuBar().addMenu("Help")
         controls_action = QAction("Controls...", self)
         controls_action.triggered.connect(self.show_controls_help)
@@ -213,6 +258,34 @@ class MainWindow(QMainWindow):
             else:
                 self.status_panel.update_status("Undirected mode enabled (one weight per edge).")
 
+    def run_layout(self, name):
+        # Fit the layout inside the visible scene, leaving room for node radii.
+        rect = self.graph_view.scene.sceneRect()
+        width = max(1.0, rect.width() - 60)
+        height = max(1.0, rect.height() - 60)
+        if name == "circle":
+            params = {"radius": min(width, height) / 2}
+        elif name == "pivot_mds":
+            params = {"width": width, "height": height, "stress_iterations": 20}
+        else:
+            params = {"width": width, "height": height}
+        if self.graph_view.run_layout(name, **params) is not None and self.status_panel:
+            self.status_panel.update_status(f"Running {name} layout...")
+
+    def cancel_layout(self):
+        if self.graph_view.is_layout_running():
+            self.graph_view.cancel_layout()
+            if self.status_panel:
+                self.status_panel.update_status("Layout cancelled.")
+
+    def on_layout_finished(self):
+        if self.status_panel:
+            self.status_panel.update_status("Layout finished.")
+
+    def on_layout_failed(self, message):
+        if self.status_panel:
+            self.status_panel.update_status(f"Layout failed: {message}", "#ff5555")
+
     def show_controls_help(self):
         QMessageBox.information(
             self,
@@ -241,25 +314,127 @@ class MainWindow(QMainWindow):
             self,
             "Open Graph",
             "",
-            "Graph JSON (*.json);;All Files (*)",
+            "Graph Files (*.json *.json.gz *.json.xz *.djg);;"
+            "Imports (*.gr *.gr.gz *.csv *.edges *.edgelist *.el);;All Files (*)",
         )
         if not path:
             return
 
+        # Large files are parsed incrementally; a modal dialog's setValue also
+        # pumps the event loop so the window stays responsive while loading.
+        dialog = QProgressDialog("Loading graph...", None, 0, 100, self)
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(500)
+
+        def on_progress(done, total):
+            if total:
+                dialog.setValue(min(100, done * 100 // total))
+
         try:
-            with open(path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            graph = Graph.from_dict(data)
+            graph = load_graph_file(path, progress=on_progress)
         except Exception as exc:
             QMessageBox.critical(self, "Load Error", str(exc))
             return
+        finally:
+            dialog.close()
+
+        self._show_graph(graph)
+        self.graph_path = path
+        self._restart_watcher(graph)
+        if self.status_panel:
+            self.status_panel.update_status(f"Loaded graph: {path}")
+        self._layout_if_unplaced(graph)
 
+    def _layout_if_unplaced(self, graph):
+        # Edge-list imports carry no coordinates, so every node loads at one spot.
+        nodes = list(graph.nodes())
+        if len(nodes) < 2 or len({(node.x, node.y) for node in nodes}) > 1:
+            return
+        name = "spring" if len(nodes) <= AUTO_SPRING_MAX_NODES else "multilevel"
+        width, height = AUTO_LAYOUT_SIZE
+        self.graph_view.run_layout(name, width=width, height=height)
+        if self.status_panel:
+            self.status_panel.update_status(f"Graph has no positions; running {name} layout...")
+
+    def _show_graph(self, graph):
         self.graph_view.set_graph(graph)
         self.controls_panel.set_nodes(self.graph_view.get_node_items())
         self._set_directed_toggle(graph.directed)
-        self.graph_path = path
+        self._saved_state = self._graph_state(graph)
+
+    @staticmethod
+    def _graph_state(graph):
+        # Graph.version covers structural edits; dragged or laid-out
+        # positions do not bump it, so they are compared directly.
+        return graph, graph.version, [(node.x, node.y) for node in graph.nodes()]
+
+    def has_unsaved_changes(self):
+        graph = self.graph_view.get_graph()
+        return graph is not None and self._graph_state(graph) != self._saved_state
+
+    def _stop_watcher(self):
+        if self.graph_watcher is not None:
+            self.graph_watcher.stop()
+            self.graph_watcher = None
+
+    def _restart_watcher(self, graph=None):
+        self._stop_watcher()
+        if not self.reload_action.isChecked() or not self.graph_path:
+            return
+        self.graph_watcher = GraphWatcher(
+            self.graph_path,
+            loader=load_graph_file,
+            on_reload=self.graph_file_reloaded.emit,
+            on_error=lambda exc: self.graph_reload_failed.emit(str(exc)),
+        )
+        try:
+            self.graph_watcher.start(initial=graph or self.graph_view.get_graph())
+        except Exception as exc:
+            self.graph_watcher = None
+            QMessageBox.critical(self, "Reload Error", str(exc))
+
+    def on_reload_toggled(self, checked):
+        if checked:
+            self._restart_watcher()
+        else:
+            self._stop_watcher()
+
+    def on_graph_file_reloaded(self, graph):
+        if self.has_unsaved_changes():
+            answer = QMessageBox.question(
+                self,
+                "Graph Changed on Disk",
+                f"{self.graph_path} was changed by another program.\n"
+                "Reload it and discard your unsaved changes?",
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                if self.status_panel:
+                    self.status_panel.update_status(
+                        "Graph file changed on disk; kept your unsaved changes.", "#ffaa00")
+                return
+        previous = self.graph_view.get_graph()
+        self._show_graph(graph)
+        if previous is not None:
+            # Nodes added to the file without coordinates load at the origin;
+            # place them next to their neighbours without moving anything else.
+            unplaced = [node.id for node in graph.nodes()
+                        if not previous.has_node(node.id) and node.x == 0 and node.y == 0]
+            self.graph_view.settle_nodes(unplaced, positioned=False)
+            self._saved_state = self._graph_state(graph)
         if self.status_panel:
-            self.status_panel.update_status(f"Loaded graph: {path}")
+            self.status_panel.update_status(f"Reloaded graph: {self.graph_path}")
+
+    def on_graph_reload_failed(self, message):
+        if self.status_panel:
+            self.status_panel.update_status(f"Reload failed: {message}", "#ff5555")
+
+    def closeEvent(self, event):
+        self._stop_watcher()
+        self.graph_view.cancel_layout()
+        if self.save_thread is not None:
+            # Let an in-flight save finish rather than leave a temp file behind.
+            self.save_thread.join()
+        super().closeEvent(event)
 
     def save_graph(self):
         if not self.graph_path:
@@ -272,29 +447,57 @@ class MainWindow(QMainWindow):
             self,
             "Save Graph As",
             "",
-            "Graph JSON (*.json);;All Files (*)",
+            "Graph JSON (*.json);;Compressed Graph JSON (*.json.gz *.json.xz);;All Files (*)",
         )
         if not path:
             return
-        if not path.endswith(".json"):
+        if not path.endswith((".json", ".json.gz", ".json.xz")):
             path = f"{path}.json"
         self._write_graph(path)
-        self.graph_path = path
 
     def _write_graph(self, path):
         graph = self.graph_view.get_graph()
         if graph is None:
             QMessageBox.warning(self, "Save Error", "No graph to save.")
             return
+        if self.save_thread is not None and self.save_thread.is_alive():
+            if self.status_panel:
+                self.status_panel.update_status("A save is already in progress.", "#ffaa00")
+            return
 
+        # Only the node and edge lists are copied here; formatting and file
+        # I/O happen on the worker so large graphs do not block the UI.
+        items = GraphItems.of(graph)
+        self._saving_state = self._graph_state(graph)
+        watcher = self.graph_watcher if self.graph_path == path else None
+        self.save_thread = threading.Thread(
+            target=self._save_worker, args=(items, path, watcher), name="graph-save",
+        )
+        self.save_thread.start()
+        if self.status_panel:
+            self.status_panel.update_status(f"Saving graph: {path}")
+
+    def _save_worker(self, items, path, watcher):
         try:
-            data = graph.to_dict()
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, ensure_ascii=True)
-                handle.write("\n")
+            if watcher is not None:
+                # Our own write should not bounce back as a reload.
+                with watcher.writing():
+                    write_graph_file(items, path)
+            else:
+                write_graph_file(items, path)
         except Exception as exc:
-            QMessageBox.critical(self, "Save Error", str(exc))
+            self.graph_save_failed.emit(str(exc))
             return
-
+        self.graph_saved.emit(path)
+
+    def on_graph_saved(self, path):
+        # Edits made while the worker was writing are still unsaved.
+        self._saved_state = self._saving_state
+        if path != self.graph_path:
+            self.graph_path = path
+            self._restart_watcher()
         if self.status_panel:
             self.status_panel.update_status(f"Saved graph: {path}")
+
+    def on_graph_save_failed(self, message):
+        QMessageBox.critical(self, "Save Error", message)
@@ -0,0 +1,89 @@
+import pytest
+
+from dijkstra_dashboard.core import components
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.binary import (
+    BinaryFormatError,
+    open_binary_graph,
+    write_binary_graph,
+)
+from dijkstra_dashboard.core.generators import erdos_renyi_graph
+from dijkstra_dashboard.core.serialization import load_graph_file, load_snapshot_file
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_binary_roundtrip(tmp_path, monkeypatch, directed):
+    graph = erdos_renyi_graph(40, 0.15, directed=directed, seed=5)
+    graph.rename_node('n3', 'Zürich')
+    path = tmp_path / "graph.djg"
+    write_binary_graph(graph, path)
+
+    snapshot = open_binary_graph(path)
+    assert snapshot.directed is directed
+    assert snapshot.metadata == graph.metadata
+    assert list(snapshot.nodes()) == list(graph.nodes())
+    assert set(snapshot.get_edges()) == set(graph.get_edges())
+    assert snapshot.get_node_label('n3') == 'Zürich'
+    adjacency = snapshot.to_adjacency_dict()
+    assert 'missing' not in adjacency and len(adjacency) == len(graph.get_nodes())
+    assert dict(adjacency) == graph.to_adjacency_dict()
+    start = graph.get_nodes()[0]
+    # Component labels come from the file rather than a fresh Tarjan pass.
+    with monkeypatch.context() as patch:
+        patch.setattr(components, "_strong_components", None)
+        patch.setattr(components, "_weak_components", None)
+        stored = snapshot.component_index()
+        assert stored.may_reach(start, start)
+    rebuilt = graph.component_index()
+    assert stored.components() == rebuilt.components()
+    assert stored.condensation() == rebuilt.condensation()
+    assert stored.topological_order() == rebuilt.topological_order()
+
+    expected = DijkstraAlgorithm().solve(graph, {"start": start}).distances
+    assert DijkstraAlgorithm().solve(snapshot, {"start": start}).distances == expected
+
+
+def test_load_functions_detect_binary(tmp_path, sample_graph):
+    path = tmp_path / "graph.bin"
+    write_binary_graph(sample_graph.freeze(), path)
+    assert load_snapshot_file(path).get_stats() == sample_graph.get_stats()
+    graph = load_graph_file(path)
+    graph.add_node('G')
+    assert graph.has_node('G')
+
+
+def test_open_binary_graph_rejects_bad_files(tmp_path, sample_graph):
+    path = tmp_path / "graph.djg"
+    write_binary_graph(sample_graph, path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[:len(data) // 2])
+    with pytest.raises(BinaryFormatError, match="truncated"):
+        open_binary_graph(path)
+
+    path.write_bytes(data[:8] + b"\x63\x00\x00\x00" + data[12:])
+    with pytest.raises(BinaryFormatError, match="version"):
+        open_binary_graph(path)
+
+
+def test_write_binary_graph_cleans_up_on_failure(tmp_path, sample_graph, monkeypatch):
+    path = tmp_path / "graph.djg"
+    write_binary_graph(sample_graph, path)
+    original = path.read_bytes()
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("dijkstra_dashboard.core.fileio.os.fsync", fail)
+    sample_graph.add_node('G')
+    with pytest.raises(OSError, match="disk full"):
+        write_binary_graph(sample_graph, path)
+    assert path.read_bytes() == original
+    assert [p.name for p in tmp_path.iterdir()] == ["graph.djg"]
+
+
+def test_binary_header_records_negative_weights(tmp_path, sample_graph, negative_weight_graph):
+    for graph, expected in ((sample_graph, False), (negative_weight_graph, True)):
+        path = tmp_path / "graph.djg"
+        write_binary_graph(graph, path)
+        assert open_binary_graph(path).has_negative_weights() is expected
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.generators import erdos_renyi_graph
+from dijkstra_dashboard.core.graph import Graph
+
+
+def _reachable(graph, start):
+    adjacency = graph.to_adjacency_dict()
+    seen = {start}
+    stack = [start]
+    while stack:
+        for neighbor, _ in adjacency[stack.pop()]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_component_index_matches_reachability(seed):
+    graph = erdos_renyi_graph(40, 0.04, directed=True, seed=seed)
+    for frozen in (graph, graph.freeze()):
+        index = frozen.component_index()
+        reach = {node: _reachable(graph, node) for node in graph.get_nodes()}
+        for a in graph.get_nodes():
+            for b in graph.get_nodes():
+                mutual = b in reach[a] and a in reach[b]
+                assert (index.component(a) == index.component(b)) == mutual
+                if b in reach[a]:
+                    assert index.may_reach(a, b)
+                    assert index.topological_rank(a) <= index.topological_rank(b)
+        for component, successors in enumerate(index.condensation()):
+            assert all(successor < component for successor in successors)
+
+
+def test_component_index_is_exact_for_undirected(disconnected_graph):
+    index = disconnected_graph.component_index()
+    assert index.component_count == 2
+    assert index.may_reach('A', 'B')
+    assert not index.may_reach('A', 'X')
+    assert not index.is_connected()
+    disconnected_graph.add_edge('B', 'X', 1)
+    assert disconnected_graph.component_index().is_connected()
+
+
+def test_component_index_handles_long_chains():
+    ids = [f"v{i}" for i in range(20_000)]
+    graph = Graph.from_arrays(ids, list(range(len(ids) - 1)), list(range(1, len(ids))),
+                              [1.0] * (len(ids) - 1), directed=True)
+    index = graph.component_index()
+    assert index.component_count == len(ids)
+    assert index.may_reach('v0', 'v19999')
+    assert not index.may_reach('v19999', 'v0')
+
+
+def test_dijkstra_skips_search_for_unreachable_target():
+    graph = Graph(directed=True)
+    for node in "ABCD":
+        graph.add_node(node)
+    graph.add_edge('A', 'B', 1)
+    graph.add_edge('C', 'D', 1)
+    graph.add_edge('B', 'C', 1)
+    result = DijkstraAlgorithm().solve(graph, {"start": 'C', "target": 'A',
+                                               "collect_stats": True})
+    assert result.path == []
+    assert result.distance == float("inf")
+    assert result.stats.nodes_settled == 0
+    steps = list(DijkstraAlgorithm().iter_steps(graph, {"start": 'D', "target": 'B'}))
+    assert [step["kind"] for step in steps] == ["final"]
+    assert DijkstraAlgorithm().solve(graph, {"start": 'A', "target": 'D'}).distance == 3
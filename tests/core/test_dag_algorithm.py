@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from dijkstra_dashboard.core.algorithms.dag import DagShortestPathAlgorithm
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.algorithms.registry import select_algorithm
+from dijkstra_dashboard.core.algorithms.runner import apply_steps
+from dijkstra_dashboard.core.errors import AlgorithmError
+from dijkstra_dashboard.core.graph import Graph
+from dijkstra_dashboard.core.query import isochrone, route
+
+INF = float("inf")
+
+
+def _random_dag(seed, count=30, low=-5):
+    rng = random.Random(seed)
+    ids = [f"t{i}" for i in range(count)]
+    rng.shuffle(ids)
+    graph = Graph(directed=True)
+    for node_id in ids:
+        graph.add_node(node_id)
+    for i in range(count):
+        for j in range(i + 1, count):
+            if rng.random() < 0.15:
+                graph.add_edge(ids[i], ids[j], rng.uniform(low, 10))
+    return graph
+
+
+def _bellman_ford(graph, start, longest):
+    sign = -1 if longest else 1
+    best = {node: INF for node in graph.get_nodes()}
+    best[start] = 0.0
+    for _ in graph.get_nodes():
+        for u, v, weight in graph.get_edges():
+            if best[u] + sign * weight < best[v]:
+                best[v] = best[u] + sign * weight
+    return {node: sign * dist if dist != INF else INF for node, dist in best.items()}
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("mode", ["shortest", "longest"])
+def test_dag_matches_bellman_ford(seed, mode):
+    graph = _random_dag(seed)
+    start = graph.get_nodes()[0]
+    result = DagShortestPathAlgorithm().solve(graph, {"start": start, "mode": mode})
+    expected = _bellman_ford(graph, start, mode == "longest")
+    assert result.distances == pytest.approx(expected)
+    for node, path in result.paths.items():
+        if path:
+            weights = dict(((u, v), w) for u, v, w in graph.get_edges())
+            assert sum(weights[pair] for pair in zip(path, path[1:])) == pytest.approx(
+                expected[node])
+
+    state = apply_steps(DagShortestPathAlgorithm().iter_steps(graph, {"start": start,
+                                                                       "mode": mode}),
+                        graph.get_nodes())
+    # Replayed steps never relax the start node itself.
+    assert state.distances == pytest.approx(dict(expected, **{start: INF}))
+
+
+def test_dag_rejects_cycles_and_undirected_graphs(sample_graph):
+    with pytest.raises(AlgorithmError, match="directed"):
+        DagShortestPathAlgorithm().solve(sample_graph, {"start": 'A'})
+    sample_graph.set_directed(True)
+    sample_graph.add_edge('F', 'A', 1)
+    with pytest.raises(AlgorithmError, match="cycle"):
+        DagShortestPathAlgorithm().solve(sample_graph, {"start": 'A'})
+    assert select_algorithm(sample_graph) == "dijkstra"
+
+
+def test_route_uses_dag_engine_for_negative_weights():
+    graph = Graph(directed=True)
+    for node in "ABCD":
+        graph.add_node(node)
+    graph.add_edge('A', 'B', 4)
+    graph.add_edge('A', 'C', 1)
+    graph.add_edge('B', 'D', -3)
+    graph.add_edge('C', 'D', 2)
+    assert select_algorithm(graph) == "dag"
+    assert route(graph, 'A', 'D') == {"start": 'A', "target": 'D', "distance": 1.0,
+                                      "path": ['A', 'B', 'D']}
+    critical = DagShortestPathAlgorithm().solve(graph, {"start": 'A', "target": 'D',
+                                                        "mode": "longest"})
+    assert critical.path == ['A', 'C', 'D']
+    assert critical.distance == 3.0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_dag_isochrone_matches_dijkstra(seed):
+    graph = _random_dag(seed, low=0)
+    start = graph.get_nodes()[0]
+    expected = DijkstraAlgorithm().solve(graph, {"start": start, "max_distance": 12})
+    result = DagShortestPathAlgorithm().solve(graph, {"start": start, "max_distance": 12})
+    assert set(result.visited_order) == set(expected.visited_order)
+    assert isochrone(graph, start, 12)["nodes"] == pytest.approx(
+        {node: dist for node, dist in expected.distances.items() if dist <= 12})
+
+
+def test_dag_max_distance_with_negative_weights():
+    graph = _random_dag(0)
+    start = graph.get_nodes()[0]
+    exact = _bellman_ford(graph, start, longest=False)
+    result = isochrone(graph, start, 3)
+    assert result["nodes"] == pytest.approx({node: dist for node, dist in exact.items()
+                                             if dist <= 3})
+    with pytest.raises(AlgorithmError, match="longest"):
+        DagShortestPathAlgorithm().solve(graph, {"start": start, "mode": "longest",
+                                                 "max_distance": 3})
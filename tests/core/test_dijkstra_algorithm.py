@@ -17,6 +17,10 @@ def test_dijkstra_unreachable_target(disconnected_graph):
     assert result.path == []
     assert result.distance == float("inf")
 
+    paths = algo.solve(disconnected_graph, {"start": "A"}).paths
+    assert type(paths) is dict
+    assert paths == {'A': ['A'], 'B': ['A', 'B'], 'X': []}
+
 
 def test_dijkstra_negative_weight_raises(negative_weight_graph):
     algo = DijkstraAlgorithm()
@@ -28,3 +32,17 @@ def test_dijkstra_iter_steps_final(sample_graph):
     algo = DijkstraAlgorithm()
     steps = list(algo.iter_steps(sample_graph, {"start": "A", "target": "F"}))
     assert steps[-1]["kind"] == "final"
+
+
+def test_dijkstra_stats_are_opt_in(sample_graph):
+    algo = DijkstraAlgorithm()
+    assert algo.solve(sample_graph, {"start": "A", "target": "F"}).stats is None
+
+    result = algo.solve(sample_graph, {"start": "A", "target": "F", "collect_stats": True})
+    stats = result.stats
+    assert stats.nodes_settled == len(result.visited_order)
+    assert stats.queue_pushes == stats.relaxations + 1
+    assert stats.queue_pops >= stats.nodes_settled
+    assert 0 < stats.peak_queue_size <= stats.queue_pushes
+    assert stats.edges_scanned > 0
+    assert set(stats.phases) == {"validate", "adjacency", "search", "paths"}
@@ -0,0 +1,63 @@
+import pytest
+
+from dijkstra_dashboard.core import generators
+from dijkstra_dashboard.core.graph import Graph
+from dijkstra_dashboard.core.snapshot import GraphSnapshot
+from dijkstra_dashboard.core.validation import validate_graph
+
+
+def test_generators_are_deterministic():
+    first = generators.erdos_renyi_graph(60, 0.1, seed=7)
+    second = generators.erdos_renyi_graph(60, 0.1, seed=7)
+    other = generators.erdos_renyi_graph(60, 0.1, seed=8)
+    assert first.get_edges() == second.get_edges()
+    assert first.get_edges() != other.get_edges()
+
+
+def test_grid_graph_with_obstacles():
+    graph = generators.grid_graph(10, 10, obstacle_ratio=0.2, seed=1)
+    assert isinstance(graph, Graph)
+    assert graph.get_stats().node_count == 80
+    assert all(weight == 1.0 for _, _, weight in graph.get_edges())
+
+    full = generators.grid_graph(3, 4, diagonal=True)
+    assert full.get_stats().edge_count == 3 * 3 + 2 * 4 + 2 * 2 * 3
+
+
+@pytest.mark.parametrize("build", [
+    lambda frozen: generators.random_geometric_graph(300, seed=2, frozen=frozen),
+    lambda frozen: generators.barabasi_albert_graph(300, 3, seed=2, frozen=frozen),
+    lambda frozen: generators.road_network(12, 12, seed=2, frozen=frozen),
+])
+def test_frozen_and_mutable_builds_match(build):
+    graph = build(False)
+    snapshot = build(True)
+    assert isinstance(snapshot, GraphSnapshot)
+    assert set(snapshot.get_edges()) == set(graph.get_edges())
+    assert snapshot.get_node_position("n5") == graph.get_node_position("n5")
+    assert not [issue for issue in validate_graph(graph) if issue.severity == "error"]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_road_network_is_connected(seed):
+    graph = generators.road_network(15, 20, removal=0.4, seed=seed)
+    adjacency = graph.to_adjacency_dict()
+    start = next(iter(adjacency))
+    seen = {start}
+    stack = [start]
+    while stack:
+        for neighbour, _ in adjacency[stack.pop()]:
+            if neighbour not in seen:
+                seen.add(neighbour)
+                stack.append(neighbour)
+    assert len(seen) == len(adjacency)
+    # Most dropped streets stay dropped.
+    assert graph.get_stats().edge_count < 15 * 19 + 14 * 20
+
+
+def test_erdos_renyi_directed_has_no_self_loops():
+    graph = generators.erdos_renyi_graph(40, 0.5, directed=True, seed=3, frozen=True)
+    assert graph.directed
+    assert all(start != end for start, end, _ in graph.get_edges())
+    complete = generators.erdos_renyi_graph(6, 1.0, directed=True, frozen=True)
+    assert complete.get_stats().edge_count == 30
@@ -38,3 +38,93 @@ def test_set_directed_roundtrip(sample_graph):
     assert sample_graph.directed is True
     sample_graph.set_directed(False)
     assert sample_graph.directed is False
+
+
+def test_add_edges_from_matches_add_edge(sample_graph):
+    bulk = Graph()
+    bulk.add_nodes_from((node.id, node.label, node.x, node.y) for node in sample_graph.nodes())
+    bulk.add_edges_from((end, start, weight) for start, end, weight in sample_graph.get_edges())
+    assert bulk.get_nodes() == sample_graph.get_nodes()
+    assert set(bulk.get_edges()) == set(sample_graph.get_edges())
+
+
+def test_add_edges_from_rejects_batch_atomically(empty_graph):
+    empty_graph.add_nodes_from([('A', None, 0, 0), ('B', None, 1, 1)])
+    with pytest.raises(ValueError, match="already exists"):
+        empty_graph.add_edges_from([('A', 'B', 1), ('B', 'A', 2)])
+    with pytest.raises(ValueError, match="must exist"):
+        empty_graph.add_edges_from([('A', 'B', 1), ('A', 'Z', 2)])
+    assert empty_graph.get_edges() == []
+    with pytest.raises(ValueError, match="already exists"):
+        empty_graph.add_nodes_from([('C', None, 0, 0), ('A', None, 0, 0)])
+    assert empty_graph.get_nodes() == ['A', 'B']
+
+
+def test_from_arrays_accepts_indices_and_ids():
+    graph = Graph.from_arrays(['n1', 'n2', 'n3'], [0, 'n2'], [1, 2], [1.5, 2],
+                              xs=[0, 1, 2], ys=[0, 0, 0], directed=True)
+    assert graph.get_edges() == [('n1', 'n2', 1.5), ('n2', 'n3', 2.0)]
+    assert graph.get_node_position('n3') == (2.0, 0.0)
+    assert graph.add_node() == 'n4'
+    with pytest.raises(ValueError, match="out of range"):
+        Graph.from_arrays(['a'], [0], [3], [1])
+
+
+def test_from_arrays_accepts_numpy_indices():
+    np = pytest.importorskip("numpy")
+    graph = Graph.from_arrays(['a', 'b', 'c'], np.array([0, 1]), np.array([1, 2]), [1.0, 2.0])
+    assert graph.get_edges() == [('a', 'b', 1.0), ('b', 'c', 2.0)]
+
+
+def test_components_track_edits(disconnected_graph):
+    assert disconnected_graph.component_count() == 2
+    version = disconnected_graph.version
+    disconnected_graph.add_edge('B', 'X', 1)
+    assert disconnected_graph.component_count() == 1
+    assert disconnected_graph.version > version
+    disconnected_graph.remove_edge('A', 'B')
+    assert disconnected_graph.component_count() == 2
+    assert disconnected_graph.same_component('B', 'X')
+    assert not disconnected_graph.same_component('A', 'X')
+    disconnected_graph.add_node('Y')
+    assert disconnected_graph.component_count() == 3
+    version = disconnected_graph.version
+    disconnected_graph.set_node_position('Y', 5, 5)
+    assert disconnected_graph.version == version
+
+
+def test_negative_edges_track_edits(negative_weight_graph):
+    assert negative_weight_graph.has_negative_weights()
+    negative_weight_graph.set_directed(True)
+    assert [edge.id for edge in negative_weight_graph.negative_edges()] == ['B->C']
+    negative_weight_graph.update_edge('B', 'C', 2)
+    assert not negative_weight_graph.has_negative_weights()
+    negative_weight_graph.update_edge('A', 'C', -1)
+    negative_weight_graph.remove_node('C')
+    assert not negative_weight_graph.has_negative_weights()
+
+
+def test_overlapping_gc_pauses_restore_the_collector():
+    import gc
+    import threading
+
+    from dijkstra_dashboard.core import graph as graph_module
+
+    assert gc.isenabled()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with graph_module._gc_paused():
+            entered.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=hold)
+    with graph_module._gc_paused():
+        worker.start()
+        entered.wait(5)
+    # The worker's pause is still open, so the collector stays off.
+    assert not gc.isenabled()
+    release.set()
+    worker.join(5)
+    assert gc.isenabled()
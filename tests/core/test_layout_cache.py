@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from dijkstra_dashboard.core.layouts import LayoutCache, compute_layout, spring_layout
+from dijkstra_dashboard.core.layouts import jobs
+from dijkstra_dashboard.core.layouts.cache import default_cache_dir, layout_key, structural_hash
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache():
+    jobs.clear_cache()
+    yield
+    jobs.clear_cache()
+
+
+def test_structural_hash_ignores_order_and_direction():
+    base = structural_hash(["a", "b", "c"], [("a", "b"), ("b", "c")])
+    assert base == structural_hash(["c", "a", "b"], [("c", "b"), ("b", "a"), ("a", "b")])
+    assert base != structural_hash(["a", "b", "c"], [("a", "b"), ("a", "c")])
+    assert structural_hash(["ab"], []) != structural_hash(["a", "b"], [])
+
+
+def test_layout_key_covers_engine_and_parameters():
+    nodes, edges = ["a", "b"], [("a", "b")]
+    key = layout_key(nodes, edges, "spring", {"seed": 1, "iterations": 5})
+    assert key == layout_key(nodes[::-1], edges, "spring", {"iterations": 5, "seed": 1})
+    assert key != layout_key(nodes, edges, "spring", {"seed": 2, "iterations": 5})
+    assert key != layout_key(nodes, edges, "multilevel", {"seed": 1, "iterations": 5})
+
+
+def test_cache_round_trips_and_survives_bad_entries(tmp_path):
+    cache = LayoutCache(tmp_path / "layouts")
+    assert cache.get("missing") is None
+    cache.put("k", {"a": (1.5, -2.0), "b": (0.0, 3.25)})
+    assert "k" in cache
+    assert cache.get("k") == {"a": (1.5, -2.0), "b": (0.0, 3.25)}
+
+    (tmp_path / "layouts" / "bad.json").write_text("{not json", encoding="utf-8")
+    assert cache.get("bad") is None
+    cache.clear()
+    assert cache.size_bytes() == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = LayoutCache(tmp_path)
+    positions = {f"n{i}": (float(i), float(i)) for i in range(20)}
+    for age, key in enumerate(("old", "used", "new")):
+        cache.put(key, positions)
+        os.utime(tmp_path / f"{key}.json", ns=(age * 10 ** 9, age * 10 ** 9))
+    entry = (tmp_path / "old.json").stat().st_size
+    # Reading "used" makes it the most recent, so "old" goes first.
+    assert cache.get("used") is not None
+    cache.max_bytes = entry * 3 - 1
+    cache.put("newest", positions)
+    assert "old" not in cache and "new" not in cache
+    assert "used" in cache and "newest" in cache
+
+
+def test_cache_lists_the_directory_only_past_the_limit(tmp_path, monkeypatch):
+    cache = LayoutCache(tmp_path)
+    listings = []
+    entries = LayoutCache._entries
+    monkeypatch.setattr(LayoutCache, "_entries",
+                        lambda self: listings.append(1) or entries(self))
+    positions = {f"n{i}": (float(i), float(i)) for i in range(20)}
+    cache.put("k0", positions)
+    entry = (tmp_path / "k0.json").stat().st_size
+    cache.max_bytes = entry * 3
+    for i in range(1, 3):
+        cache.put(f"k{i}", positions)
+    cache.put("k0", positions)
+    assert len(listings) == 1
+    cache.put("k3", positions)
+    assert len(listings) == 2
+    assert cache.size_bytes() <= entry * 3
+
+
+def test_compute_layout_reuses_the_disk_cache(tmp_path, monkeypatch):
+    nodes = [f"n{i}" for i in range(12)]
+    edges = [(nodes[i], nodes[i + 1]) for i in range(11)]
+    cache = LayoutCache(tmp_path)
+    first = compute_layout("spring", nodes, edges, {"iterations": 5}, cache=cache)
+    assert first == spring_layout(nodes, edges, iterations=5)
+
+    # A fresh process has an empty memory cache; the same structure listed
+    # in another order is still a hit.
+    jobs.clear_cache()
+    monkeypatch.setattr(jobs.LayoutJob, "_compute", lambda self: pytest.fail("recomputed"))
+    again = compute_layout("spring", nodes[::-1], [(v, u) for u, v in edges],
+                           {"iterations": 5}, cache=cache)
+    assert again == first
+
+
+def test_default_cache_dir_honours_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("DIJKSTRA_DASHBOARD_CACHE", str(tmp_path / "custom"))
+    assert default_cache_dir() == tmp_path / "custom"
+    monkeypatch.delenv("DIJKSTRA_DASHBOARD_CACHE")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "dijkstra-dashboard" / "layouts"
@@ -0,0 +1,98 @@
+import pytest
+
+from dijkstra_dashboard.core.generators import erdos_renyi_graph
+from dijkstra_dashboard.core.layouts import circle_layout, multilevel_layout, spring_layout
+from dijkstra_dashboard.core.layouts import jobs
+from dijkstra_dashboard.core.layouts.jobs import LayoutJob
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    jobs.clear_cache()
+    yield
+    jobs.clear_cache()
+
+
+@pytest.fixture
+def layout_input():
+    graph = erdos_renyi_graph(60, 0.05, seed=1)
+    return graph.get_nodes(), [(start, end) for start, end, _ in graph.get_edges()]
+
+
+def test_job_streams_frames_and_returns_the_engine_result(layout_input):
+    nodes, edges = layout_input
+    frames = []
+    done = []
+    job = LayoutJob("spring", nodes, edges, {"iterations": 10}, fps=1e9,
+                    on_frame=frames.append, on_done=done.append)
+    job.start()
+    assert job.wait(10)
+
+    assert job.result == spring_layout(nodes, edges, iterations=10)
+    assert done == [job.result]
+    # Every iteration but the last becomes a frame at an unbounded rate.
+    assert job.frames == len(frames) == 9
+    assert all(set(frame) == set(nodes) for frame in frames)
+
+
+def test_job_throttles_frames(layout_input):
+    nodes, edges = layout_input
+    frames = []
+    job = LayoutJob("spring", nodes, edges, {"iterations": 10}, fps=1e-6,
+                    on_frame=frames.append)
+    job.run()
+    assert len(frames) == 1
+
+
+def test_finished_layouts_are_cached(layout_input, monkeypatch):
+    nodes, edges = layout_input
+    first = LayoutJob("multilevel", nodes, edges, {"iterations": 5})
+    first.run()
+
+    calls = []
+    monkeypatch.setattr(LayoutJob, "_compute", lambda self: calls.append(self.key) or {})
+    again = LayoutJob("multilevel", nodes, edges, {"iterations": 5})
+    again.run()
+    assert not calls
+    assert again.result == first.result == multilevel_layout(nodes, edges, iterations=5)
+
+    LayoutJob("multilevel", nodes, edges, {"iterations": 6}).run()
+    LayoutJob("multilevel", nodes, edges[1:], {"iterations": 5}).run()
+    assert len(calls) == 2
+
+
+def test_cancel_stops_the_engine(layout_input):
+    nodes, edges = layout_input
+    done = []
+    frames = []
+
+    def on_frame(positions):
+        frames.append(positions)
+        job.cancel()
+
+    job = LayoutJob("spring", nodes, edges, {"iterations": 50}, fps=1e9,
+                    on_frame=on_frame, on_done=done.append)
+    job.start()
+    assert job.wait(10)
+    assert job.cancelled
+    assert len(frames) == 1
+    assert job.result is None and not done
+
+    # Nothing was cached for the cancelled run.
+    assert LayoutJob("spring", nodes, edges, {"iterations": 50}).key not in jobs._results
+
+
+def test_node_only_layouts_and_errors(layout_input):
+    nodes, edges = layout_input
+    job = LayoutJob("circle", nodes, edges, {"radius": 50.0})
+    job.run()
+    assert job.result == circle_layout(nodes, radius=50.0)
+
+    errors = []
+    failing = LayoutJob("spring", nodes, edges, {"bogus": 1}, on_error=errors.append)
+    failing.run()
+    assert failing.done() and failing.result is None
+    assert errors and isinstance(failing.error, TypeError)
+
+    with pytest.raises(ValueError):
+        LayoutJob("nonexistent", nodes)
@@ -0,0 +1,205 @@
+import pytest
+
+from dijkstra_dashboard.core.generators import erdos_renyi_graph, grid_graph
+from dijkstra_dashboard.core.layouts import (barnes_hut_layout, incremental_layout, multilevel_layout,
+                                             spring_layout)
+from dijkstra_dashboard.core.layouts import barnes_hut, spring
+
+
+@pytest.fixture
+def layout_input():
+    graph = erdos_renyi_graph(120, 0.03, seed=2)
+    return graph.get_nodes(), [(start, end) for start, end, _ in graph.get_edges()]
+
+
+def _max_offset(a, b):
+    return max(abs(a[n][0] - b[n][0]) + abs(a[n][1] - b[n][1]) for n in a)
+
+
+def _bfs_hops(nodes, edges, source):
+    adjacency = {node: [] for node in nodes}
+    for start, end in edges:
+        adjacency[start].append(end)
+        adjacency[end].append(start)
+    dist = {source: 0}
+    frontier = [source]
+    while frontier:
+        reached = []
+        for u in frontier:
+            for v in adjacency[u]:
+                if v not in dist:
+                    dist[v] = dist[u] + 1
+                    reached.append(v)
+        frontier = reached
+    return [dist.get(node, -1) for node in nodes]
+
+
+def test_barnes_hut_with_zero_theta_matches_exact(layout_input):
+    nodes, edges = layout_input
+    exact = spring_layout(nodes, edges, iterations=8, seed=3)
+    assert _max_offset(exact, barnes_hut_layout(nodes, edges, iterations=8, seed=3,
+                                                theta=0.0)) < 1e-6
+
+
+def test_barnes_hut_is_deterministic_and_bounded(layout_input):
+    nodes, edges = layout_input
+    first = barnes_hut_layout(nodes, edges, iterations=10, seed=5)
+    assert first == barnes_hut_layout(nodes, edges, iterations=10, seed=5)
+    assert first != barnes_hut_layout(nodes, edges, iterations=10, seed=6)
+    assert all(-400 <= x <= 400 and -300 <= y <= 300 for x, y in first.values())
+
+
+def test_spring_layout_delegates_large_graphs(layout_input, monkeypatch):
+    nodes, edges = layout_input
+    monkeypatch.setattr(spring, "EXACT_MAX_NODES", 50)
+    monkeypatch.setattr(spring, "VECTORIZED_MAX_NODES", 50)
+    delegated = barnes_hut_layout(nodes, edges, iterations=4)
+    assert spring_layout(nodes, edges, iterations=4) == delegated
+    assert spring_layout(nodes, edges, iterations=4, method="barnes_hut") == delegated
+    assert spring_layout(nodes, edges, iterations=4, method="exact") != delegated
+    with pytest.raises(ValueError):
+        spring_layout(nodes, edges, method="fast")
+
+
+def test_barnes_hut_relaxes_defaults_for_large_graphs(layout_input, monkeypatch):
+    nodes, edges = layout_input
+    monkeypatch.setattr(barnes_hut, "LARGE_GRAPH_NODES", 100)
+    rounds = []
+    large = barnes_hut_layout(nodes, edges, progress=lambda done, total, frame: rounds.append(total))
+    assert rounds[-1] == barnes_hut.LARGE_GRAPH_ITERATIONS
+    assert large == barnes_hut_layout(nodes, edges, iterations=barnes_hut.LARGE_GRAPH_ITERATIONS,
+                                      theta=barnes_hut.LARGE_GRAPH_THETA)
+
+
+def test_barnes_hut_numpy_matches_pure_python(layout_input, monkeypatch):
+    pytest.importorskip("numpy")
+    nodes, edges = layout_input
+    vectorized = barnes_hut_layout(nodes, edges, iterations=8, seed=2)
+    monkeypatch.setattr(barnes_hut, "_numpy_available", lambda: False)
+    assert _max_offset(vectorized, barnes_hut_layout(nodes, edges, iterations=8,
+                                                     seed=2)) < 1e-6
+
+
+def test_vectorized_layout_matches_exact(layout_input):
+    pytest.importorskip("numpy")
+    from dijkstra_dashboard.core.layouts import vectorized_spring_layout
+
+    nodes, edges = layout_input
+    exact = spring_layout(nodes, edges, iterations=8, seed=4)
+    assert _max_offset(exact, vectorized_spring_layout(nodes, edges, iterations=8,
+                                                       seed=4)) < 1e-6
+
+
+def test_multilevel_layout_is_deterministic_and_bounded(layout_input):
+    nodes, edges = layout_input
+    first = multilevel_layout(nodes, edges, iterations=10, seed=5)
+    assert set(first) == set(nodes)
+    assert first == multilevel_layout(nodes, edges, iterations=10, seed=5)
+    assert first != multilevel_layout(nodes, edges, iterations=10, seed=6)
+    assert all(-400 <= x <= 400 and -300 <= y <= 300 for x, y in first.values())
+
+
+def test_multilevel_layout_spreads_a_mesh():
+    graph = grid_graph(30, 30)
+    nodes = graph.get_nodes()
+    positions = multilevel_layout(nodes, [(start, end) for start, end, _ in graph.get_edges()],
+                                  iterations=20)
+    # Prolonged pairs start almost on top of each other; refinement must
+    # separate them and use most of the canvas.
+    assert len(set(positions.values())) == len(nodes)
+    xs = [x for x, _ in positions.values()]
+    ys = [y for _, y in positions.values()]
+    assert max(xs) - min(xs) > 400 and max(ys) - min(ys) > 300
+
+
+def test_multilevel_layout_handles_isolated_nodes():
+    nodes = [f"n{i}" for i in range(200)]
+    positions = multilevel_layout(nodes, [("n0", "n1"), ("n1", "n0"), ("n2", "n2"),
+                                          ("n3", "missing")], iterations=5)
+    assert set(positions) == set(nodes)
+    assert multilevel_layout([], []) == {}
+
+
+def test_incremental_layout_only_moves_the_edited_region(layout_input):
+    nodes, edges = layout_input
+    base = spring_layout(nodes, edges, iterations=10)
+    anchor = nodes[0]
+    neighbors = {end for start, end in edges if start == anchor} | {
+        start for start, end in edges if end == anchor}
+    positions = incremental_layout(nodes + ["new"], edges + [("new", anchor)], base)
+
+    region = {"new", anchor} | neighbors
+    assert all(positions[node] == base[node] for node in nodes if node not in region)
+    ax, ay = positions[anchor]
+    nx, ny = positions["new"]
+    assert abs(nx - ax) + abs(ny - ay) < 200
+
+
+def test_incremental_layout_without_changes_or_positions(layout_input):
+    nodes, edges = layout_input
+    base = spring_layout(nodes, edges, iterations=5)
+    assert incremental_layout(nodes, edges, base) == base
+    assert incremental_layout(nodes, edges, {}, iterations=5) == base
+
+
+def test_incremental_layout_frozen_temperature_cools_the_rest(layout_input):
+    nodes, edges = layout_input
+    base = spring_layout(nodes, edges, iterations=10)
+
+    def drift(temperature):
+        positions = incremental_layout(nodes, edges, base, changed=[nodes[0]], hops=0,
+                                       frozen_temperature=temperature)
+        return sum(abs(positions[node][0] - base[node][0]) + abs(positions[node][1] - base[node][1])
+                   for node in nodes[1:])
+
+    assert 0 < drift(0.05) < drift(1.0)
+
+
+@pytest.mark.parametrize("engine", [spring_layout, barnes_hut_layout, multilevel_layout])
+def test_progress_reports_every_iteration(layout_input, engine):
+    nodes, edges = layout_input
+    reports = []
+    result = engine(nodes, edges, iterations=8,
+                    progress=lambda done, total, frame: reports.append((done, total, frame())))
+    total = reports[0][1]
+    assert [done for done, _, _ in reports] == list(range(1, total + 1))
+    assert all(set(frame) == set(nodes) for _, _, frame in reports)
+    assert reports[-1][2] == pytest.approx(result)
+
+
+def test_pivot_mds_recovers_a_mesh():
+    np = pytest.importorskip("numpy")
+    from dijkstra_dashboard.core.layouts import pivot_mds_layout
+
+    graph = grid_graph(12, 12)
+    nodes = graph.get_nodes()
+    edges = [(start, end) for start, end, _ in graph.get_edges()]
+    hops = {node: dict(zip(nodes, _bfs_hops(nodes, edges, node))) for node in nodes[::7]}
+
+    def correlation(positions):
+        pairs = [(hops[a][b], ((positions[a][0] - positions[b][0]) ** 2
+                               + (positions[a][1] - positions[b][1]) ** 2) ** 0.5)
+                 for a in hops for b in nodes if a != b]
+        return np.corrcoef(np.array(pairs).T)[0, 1]
+
+    plain = pivot_mds_layout(nodes, edges, pivots=8)
+    refined = pivot_mds_layout(nodes, edges, pivots=8, stress_iterations=20)
+    assert correlation(plain) > 0.8
+    assert correlation(refined) > max(0.95, correlation(plain))
+    for positions in (plain, refined):
+        assert all(-400.001 <= x <= 400.001 and -300.001 <= y <= 300.001
+                   for x, y in positions.values())
+
+
+def test_pivot_mds_handles_small_and_disconnected_graphs():
+    pytest.importorskip("numpy")
+    from dijkstra_dashboard.core.layouts import pivot_mds_layout
+
+    assert pivot_mds_layout([], []) == {}
+    assert pivot_mds_layout(["a"], []) == {"a": (0.0, 0.0)}
+    nodes = [f"n{i}" for i in range(30)]
+    edges = [(f"n{i}", f"n{i + 1}") for i in range(9)] + [("n20", "n21"), ("n3", "n3")]
+    first = pivot_mds_layout(nodes, edges, pivots=5, stress_iterations=5)
+    assert first == pivot_mds_layout(nodes, edges, pivots=5, stress_iterations=5)
+    assert set(first) == set(nodes)
+    assert all(x == x and y == y for x, y in first.values())
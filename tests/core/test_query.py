@@ -0,0 +1,31 @@
+import pytest
+
+from dijkstra_dashboard.core.errors import AlgorithmError
+from dijkstra_dashboard.core.query import isochrone, matrix, route, run_query
+
+
+def test_route_unreachable_distance_is_null(disconnected_graph):
+    result = route(disconnected_graph, "A", "X")
+    assert result["path"] == []
+    assert result["distance"] is None
+
+
+def test_matrix_defaults_targets_to_sources(sample_graph):
+    result = matrix(sample_graph, ["A", "F"])
+    assert result["distances"] == [[0.0, 6.0], [6.0, 0.0]]
+
+
+def test_isochrone_limits_by_distance(sample_graph):
+    result = isochrone(sample_graph, "A", 4)
+    assert result["nodes"] == {"A": 0.0, "C": 3.0, "B": 4.0, "D": 4.0}
+
+
+def test_run_query_rejects_unknown_kind(sample_graph):
+    with pytest.raises(AlgorithmError):
+        run_query(sample_graph, "teleport", {})
+
+
+def test_route_reports_stats_when_asked(sample_graph):
+    result = run_query(sample_graph, "route", {"start": "A", "target": "F", "stats": True})
+    assert result["stats"]["nodes_settled"] > 0
+    assert "stats" not in route(sample_graph, "A", "F")
@@ -0,0 +1,35 @@
+import pytest
+
+from dijkstra_dashboard.core.algorithms.base import AlgorithmSpec
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.algorithms import registry
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    registry.clear_registry()
+    yield
+    registry.clear_registry()
+
+
+def test_builtin_engine_is_loaded_on_demand():
+    assert registry.get_algorithm("Dijkstra") is DijkstraAlgorithm
+    assert registry.get_algorithm_spec("dijkstra") is DijkstraAlgorithm.spec
+
+
+def test_register_engine_accepts_lazy_reference():
+    registry.register_engine(
+        "custom", "dijkstra_dashboard.core.algorithms.dijkstra:DijkstraAlgorithm")
+    assert registry.get_algorithm("custom") is DijkstraAlgorithm
+    with pytest.raises(ValueError):
+        registry.register_engine("custom", DijkstraAlgorithm)
+
+
+def test_register_algorithm_rejects_duplicates():
+    spec = AlgorithmSpec(name="noop", description="", inputs=[],
+                         output_kind="single_path", constraints={})
+    registry.register_algorithm(spec)
+    with pytest.raises(ValueError):
+        registry.register_algorithm(spec)
+    with pytest.raises(KeyError):
+        registry.get_algorithm_spec("missing-engine")
@@ -1,7 +1,14 @@
 import pytest
 
+from dijkstra_dashboard.core.errors import ValidationError
 from dijkstra_dashboard.core.graph import Graph
-from dijkstra_dashboard.core.serialization import graph_to_dict, dict_to_graph
+from dijkstra_dashboard.core.serialization import (
+    dict_to_graph,
+    graph_to_dict,
+    load_csv_edges,
+    load_edge_list,
+    load_graph_file,
+)
 
 
 def test_serialization_roundtrip(sample_graph):
@@ -22,3 +29,72 @@ def test_dict_to_graph_invalid_version():
     }
     with pytest.raises(Exception):
         dict_to_graph(data)
+
+
+def test_columnar_roundtrip(sample_graph):
+    sample_graph.set_directed(True)
+    sample_graph.rename_node('C', 'Sea')
+    data = graph_to_dict(sample_graph, version=2)
+    assert data["labels"][2] == 'Sea' and data["labels"][0] is None
+    assert isinstance(data["edge_src"][0], int)
+
+    restored = dict_to_graph(data)
+    assert restored.directed is True
+    assert list(restored.nodes()) == list(sample_graph.nodes())
+    assert set(restored.get_edges()) == set(sample_graph.get_edges())
+    assert graph_to_dict(restored) == graph_to_dict(sample_graph)
+
+
+def test_columnar_validation_errors():
+    data = {
+        "version": 2,
+        "directed": False,
+        "node_ids": ["a", "b", "a"],
+        "x": [0, 0, "left"],
+        "y": [0, 0, 0],
+        "edge_src": [0, 1, 5],
+        "edge_dst": [1, 0, 0],
+        "weights": [1, 2, 3],
+    }
+    with pytest.raises(ValidationError) as excinfo:
+        dict_to_graph(data)
+    codes = [issue.code for issue in excinfo.value.issues]
+    assert codes == ["duplicate_node", "invalid_x", "duplicate_edge", "edge_missing_node"]
+
+
+def test_load_dimacs_with_coordinates(tmp_path):
+    import gzip
+
+    gr = tmp_path / "road.gr.gz"
+    with gzip.open(gr, "wt") as handle:
+        handle.write("c tiny road graph\np sp 4 7\n"
+                     "a 1 2 10\na 2 1 10\na 2 3 5\na 3 2 5\na 3 4 7\na 4 3 7\na 1 2 12\n")
+    (tmp_path / "road.co").write_text("p aux sp co 4\nv 1 -73 41\nv 2 -72 41\n"
+                                      "v 3 -72 40\nv 4 -71 40\n", encoding="utf-8")
+    graph = load_graph_file(gr)
+    assert graph.directed is False
+    assert graph.get_nodes() == ['1', '2', '3', '4']
+    assert sorted(graph.get_edges()) == [('1', '2', 10.0), ('2', '3', 5.0), ('3', '4', 7.0)]
+    assert graph.get_node_position('4') == (-71.0, 40.0)
+
+
+def test_edge_list_directed_detection(tmp_path):
+    path = tmp_path / "graph.edges"
+    path.write_text("# one-way\na b 2\nb c\n", encoding="utf-8")
+    graph = load_graph_file(path)
+    assert graph.directed is True
+    assert sorted(graph.get_edges()) == [('a', 'b', 2.0), ('b', 'c', 1.0)]
+    assert load_edge_list(path, directed=False).directed is False
+
+
+def test_csv_import_and_errors(tmp_path):
+    path = tmp_path / "edges.csv"
+    path.write_text("from,to,cost\nx,y,1.5\ny,x,1.5\n", encoding="utf-8")
+    graph = load_csv_edges(path, source="from", target="to", weight="cost")
+    assert graph.directed is False
+    assert graph.get_edges() == [('x', 'y', 1.5)]
+
+    path.write_text("from,to,cost\nx,y,heavy\n", encoding="utf-8")
+    with pytest.raises(ValidationError) as excinfo:
+        load_csv_edges(path, source="from", target="to", weight="cost")
+    assert excinfo.value.issues[0].path == "edges.csv:2"
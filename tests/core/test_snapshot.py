@@ -0,0 +1,35 @@
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.graph import Graph
+
+
+def test_freeze_preserves_nodes_and_edges(sample_graph):
+    snapshot = sample_graph.freeze()
+    assert snapshot.get_nodes() == sample_graph.get_nodes()
+    assert set(snapshot.get_edges()) == set(sample_graph.get_edges())
+    assert snapshot.get_stats() == sample_graph.get_stats()
+
+
+def test_snapshot_is_isolated_from_later_edits(sample_graph):
+    snapshot = sample_graph.freeze()
+    sample_graph.remove_node('A')
+    assert 'A' in snapshot
+    assert ('B', 5.0) in snapshot.get_neighbors('A')
+
+
+def test_snapshot_directed_adjacency():
+    g = Graph(directed=True)
+    for name in ['A', 'B', 'C']:
+        g.add_node(name, x=1, y=2)
+    g.add_edge('A', 'B', 1)
+    g.add_edge('B', 'A', 4)
+    g.add_edge('B', 'C', 2)
+    snapshot = g.freeze()
+    assert snapshot.to_adjacency_dict() == g.to_adjacency_dict()
+    assert snapshot.get_node_position('C') == (1.0, 2.0)
+    assert snapshot.thaw().get_edges() == g.get_edges()
+
+
+def test_dijkstra_runs_on_snapshot(sample_graph):
+    result = DijkstraAlgorithm().solve(sample_graph.freeze(), {"start": "A", "target": "F"})
+    assert result.path == ['A', 'C', 'B', 'F']
+    assert result.distance == 6
@@ -0,0 +1,150 @@
+import io
+import json
+import os
+
+import pytest
+
+from dijkstra_dashboard.core.errors import ValidationError
+from dijkstra_dashboard.core.generators import erdos_renyi_graph
+from dijkstra_dashboard.core.serialization import graph_to_dict, load_graph_file
+from dijkstra_dashboard.core.streaming import GraphItems, dump_graph, read_graph, write_graph_file
+from dijkstra_dashboard.core.validation import validate_graph_data
+
+
+def _read(data, **kwargs):
+    return read_graph(io.BytesIO(json.dumps(data, indent=1).encode("utf-8")), **kwargs)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_read_graph_matches_dict_to_graph(chunk_size):
+    graph = erdos_renyi_graph(60, 0.1, directed=True, seed=3)
+    graph.rename_node('n5', 'café →')
+    restored = _read(graph_to_dict(graph), chunk_size=chunk_size, batch_size=16)
+
+    assert restored.directed is True
+    assert restored.metadata == graph.metadata
+    assert list(restored.nodes()) == list(graph.nodes())
+    assert set(restored.get_edges()) == set(graph.get_edges())
+
+
+def test_read_graph_handles_edges_before_nodes(sample_graph):
+    data = graph_to_dict(sample_graph)
+    reordered = {"edges": data["edges"], "nodes": data["nodes"],
+                 "directed": False, "version": 1}
+    restored = _read(reordered, chunk_size=5)
+    assert set(restored.get_edges()) == set(sample_graph.get_edges())
+
+
+def test_read_graph_reports_same_errors_as_validation():
+    data = {
+        "version": 1,
+        "directed": False,
+        "nodes": {"n1": {"label": "A", "x": "left"}, "n2": {"label": "B"}},
+        "edges": [
+            {"id": "n1--n2", "start": "n1", "end": "n2", "weight": 1},
+            {"id": "n2--n1", "start": "n2", "end": "n1", "weight": 2},
+            {"id": "n2--n3", "start": "n2", "end": "n3", "weight": 2},
+        ],
+    }
+    expected = [issue for issue in validate_graph_data(data) if issue.severity == "error"]
+    with pytest.raises(ValidationError) as excinfo:
+        _read(data, chunk_size=3)
+    assert excinfo.value.issues == expected
+
+
+def test_read_graph_rejects_truncated_json():
+    with pytest.raises(ValueError, match="offset"):
+        read_graph(io.BytesIO(b'{"version": 1, "nodes": {"a": {"label": "a"'))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_read_graph_splits_compact_tokens_across_chunks(chunk_size):
+    graph = erdos_renyi_graph(30, 0.2, seed=4)
+    graph.rename_node('n3', 'é"\\u')
+    text = json.dumps(graph_to_dict(graph), separators=(",", ":"))
+    restored = read_graph(io.BytesIO(text.encode("utf-8")), chunk_size=chunk_size)
+    assert list(restored.nodes()) == list(graph.nodes())
+    assert set(restored.get_edges()) == set(graph.get_edges())
+
+
+def test_read_graph_reports_syntax_errors_without_reading_on():
+    text = '{"version": 1, "nodes": {"a": {"label": tru, "x": 1}}' + " " * 100_000 + "}"
+    handle = io.BytesIO(text.encode("utf-8"))
+    with pytest.raises(ValueError, match="offset 40"):
+        read_graph(handle, chunk_size=64)
+    assert handle.tell() < 1000
+
+
+def test_load_graph_file_reports_progress(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps(graph_to_dict(sample_graph)), encoding="utf-8")
+    calls = []
+    graph = load_graph_file(path, progress=lambda done, total: calls.append((done, total)))
+    assert graph.get_nodes() == sample_graph.get_nodes()
+    size = path.stat().st_size
+    assert calls[-1] == (size, size)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_dump_graph_matches_json_dump(sample_graph, compact):
+    sample_graph.set_metadata({"name": "sample", "tags": ["a", "b"]})
+    sample_graph.rename_node('C', 'Zürich "C"')
+    sample_graph.update_edge('A', 'B', float("inf"))
+    handle = io.StringIO()
+    dump_graph(sample_graph, handle, compact=compact, chunk_size=16)
+    if compact:
+        expected = json.dumps(graph_to_dict(sample_graph), separators=(",", ":"))
+    else:
+        expected = json.dumps(graph_to_dict(sample_graph), indent=2, ensure_ascii=True)
+    assert handle.getvalue() == expected + "\n"
+
+
+def test_dump_graph_empty_graph(empty_graph):
+    handle = io.StringIO()
+    dump_graph(empty_graph, handle)
+    assert handle.getvalue() == json.dumps(graph_to_dict(empty_graph), indent=2) + "\n"
+
+
+@pytest.mark.parametrize("name", ["graph.json", "graph.json.gz", "graph.json.xz"])
+def test_write_graph_file_roundtrip(tmp_path, sample_graph, name):
+    path = tmp_path / name
+    write_graph_file(GraphItems.of(sample_graph), path, compact=True)
+    assert [p.name for p in tmp_path.iterdir()] == [name]
+    calls = []
+    restored = load_graph_file(path, progress=lambda done, total: calls.append((done, total)))
+    assert set(restored.get_edges()) == set(sample_graph.get_edges())
+    assert calls[-1] == (path.stat().st_size, path.stat().st_size)
+
+
+def test_write_graph_file_keeps_original_on_failure(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    path.write_text("original", encoding="utf-8")
+    with pytest.raises(ValueError):
+        write_graph_file(sample_graph, path, compression="zip")
+    assert path.read_text(encoding="utf-8") == "original"
+    assert [p.name for p in tmp_path.iterdir()] == ["graph.json"]
+
+
+def test_write_graph_file_uses_a_private_temporary_file(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    path.write_text("original", encoding="utf-8")
+    path.chmod(0o640)
+    # Another writer's temporary file under the old fixed name is left alone.
+    other = tmp_path / "graph.json.tmp"
+    other.write_text("in progress", encoding="utf-8")
+    write_graph_file(sample_graph, path)
+    assert other.read_text(encoding="utf-8") == "in progress"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["graph.json", "graph.json.tmp"]
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert set(load_graph_file(path).get_edges()) == set(sample_graph.get_edges())
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_write_graph_file_gives_new_files_the_umask_mode(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    previous = os.umask(0o027)
+    try:
+        write_graph_file(sample_graph, path)
+    finally:
+        os.umask(previous)
+    assert path.stat().st_mode & 0o777 == 0o640
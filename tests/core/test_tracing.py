@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from dijkstra_dashboard.core import tracing
+from dijkstra_dashboard.core.algorithms.dijkstra import DijkstraAlgorithm
+from dijkstra_dashboard.core.serialization import dict_to_graph, graph_to_dict
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "trace.json"
+    tracing.clear()
+    tracing.configure(path)
+    yield path
+    tracing.configure(None)
+    tracing.clear()
+
+
+def test_spans_cover_load_validate_and_solve(trace_file, sample_graph):
+    graph = dict_to_graph(graph_to_dict(sample_graph))
+    algorithm = DijkstraAlgorithm()
+    algorithm.solve(graph, {"start": "A", "target": "F"})
+    list(algorithm.iter_steps(graph, {"start": "A", "target": "F"}))
+    with tracing.span("custom", size=3):
+        pass
+
+    tracing.write_trace()
+    events = json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+    names = {event["name"] for event in events if event["ph"] == "X"}
+    assert {"dict_to_graph", "validate_graph_data", "Graph.to_adjacency_dict",
+            "DijkstraAlgorithm.solve", "DijkstraAlgorithm.iter_steps", "custom"} <= names
+    assert any(event["ph"] == "M" for event in events)
+    custom = next(event for event in events if event["name"] == "custom")
+    assert custom["args"] == {"size": 3} and custom["dur"] >= 0
+
+
+def test_disabled_tracing_records_nothing(sample_graph):
+    tracing.configure(None)
+    tracing.clear()
+    DijkstraAlgorithm().solve(sample_graph, {"start": "A"})
+    assert tracing.span("noop") is tracing.span("other")
+    assert tracing.trace_events() == []
+
+
+def test_env_config_reads_trace(monkeypatch):
+    from dijkstra_dashboard.config import env_config
+
+    monkeypatch.setenv("DIJKSTRA_DASHBOARD_TRACE", "/tmp/out.json")
+    assert env_config()["trace"] == "/tmp/out.json"
+
+
+@pytest.mark.parametrize("value", ["0", "false", "No", "off", "", " "])
+def test_false_values_disable_tracing(value):
+    tracing.configure(value)
+    try:
+        assert not tracing.is_enabled()
+    finally:
+        tracing.configure(None)
+
+
+def test_config_file_enables_tracing(tmp_path, monkeypatch):
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"version": 1, "trace": str(tmp_path / "t.json")}),
+                      encoding="utf-8")
+    monkeypatch.setenv("DIJKSTRA_DASHBOARD_CONFIG", str(config))
+    monkeypatch.delenv("DIJKSTRA_DASHBOARD_TRACE", raising=False)
+    monkeypatch.setattr(tracing._state, "resolved", False)
+    try:
+        assert tracing.is_enabled()
+        monkeypatch.setenv("DIJKSTRA_DASHBOARD_TRACE", "off")
+        monkeypatch.setattr(tracing._state, "resolved", False)
+        assert not tracing.is_enabled()
+    finally:
+        tracing.configure(None)
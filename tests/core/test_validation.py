@@ -1,4 +1,21 @@
-from dijkstra_dashboard.core.validation import validate_graph_data
+import pytest
+
+from dijkstra_dashboard.core.generators import erdos_renyi_graph
+from dijkstra_dashboard.core.serialization import graph_to_dict
+from dijkstra_dashboard.core.validation import validate_graph, validate_graph_data
+
+
+def _broken_document(directed):
+    data = graph_to_dict(erdos_renyi_graph(80, 0.05, directed=directed, seed=4))
+    edges = data["edges"]
+    edges[3] = dict(edges[3], weight=-2)
+    edges[10] = dict(edges[10], id="wrong")
+    edges[25] = "not an edge"
+    edges.append(dict(edges[1]))
+    edges.insert(5, dict(edges[40]))
+    edges.append({"start": "n1", "end": "missing", "weight": 1})
+    data["nodes"]["orphan"] = {"label": 7}
+    return data
 
 
 def test_validation_negative_weight_warning():
@@ -34,3 +51,32 @@ def test_validation_missing_nodes_error():
     issues = validate_graph_data(data)
     codes = {issue.code for issue in issues}
     assert "edge_missing_node" in codes
+
+
+def test_validate_live_graph_matches_serialized(negative_weight_graph, disconnected_graph):
+    negative_weight_graph.add_node('0')
+    negative_weight_graph.add_edge('C', '0', -1)
+    for graph in (negative_weight_graph, disconnected_graph):
+        live = validate_graph(graph)
+        serialized = validate_graph_data(graph.to_dict())
+        assert live == serialized
+    assert [issue.path for issue in validate_graph(negative_weight_graph)] == [
+        "edges[1].weight", "edges[3].weight"]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("limits", [{}, {"max_issues": 3}, {"fail_fast": True}])
+def test_parallel_validation_matches_serial(directed, limits):
+    data = _broken_document(directed)
+    serial = validate_graph_data(data, **limits)
+    assert validate_graph_data(data, workers=2, chunk_size=9, **limits) == serial
+
+
+def test_validation_issue_limits():
+    data = _broken_document(False)
+    issues = validate_graph_data(data)
+    capped = validate_graph_data(data, max_issues=2)
+    assert capped[:2] == issues[:2]
+    assert capped[-1].code == "issues_truncated"
+    first_error = next(i for i, issue in enumerate(issues) if issue.severity == "error")
+    assert validate_graph_data(data, fail_fast=True) == issues[:first_error + 1]
@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+import time
+
+from dijkstra_dashboard.core.serialization import graph_to_dict
+from dijkstra_dashboard.core.watch import GraphWatcher
+
+
+def _write(path, graph, mtime_ns):
+    path.write_text(json.dumps(graph_to_dict(graph)), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_watcher_swaps_snapshot_on_change(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    _write(path, sample_graph, 1_000_000_000)
+    watcher = GraphWatcher(path)
+    old = watcher.load()
+    assert watcher.check() is False
+
+    sample_graph.remove_node('F')
+    _write(path, sample_graph, 2_000_000_000)
+    assert watcher.check() is True
+    assert 'F' not in watcher.current
+    assert 'F' in old
+    assert watcher.version == 2
+
+
+def test_watcher_keeps_old_snapshot_on_invalid_file(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    _write(path, sample_graph, 1_000_000_000)
+    errors = []
+    watcher = GraphWatcher(path, on_error=errors.append)
+    old = watcher.load()
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert watcher.check() is False
+    assert watcher.current is old
+    assert len(errors) == 1
+
+
+def test_watcher_thread_reloads_in_background(tmp_path, sample_graph):
+    path = tmp_path / "graph.json"
+    _write(path, sample_graph, 1_000_000_000)
+    reloaded = []
+    watcher = GraphWatcher(path, interval=0.01, on_reload=reloaded.append)
+    watcher.start()
+    try:
+        sample_graph.remove_node('A')
+        _write(path, sample_graph, 2_000_000_000)
+        deadline = time.monotonic() + 5
+        while not reloaded and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+    assert reloaded and 'A' not in reloaded[-1]
+
+
+def test_writes_inside_writing_are_not_reloaded(tmp_path):
+    path = tmp_path / "value.txt"
+    path.write_text("1", encoding="utf-8")
+    watcher = GraphWatcher(path, loader=lambda p: p.read_text(encoding="utf-8"))
+    watcher.load()
+    with watcher.writing():
+        path.write_text("22", encoding="utf-8")
+    assert watcher.check() is False
+    assert watcher.current == "1"
+
+
+def test_writing_does_not_wait_for_a_reload(tmp_path):
+    path = tmp_path / "value.txt"
+    path.write_text("1", encoding="utf-8")
+    loading, release = threading.Event(), threading.Event()
+
+    def slow_loader(p):
+        text = p.read_text(encoding="utf-8")
+        if text == "22":
+            loading.set()
+            release.wait(5)
+        return text
+
+    watcher = GraphWatcher(path, loader=slow_loader)
+    watcher.load()
+    path.write_text("22", encoding="utf-8")
+    checker = threading.Thread(target=watcher.check)
+    checker.start()
+    try:
+        assert loading.wait(5)
+        # The save completes while the poller is still parsing the old contents.
+        with watcher.writing():
+            path.write_text("333", encoding="utf-8")
+    finally:
+        release.set()
+        checker.join(5)
+    assert watcher.current == "1"
+    assert watcher.check() is False
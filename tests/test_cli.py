@@ -0,0 +1,98 @@
+import csv
+import json
+import os
+import subprocess
+import sys
+
+from dijkstra_dashboard.cli import main
+from dijkstra_dashboard.core.graph import Graph
+from dijkstra_dashboard.core.serialization import graph_to_dict
+
+
+def _graph_file(tmp_path, graph):
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps(graph_to_dict(graph)), encoding="utf-8")
+    return path
+
+
+def _config_file(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text("{}", encoding="utf-8")
+    return str(path)
+
+
+def test_cli_csv_output(tmp_path, sample_graph):
+    graph = _graph_file(tmp_path, sample_graph)
+    queries = tmp_path / "queries.txt"
+    queries.write_text("# comment\nA F\nA,D\n", encoding="utf-8")
+    output = tmp_path / "out.csv"
+
+    code = main([str(graph), "-q", str(queries), "-f", "csv", "-o", str(output),
+                 "--config", _config_file(tmp_path)])
+
+    assert code == 0
+    rows = list(csv.reader(output.open(encoding="utf-8")))
+    assert rows[0] == ["query", "start", "target", "distance", "path", "error"]
+    assert rows[1] == ["0", "A", "F", "6.0", "A -> C -> B -> F", ""]
+    assert rows[2][3] == "4.0"
+
+
+def test_cli_ndjson_with_steps_and_errors(tmp_path, sample_graph):
+    graph = _graph_file(tmp_path, sample_graph)
+    queries = tmp_path / "queries.ndjson"
+    queries.write_text(
+        '{"start": "A", "target": "F"}\n'
+        '{"kind": "isochrone", "start": "A", "max_distance": 1}\n'
+        'A Z\n',
+        encoding="utf-8",
+    )
+    output = tmp_path / "out.ndjson"
+    steps = tmp_path / "steps.ndjson"
+
+    code = main([str(graph), "-q", str(queries), "-f", "ndjson", "-o", str(output),
+                 "--steps", str(steps), "--steps-mode", "snapshot",
+                 "--config", _config_file(tmp_path)])
+
+    assert code == 1
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert records[0]["path"] == ["A", "C", "B", "F"]
+    assert records[1]["nodes"] == {"A": 0.0}
+    assert "error" in records[2]
+    trace = [json.loads(line) for line in steps.read_text(encoding="utf-8").splitlines()]
+    assert trace[-1]["kind"] == "final"
+    assert {record["query"] for record in trace} == {0}
+
+
+def test_cli_steps_use_the_selected_engine(tmp_path):
+    dag = Graph(directed=True)
+    for name in "ABC":
+        dag.add_node(name)
+    dag.add_edge("A", "B", 2)
+    dag.add_edge("B", "C", -1)
+    dag.add_edge("A", "C", 3)
+    graph = _graph_file(tmp_path, dag)
+    queries = tmp_path / "queries.txt"
+    queries.write_text("A C\nC A\n", encoding="utf-8")
+    output = tmp_path / "out.ndjson"
+    steps = tmp_path / "steps.ndjson"
+
+    code = main([str(graph), "-q", str(queries), "-f", "ndjson", "-o", str(output),
+                 "--steps", str(steps), "--config", _config_file(tmp_path)])
+
+    assert code == 0
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert records[0]["distance"] == 1.0 and records[0]["path"] == ["A", "B", "C"]
+    assert records[1]["distance"] is None
+    trace = [json.loads(line) for line in steps.read_text(encoding="utf-8").splitlines()]
+    finals = [record for record in trace if record["kind"] == "final"]
+    assert [(record["query"], record["new_distance"]) for record in finals] == [(0, 1.0), (1, None)]
+
+
+def test_cli_does_not_import_qt():
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    code = "import sys, dijkstra_dashboard.cli; print(any(m.startswith('PyQt6') for m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True,
+                         text=True, check=True)
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from dijkstra_dashboard.ui.graph_view import GraphView  # noqa: E402
+
+
+def test_graph_view_runs_a_background_layout(qtbot):
+    view = GraphView()
+    qtbot.addWidget(view)
+    before = {node.id: (node.x, node.y) for node in view.get_graph().nodes()}
+
+    with qtbot.waitSignal(view.layout_finished, timeout=10_000):
+        job = view.run_layout("spring", iterations=20, width=600.0, height=400.0)
+    assert job.result is not None
+    assert not view.is_layout_running()
+
+    after = {node.id: (node.x, node.y) for node in view.get_graph().nodes()}
+    assert set(after) == set(before) and after != before
+    for node_id, item in view.nodes.items():
+        assert (item.pos().x(), item.pos().y()) == pytest.approx(after[node_id])
+
+
+def test_graph_view_cancels_a_layout_on_new_graph(qtbot):
+    view = GraphView()
+    qtbot.addWidget(view)
+    job = view.run_layout("spring", iterations=10_000)
+    view.set_graph(view.get_graph())
+    assert job.wait(10)
+    assert job.cancelled and not view.is_layout_running()
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Cumulative microseconds allowed for ``import dijkstra_dashboard.core``. The
+# package itself takes ~1ms; the slack absorbs slow CI machines.
+IMPORT_BUDGET_US = 25_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    return subprocess.run([sys.executable, *flags, "-c", code], env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def _loaded(code: str) -> set[str]:
+    out = _run(code + "\nimport sys\nprint('\\n'.join(sorted(sys.modules)))")
+    return set(out.stdout.split())
+
+
+def test_import_core_loads_no_submodules():
+    loaded = _loaded("import dijkstra_dashboard.core")
+    assert not {name for name in loaded if name.startswith("dijkstra_dashboard.core.")}
+    assert not {name for name in loaded if name.startswith("PyQt6")}
+
+
+def test_graph_import_skips_validation_and_engines():
+    loaded = _loaded("from dijkstra_dashboard.core import Graph")
+    assert "dijkstra_dashboard.core.graph" in loaded
+    assert "dijkstra_dashboard.core.validation" not in loaded
+    assert "dijkstra_dashboard.core.serialization" not in loaded
+    assert not {name for name in loaded if name.startswith("dijkstra_dashboard.core.algorithms")}
+
+
+def test_engine_lookup_does_not_scan_entry_points():
+    loaded = _loaded(
+        "from dijkstra_dashboard.core.algorithms.registry import get_algorithm\n"
+        "get_algorithm('dijkstra')"
+    )
+    baseline = _loaded("pass")
+    assert "dijkstra_dashboard.core.algorithms.dijkstra" in loaded
+    assert "importlib.metadata" not in loaded - baseline
+
+
+def test_import_core_within_budget():
+    # Best of a few runs to smooth out scheduler noise.
+    timings = []
+    for _ in range(5):
+        out = _run("import dijkstra_dashboard.core", "-X", "importtime")
+        for line in out.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "dijkstra_dashboard.core":
+                timings.append(int(parts[1]))
+    assert timings
+    assert min(timings) < IMPORT_BUDGET_US
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from PyQt6.QtWidgets import QMessageBox  # noqa: E402
+
+from dijkstra_dashboard.core.graph import Graph  # noqa: E402
+from dijkstra_dashboard.ui.main_window import MainWindow  # noqa: E402
+
+
+def _graph(*names):
+    graph = Graph()
+    for index, name in enumerate(names):
+        graph.add_node(name, x=index * 10.0, y=0.0)
+    return graph
+
+
+def test_reload_asks_before_discarding_unsaved_edits(qtbot, monkeypatch):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.graph_path = "graph.json"
+    asked = []
+
+    def answer(reply):
+        def question(*args, **kwargs):
+            asked.append(args)
+            return reply
+        monkeypatch.setattr(QMessageBox, "question", question)
+
+    answer(QMessageBox.StandardButton.No)
+    original = _graph("A", "B")
+    window._show_graph(original)
+    window.on_graph_file_reloaded(_graph("A", "B", "C"))
+    assert not asked
+    assert "C" in window.graph_view.get_graph().get_nodes()
+
+    edited = window.graph_view.get_graph()
+    edited.set_node_position("A", 50.0, 50.0)
+    assert window.has_unsaved_changes()
+    window.on_graph_file_reloaded(_graph("X"))
+    assert len(asked) == 1
+    assert window.graph_view.get_graph() is edited
+
+    answer(QMessageBox.StandardButton.Yes)
+    window.on_graph_file_reloaded(_graph("X"))
+    assert len(asked) == 2
+    assert "X" in window.graph_view.get_graph().get_nodes()
+    assert not window.has_unsaved_changes()
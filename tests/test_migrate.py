@@ -0,0 +1,41 @@
+import json
+
+from dijkstra_dashboard.core.binary import is_binary_graph
+from dijkstra_dashboard.core.serialization import graph_to_dict, load_graph_file
+from dijkstra_dashboard.migrate import main
+
+
+def test_migrate_between_formats(tmp_path, sample_graph):
+    source = tmp_path / "graph.json"
+    source.write_text(json.dumps(graph_to_dict(sample_graph), indent=2), encoding="utf-8")
+    columnar = tmp_path / "graph.v2.json"
+    binary = tmp_path / "graph.djg"
+
+    assert main([str(source), str(columnar)]) == 0
+    assert json.loads(columnar.read_text(encoding="utf-8"))["version"] == 2
+    assert columnar.stat().st_size < source.stat().st_size
+
+    assert main([str(columnar), str(binary), "--to", "binary"]) == 0
+    assert is_binary_graph(binary)
+    assert set(load_graph_file(binary).get_edges()) == set(sample_graph.get_edges())
+
+
+def test_migrate_reports_invalid_input(tmp_path, capsys):
+    source = tmp_path / "bad.json"
+    source.write_text('{"version": 7, "directed": false, "nodes": {}, "edges": []}',
+                      encoding="utf-8")
+    assert main([str(source), str(tmp_path / "out.json")]) == 1
+    assert "Unsupported graph version: 7" in capsys.readouterr().err
+
+
+def test_migrate_leaves_no_partial_output(tmp_path, sample_graph, monkeypatch, capsys):
+    source = tmp_path / "graph.json"
+    source.write_text(json.dumps(graph_to_dict(sample_graph)), encoding="utf-8")
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("dijkstra_dashboard.core.fileio.os.fsync", fail)
+    assert main([str(source), str(tmp_path / "out.json")]) == 1
+    assert "disk full" in capsys.readouterr().err
+    assert [p.name for p in tmp_path.iterdir()] == ["graph.json"]
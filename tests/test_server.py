@@ -0,0 +1,115 @@
+import asyncio
+import json
+import logging
+
+from dijkstra_dashboard import server as server_module
+from dijkstra_dashboard.server import QueryService, start_server
+
+
+async def _request(reader, writer, method, target, body=None):
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nHost: test\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode("latin-1") + payload
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.decode("latin-1").split("\r\n"):
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+def test_server_keep_alive_route_batch_and_errors(sample_graph):
+    async def scenario():
+        service = QueryService(sample_graph.freeze(), cache_size=8)
+        server = await start_server(service, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            status, body = await _request(reader, writer, "GET", "/route?start=A&target=F")
+            assert status == 200
+            assert body["path"] == ["A", "C", "B", "F"]
+
+            status, body = await _request(reader, writer, "POST", "/isochrone",
+                                          [{"start": "A", "max_distance": 3},
+                                           {"start": "missing", "max_distance": 3}])
+            assert status == 200
+            assert body[0]["nodes"] == {"A": 0.0, "C": 3.0}
+            assert "error" in body[1]
+
+            status, body = await _request(reader, writer, "GET", "/route?start=A")
+            assert status == 400
+
+            status, _ = await _request(reader, writer, "GET", "/nowhere")
+            assert status == 404
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            service.close()
+
+    asyncio.run(scenario())
+
+
+def test_query_service_caches_results(sample_graph):
+    async def scenario():
+        service = QueryService(sample_graph.freeze(), cache_size=8)
+        try:
+            first = await service.query("route", {"start": "A", "target": "F"})
+            second = await service.query("route", {"target": "F", "start": "A"})
+        finally:
+            service.close()
+        assert first == second
+        assert service.cache.hits == 1
+
+    asyncio.run(scenario())
+
+
+def test_query_service_swap_invalidates_cached_results(sample_graph):
+    async def scenario():
+        service = QueryService(sample_graph.freeze(), cache_size=8)
+        try:
+            before = await service.query("route", {"start": "A", "target": "F"})
+            sample_graph.update_edge('A', 'C', 10)
+            service.swap(sample_graph.freeze())
+            after = await service.query("route", {"start": "A", "target": "F"})
+        finally:
+            service.close()
+        assert before["distance"] == 6
+        assert after["distance"] == 7
+
+    asyncio.run(scenario())
+
+
+def test_server_reports_unexpected_engine_errors(sample_graph, monkeypatch, caplog):
+    def broken(graph, kind, params):
+        raise KeyError("boom")
+
+    monkeypatch.setattr(server_module, "run_query", broken)
+
+    async def scenario():
+        service = QueryService(sample_graph.freeze(), cache_size=8)
+        server = await start_server(service, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            status, body = await _request(reader, writer, "GET", "/route?start=A&target=F")
+            assert status == 500
+            assert body == {"error": server_module.INTERNAL_ERROR}
+            # The connection stays usable and the failure is not cached.
+            status, body = await _request(reader, writer, "POST", "/route",
+                                          [{"start": "A", "target": "F"}])
+            assert status == 200 and body == [{"error": server_module.INTERNAL_ERROR}]
+            assert len(service.cache) == 0
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            service.close()
+
+    with caplog.at_level(logging.ERROR, logger="dijkstra_dashboard.server"):
+        asyncio.run(scenario())
+    assert "KeyError" in caplog.text